@@ -5,11 +5,12 @@ Handles sending notifications when budget alerts are triggered.
 """
 
 import logging
+from contextlib import contextmanager
 from typing import List
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
+from django.core.mail import get_connection, send_mail
 from django.template.loader import render_to_string
 from django.utils import timezone
 
@@ -23,12 +24,13 @@ class BudgetNotificationService:
     """Service for sending budget alert notifications."""
 
     @staticmethod
-    def send_alert_notification(alert: BudgetAlert) -> bool:
+    def send_alert_notification(alert: BudgetAlert, connection=None) -> bool:
         """
         Send a notification for a budget alert.
 
         Args:
             alert: The BudgetAlert instance to send notification for
+            connection: Optional open email connection to send through
 
         Returns:
             bool: True if notification was sent successfully, False otherwise
@@ -69,6 +71,7 @@ class BudgetNotificationService:
                 from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[user.email],
                 fail_silently=False,
+                connection=connection,
             )
 
             logger.info(
@@ -113,12 +116,13 @@ Personal Finance Dashboard
         return message
 
     @staticmethod
-    def send_daily_budget_summary(user: User) -> bool:
+    def send_daily_budget_summary(user: User, connection=None) -> bool:
         """
         Send a daily summary of budget alerts for a user.
 
         Args:
             user: The User to send summary for
+            connection: Optional open email connection to send through
 
         Returns:
             bool: True if summary was sent successfully, False otherwise
@@ -166,6 +170,7 @@ Personal Finance Dashboard
                 from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[user.email],
                 fail_silently=False,
+                connection=connection,
             )
 
             logger.info(f"Daily budget summary sent to {user.email}")
@@ -209,6 +214,30 @@ Personal Finance Dashboard
 
         return "\n".join(message_lines)
 
+    @staticmethod
+    @contextmanager
+    def open_email_connection():
+        """
+        Open one email connection to share across a batch of sends.
+
+        Sending through a shared connection reuses a single SMTP session
+        instead of connecting once per email. If it cannot be opened, each
+        send retries on its own and reports its own failure.
+
+        Yields:
+            Email backend connection
+        """
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as e:
+            logger.error(f"Failed to open email connection: {e}")
+
+        try:
+            yield connection
+        finally:
+            connection.close()
+
     @staticmethod
     def send_budget_notifications_batch(alerts: List[BudgetAlert]) -> int:
         """
@@ -222,9 +251,12 @@ Personal Finance Dashboard
         """
         sent_count = 0
 
-        for alert in alerts:
-            if BudgetNotificationService.send_alert_notification(alert):
-                sent_count += 1
+        with BudgetNotificationService.open_email_connection() as connection:
+            for alert in alerts:
+                if BudgetNotificationService.send_alert_notification(
+                    alert, connection=connection
+                ):
+                    sent_count += 1
 
         logger.info(f"Sent {sent_count} of {len(alerts)} budget alert notifications")
         return sent_count
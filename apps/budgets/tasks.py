@@ -110,13 +110,16 @@ def send_daily_budget_summaries(self) -> dict:
             f"Sending daily summaries to {total_users} users with active alerts"
         )
 
-        for user in users_with_alerts:
-            try:
-                if BudgetNotificationService.send_daily_budget_summary(user):
-                    summaries_sent += 1
-            except Exception as e:
-                logger.error(f"Error sending daily summary to user {user.id}: {e}")
-                continue
+        with BudgetNotificationService.open_email_connection() as connection:
+            for user in users_with_alerts:
+                try:
+                    if BudgetNotificationService.send_daily_budget_summary(
+                        user, connection=connection
+                    ):
+                        summaries_sent += 1
+                except Exception as e:
+                    logger.error(f"Error sending daily summary to user {user.id}: {e}")
+                    continue
 
         summary = {
             "total_users_with_alerts": total_users,
@@ -0,0 +1,216 @@
+"""
+Transaction import from CSV and Excel files.
+
+Shared by the import API action, which imports small files inline, and the
+Celery task that imports larger files off the request thread.
+"""
+
+import csv
+import io
+import os
+import uuid
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+import openpyxl
+
+from django.core.files.storage import default_storage
+from django.db import transaction as db_transaction
+
+from apps.expenses.models import Category, Transaction
+from apps.expenses.serializers import BULK_CREATE_BATCH_SIZE, TransactionSerializer
+from apps.expenses.utils import invalidate_transaction_statistics
+
+# Uploads larger than this many bytes are imported by a Celery task
+IMPORT_ASYNC_THRESHOLD = 1024 * 1024
+
+# Rows validated between progress reports of a queued import
+IMPORT_PROGRESS_INTERVAL = 1000
+
+# Storage directory holding uploads until their queued import has run
+IMPORT_UPLOAD_DIR = "imports"
+
+# Seconds a queued import's owner is remembered for status polling
+IMPORT_OWNER_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Row errors kept in a queued import's result; the full count is reported
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+
+def read_import_rows(uploaded_file):
+    """
+    Yield the rows of an uploaded CSV or Excel file as dictionaries.
+
+    Both formats are read incrementally; the file is released once the
+    generator is exhausted or closed.
+
+    Args:
+        uploaded_file: Uploaded .csv, .xlsx or .xls file
+
+    Yields:
+        dict: Row values keyed by the file's header row
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    file_name = uploaded_file.name.lower()
+
+    if file_name.endswith(".csv"):
+        # Decode as rows are read instead of holding the whole file and a
+        # decoded copy in memory
+        text_stream = io.TextIOWrapper(uploaded_file.file, encoding="utf-8", newline="")
+        try:
+            yield from csv.DictReader(text_stream)
+        finally:
+            # Leave the upload open for Django to clean up
+            text_stream.detach()
+
+    elif file_name.endswith((".xlsx", ".xls")):
+        # read_only streams the sheet instead of loading every cell
+        workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+
+            # Get headers from first row
+            headers = next(rows, ())
+
+            for row in rows:
+                yield dict(zip(headers, row))
+        finally:
+            workbook.close()
+
+    else:
+        raise ValueError("Only CSV and Excel files are supported.")
+
+
+def store_import_upload(uploaded_file, user_id):
+    """
+    Save an upload so a queued import can read it after the request ends.
+
+    Args:
+        uploaded_file: Uploaded .csv, .xlsx or .xls file
+        user_id (int): ID of the importing user
+
+    Returns:
+        str: Storage path to hand to the import task
+    """
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    return default_storage.save(
+        f"{IMPORT_UPLOAD_DIR}/{user_id}/{uuid.uuid4().hex}{extension}",
+        uploaded_file,
+    )
+
+
+def get_import_owner_cache_key(task_id):
+    """
+    Get the cache key recording which user queued an import task.
+
+    Args:
+        task_id (str): Celery task ID of the import
+
+    Returns:
+        str: Cache key
+    """
+    return f"import_owner:{task_id}"
+
+
+def import_transaction_rows(rows, user, context, progress=None):
+    """
+    Validate import rows and insert the valid ones in bulk.
+
+    Args:
+        rows: Iterable of row dictionaries
+        user (User): User the transactions are imported for
+        context (dict): Serializer context providing the request
+        progress (callable): Optional callback given the number of rows
+            validated so far, every IMPORT_PROGRESS_INTERVAL rows
+
+    Returns:
+        tuple: Number of imported transactions and a list of row errors
+    """
+    errors = []
+
+    # Resolve category names from one query instead of one per row.
+    # Names are only unique per parent, so keep every match.
+    categories = Category.objects.filter(user=user, is_active=True).in_bulk()
+    category_ids_by_name = {}
+    for category in categories.values():
+        category_ids_by_name.setdefault(category.name, []).append(category.id)
+
+    new_transactions = []
+
+    for row_number, row in enumerate(rows, start=2):
+        if progress and (row_number - 2) % IMPORT_PROGRESS_INTERVAL == 0:
+            progress(row_number - 2)
+
+        try:
+            # Clean and prepare data
+            transaction_data = {}
+
+            # Required fields
+            if row.get("date"):
+                if isinstance(row["date"], str):
+                    transaction_data["date"] = date.fromisoformat(row["date"])
+                elif isinstance(row["date"], datetime):
+                    # Excel date cells are read as datetimes
+                    transaction_data["date"] = row["date"].date()
+                else:
+                    transaction_data["date"] = row["date"]
+
+            if row.get("amount"):
+                try:
+                    transaction_data["amount"] = Decimal(str(row["amount"]))
+                except (InvalidOperation, ValueError):
+                    raise ValueError(f"Invalid amount: {row['amount']}")
+
+            transaction_data["description"] = row.get("description", "")
+            transaction_data["transaction_type"] = row.get(
+                "transaction_type", "expense"
+            )
+            transaction_data["merchant"] = row.get("merchant", "")
+            transaction_data["notes"] = row.get("notes", "")
+
+            # Handle category by name
+            category_name = row.get("category_name", "").strip()
+            if category_name and transaction_data["transaction_type"] == "expense":
+                category_ids = category_ids_by_name.get(category_name)
+                if not category_ids:
+                    raise ValueError(f"Category '{category_name}' not found")
+                if len(category_ids) > 1:
+                    raise ValueError(f"Category '{category_name}' is ambiguous")
+                transaction_data["category_id"] = category_ids[0]
+
+            # Validate using serializer
+            transaction_serializer = TransactionSerializer(
+                data=transaction_data, context=context
+            )
+            transaction_serializer.fields["category_id"].prefetched = categories
+            transaction_serializer.is_valid(raise_exception=True)
+
+            # Validate now so the row's errors are reported, but defer the
+            # INSERT to one bulk statement for the whole file
+            transaction = Transaction(
+                user=user, **transaction_serializer.validated_data
+            )
+            transaction.prepare_for_save(exclude=["user", "category"])
+            new_transactions.append(transaction)
+
+        except Exception as e:
+            errors.append(
+                {
+                    "row": row_number,
+                    "error": str(e),
+                    "data": dict(row) if hasattr(row, "items") else row,
+                }
+            )
+
+    if new_transactions:
+        with db_transaction.atomic():
+            Transaction.objects.bulk_create(
+                new_transactions, batch_size=BULK_CREATE_BATCH_SIZE
+            )
+
+        # bulk_create() sends no post_save signals
+        invalidate_transaction_statistics(user.id)
+
+    return len(new_transactions), errors
@@ -7,6 +7,7 @@ This command provides various file cleanup operations:
 - Remove all files for a specific user
 """
 
+import copy
 import logging
 
 from django.core.management.base import BaseCommand, CommandError
@@ -64,8 +65,10 @@ class Command(BaseCommand):
         # Get appropriate storage backend
         storage = get_storage_backend()
 
-        # Update batch size if provided
+        # Update batch size if provided, on a copy so the shared backend
+        # keeps its configured batch size
         if options["batch_size"]:
+            storage = copy.copy(storage)
             storage.cleanup_batch_size = options["batch_size"]
 
         try:
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("expenses", "0009_alter_transaction_merchant"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_recurring", True)),
+                fields=["next_occurrence"],
+                name="idx_txn_due_recurring",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_recurring", True)),
+                fields=["recurring_end_date"],
+                name="idx_txn_expired_recurring",
+            ),
+        ),
+    ]
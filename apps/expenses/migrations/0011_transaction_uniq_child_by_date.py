@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:52
+
+from django.db import migrations, models
+
+
+def deactivate_duplicate_children(apps, schema_editor):
+    """Soft-delete all but the oldest active child per series and date."""
+    Transaction = apps.get_model("expenses", "Transaction")
+
+    duplicates = (
+        Transaction.objects.filter(parent_transaction__isnull=False, is_active=True)
+        .values("parent_transaction", "date")
+        .annotate(count=models.Count("id"), keep_id=models.Min("id"))
+        .filter(count__gt=1)
+    )
+
+    for duplicate in duplicates:
+        Transaction.objects.filter(
+            parent_transaction=duplicate["parent_transaction"],
+            date=duplicate["date"],
+            is_active=True,
+        ).exclude(id=duplicate["keep_id"]).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("expenses", "0010_transaction_idx_txn_due_recurring_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(deactivate_duplicate_children, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="transaction",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_active", True)),
+                fields=("parent_transaction", "date"),
+                name="uniq_child_by_date",
+            ),
+        ),
+    ]
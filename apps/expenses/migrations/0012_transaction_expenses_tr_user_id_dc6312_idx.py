@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("expenses", "0011_transaction_uniq_child_by_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "receipt", "is_active"],
+                name="expenses_tr_user_id_dc6312_idx",
+            ),
+        ),
+    ]
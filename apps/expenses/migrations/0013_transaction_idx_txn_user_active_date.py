@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("expenses", "0012_transaction_expenses_tr_user_id_dc6312_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "is_active", "-date", "-created_at"],
+                name="idx_txn_user_active_date",
+            ),
+        ),
+    ]
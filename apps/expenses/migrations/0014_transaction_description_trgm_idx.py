@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:20
+
+from django.db import migrations
+
+# Django compiles icontains on PostgreSQL to UPPER(col::text) LIKE UPPER(%s),
+# so the trigram index is built on that expression
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_txn_description_trgm
+ON expenses_transaction
+USING gin (UPPER(description::text) gin_trgm_ops)
+"""
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS idx_txn_description_trgm"
+
+
+def create_description_trigram_index(apps, schema_editor):
+    """Index descriptions for substring search; PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_description_trigram_index(apps, schema_editor):
+    """Drop the description trigram index."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("expenses", "0013_transaction_idx_txn_user_active_date"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_description_trigram_index, drop_description_trigram_index
+        ),
+    ]
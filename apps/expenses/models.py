@@ -1,7 +1,9 @@
 import re
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal, InvalidOperation
 
+from dateutil.relativedelta import relativedelta
+
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -187,6 +189,26 @@ def upload_receipt_to(instance, filename):
     return f"receipts/{instance.user.id}/{filename}"
 
 
+class TransactionManager(models.Manager):
+    """Custom manager for Transaction model."""
+
+    def recurring_due(self, as_of):
+        """
+        Get active recurring transactions due on or before a date.
+
+        Args:
+            as_of: Date the next occurrence must not be later than
+
+        Returns:
+            QuerySet: Recurring transactions due for generation
+        """
+        return self.filter(
+            is_recurring=True,
+            is_active=True,
+            next_occurrence__lte=as_of,
+        )
+
+
 class Transaction(models.Model):
     """
     Transaction model for tracking financial transactions.
@@ -220,6 +242,14 @@ class Transaction(models.Model):
         (YEARLY, "Yearly"),
     ]
 
+    # Offset between occurrences for each frequency, given the interval
+    RECURRENCE_OFFSETS = {
+        DAILY: lambda interval: timedelta(days=interval),
+        WEEKLY: lambda interval: timedelta(weeks=interval),
+        MONTHLY: lambda interval: relativedelta(months=interval),
+        YEARLY: lambda interval: relativedelta(years=interval),
+    }
+
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -347,6 +377,8 @@ class Transaction(models.Model):
         help_text="When this transaction was last updated",
     )
 
+    objects = TransactionManager()
+
     class Meta:
         db_table = "expenses_transaction"
         verbose_name = "Transaction"
@@ -354,6 +386,12 @@ class Transaction(models.Model):
         ordering = ["-date", "-created_at"]  # Newest first
         indexes = [
             models.Index(fields=["user", "is_active"]),
+            # Matches the list endpoint's filter and default ordering, so
+            # pages are read in index order without a sort
+            models.Index(
+                fields=["user", "is_active", "-date", "-created_at"],
+                name="idx_txn_user_active_date",
+            ),
             models.Index(fields=["user", "transaction_type", "is_active"]),
             models.Index(fields=["user", "date"]),
             models.Index(fields=["user", "category", "is_active"]),
@@ -363,6 +401,28 @@ class Transaction(models.Model):
             models.Index(fields=["is_recurring", "next_occurrence"]),
             models.Index(fields=["user", "is_recurring"]),
             models.Index(fields=["parent_transaction"]),
+            models.Index(
+                fields=["user", "receipt", "is_active"]
+            ),  # For receipt ownership checks
+            # Partial indexes for the recurring transaction tasks
+            models.Index(
+                fields=["next_occurrence"],
+                condition=models.Q(is_recurring=True, is_active=True),
+                name="idx_txn_due_recurring",
+            ),
+            models.Index(
+                fields=["recurring_end_date"],
+                condition=models.Q(is_recurring=True, is_active=True),
+                name="idx_txn_expired_recurring",
+            ),
+        ]
+        constraints = [
+            # At most one active generated occurrence per series and date
+            models.UniqueConstraint(
+                fields=["parent_transaction", "date"],
+                condition=models.Q(is_active=True),
+                name="uniq_child_by_date",
+            ),
         ]
 
     def __str__(self):
@@ -402,7 +462,7 @@ class Transaction(models.Model):
         # Validate category assignment
         if self.category and self.user:
             # Ensure category belongs to same user
-            if self.category.user != self.user:
+            if self.category.user_id != self.user_id:
                 raise ValidationError("Category must belong to the same user.")
 
         # Validate expense transactions require a category
@@ -428,9 +488,16 @@ class Transaction(models.Model):
             ):
                 raise ValidationError("Recurring end date must be after start date.")
 
-    def save(self, *args, **kwargs):
-        """Save the transaction with validation."""
-        self.full_clean()
+    def prepare_for_save(self, exclude=None):
+        """
+        Validate the transaction and fill in its derived fields.
+
+        save() calls this; bulk inserts, which bypass save(), call it directly.
+
+        Args:
+            exclude: Field names whose validation the caller already did
+        """
+        self.full_clean(exclude=exclude)
 
         # Sync amount_index with encrypted amount
         if self.amount is not None:
@@ -444,6 +511,9 @@ class Transaction(models.Model):
         if not self.is_recurring:
             self.next_occurrence = None
 
+    def save(self, *args, **kwargs):
+        """Save the transaction with validation."""
+        self.prepare_for_save()
         super().save(*args, **kwargs)
 
     def calculate_next_occurrence(self):
@@ -451,40 +521,28 @@ class Transaction(models.Model):
         if not self.is_recurring or not self.recurring_start_date:
             return None
 
-        from datetime import timedelta
-
-        from dateutil.relativedelta import relativedelta
-
-        base_date = self.recurring_start_date
-        interval = self.recurring_interval or 1
-
-        if self.recurring_frequency == self.DAILY:
-            next_date = base_date + timedelta(days=interval)
-        elif self.recurring_frequency == self.WEEKLY:
-            next_date = base_date + timedelta(weeks=interval)
-        elif self.recurring_frequency == self.MONTHLY:
-            next_date = base_date + relativedelta(months=interval)
-        elif self.recurring_frequency == self.YEARLY:
-            next_date = base_date + relativedelta(years=interval)
-        else:
+        offset = self.RECURRENCE_OFFSETS.get(self.recurring_frequency)
+        if offset is None:
             return None
 
+        next_date = self.recurring_start_date + offset(self.recurring_interval or 1)
+
         # Handle end date
         if self.recurring_end_date and next_date > self.recurring_end_date:
             return None
 
         return next_date
 
-    def generate_next_transaction(self):
-        """Generate the next transaction in the recurring series."""
+    def build_next_transaction(self):
+        """
+        Build, without saving, the next transaction in the recurring series.
+
+        Returns:
+            Transaction: Unsaved child transaction, or None if not recurring
+        """
         if not self.is_recurring or not self.next_occurrence:
             return None
 
-        from datetime import timedelta
-
-        from dateutil.relativedelta import relativedelta
-
-        # Create new transaction based on this one
         new_transaction = Transaction(
             user=self.user,
             transaction_type=self.transaction_type,
@@ -503,32 +561,35 @@ class Transaction(models.Model):
         if self.receipt:
             new_transaction.receipt = self.receipt
 
+        return new_transaction
+
+    def following_occurrence(self):
+        """Return the occurrence after next_occurrence, or None past the end."""
+        offset = self.RECURRENCE_OFFSETS.get(self.recurring_frequency)
+
+        if offset is None or not self.next_occurrence:
+            return None
+
+        next_date = self.next_occurrence + offset(self.recurring_interval or 1)
+
+        # Check if we've reached the end date
+        if self.recurring_end_date and next_date > self.recurring_end_date:
+            return None
+
+        return next_date
+
+    def generate_next_transaction(self):
+        """Generate the next transaction in the recurring series."""
+        new_transaction = self.build_next_transaction()
+
+        if new_transaction is None:
+            return None
+
         # Save the new transaction
         new_transaction.save()
 
         # Update next occurrence for this recurring transaction
-        interval = self.recurring_interval or 1
-
-        if self.recurring_frequency == self.DAILY:
-            next_date = self.next_occurrence + timedelta(days=interval)
-        elif self.recurring_frequency == self.WEEKLY:
-            next_date = self.next_occurrence + timedelta(weeks=interval)
-        elif self.recurring_frequency == self.MONTHLY:
-            next_date = self.next_occurrence + relativedelta(months=interval)
-        elif self.recurring_frequency == self.YEARLY:
-            next_date = self.next_occurrence + relativedelta(years=interval)
-        else:
-            next_date = None
-
-        # Check if we've reached the end date
-        if (
-            self.recurring_end_date
-            and next_date
-            and next_date > self.recurring_end_date
-        ):
-            self.next_occurrence = None
-        else:
-            self.next_occurrence = next_date
+        self.next_occurrence = self.following_occurrence()
 
         # Save updated next occurrence (use update to avoid triggering save logic)
         Transaction.objects.filter(id=self.id).update(
@@ -537,8 +598,13 @@ class Transaction(models.Model):
 
         return new_transaction
 
+    @classmethod
+    def stop_recurring_updates(cls):
+        """Return the field values that stop a recurring transaction."""
+        return {"is_recurring": False, "next_occurrence": None}
+
     def stop_recurring(self):
         """Stop this recurring transaction."""
-        self.is_recurring = False
-        self.next_occurrence = None
+        for field, value in self.stop_recurring_updates().items():
+            setattr(self, field, value)
         self.save()
@@ -3,11 +3,15 @@ from datetime import date
 from rest_framework import serializers
 
 from django.contrib.auth import get_user_model
+from django.db import transaction as db_transaction
 
 from .models import Category, Transaction
 
 User = get_user_model()
 
+# Rows per INSERT statement when creating transactions in bulk
+BULK_CREATE_BATCH_SIZE = 500
+
 
 class CategorySerializer(serializers.ModelSerializer):
     """Serializer for Category model."""
@@ -35,11 +39,75 @@ class CategorySerializer(serializers.ModelSerializer):
         return value
 
 
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key field that can be primed with objects fetched in bulk."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prefetched = None
+
+    def to_internal_value(self, data):
+        """Return a prefetched object when available, else query for it."""
+        if self.prefetched is not None and not isinstance(data, bool):
+            try:
+                return self.prefetched[int(data)]
+            except (KeyError, TypeError, ValueError):
+                pass
+        return super().to_internal_value(data)
+
+
+def _prefetch_categories(category_field, items):
+    """
+    Prime a category field with every category referenced by a payload.
+
+    Args:
+        category_field (PrefetchedPrimaryKeyRelatedField): Field to prime
+        items (list): Raw item dictionaries carrying a category_id
+    """
+    category_ids = set()
+    for item in items:
+        try:
+            category_ids.add(int(item["category_id"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    category_field.prefetched = category_field.get_queryset().in_bulk(category_ids)
+
+
+class TransactionListSerializer(serializers.ListSerializer):
+    """List serializer that inserts many transactions in one statement."""
+
+    def to_internal_value(self, data):
+        """Validate all items, resolving their categories in one query."""
+        category_field = self.child.fields["category_id"]
+        if isinstance(data, list):
+            _prefetch_categories(category_field, data)
+
+        try:
+            return super().to_internal_value(data)
+        finally:
+            category_field.prefetched = None
+
+    def create(self, validated_data):
+        """Create all transactions for the current user in bulk."""
+        user = self.context["request"].user
+        transactions = [Transaction(user=user, **item) for item in validated_data]
+
+        # The serializer already resolved user and category against the
+        # requesting user, so only the remaining model validation runs
+        for transaction in transactions:
+            transaction.prepare_for_save(exclude=["user", "category"])
+
+        with db_transaction.atomic():
+            return Transaction.objects.bulk_create(
+                transactions, batch_size=BULK_CREATE_BATCH_SIZE
+            )
+
+
 class TransactionSerializer(serializers.ModelSerializer):
     """Serializer for Transaction model."""
 
     category = CategorySerializer(read_only=True)
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = PrefetchedPrimaryKeyRelatedField(
         queryset=Category.objects.none(),
         source="category",
         write_only=True,
@@ -79,6 +147,7 @@ class TransactionSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        list_serializer_class = TransactionListSerializer
 
     def __init__(self, *args, **kwargs):
         """Initialize serializer with user-specific querysets."""
@@ -285,7 +354,7 @@ class TransactionBulkUpdateItemSerializer(serializers.Serializer):
         choices=Transaction.TRANSACTION_TYPE_CHOICES, required=False
     )
     amount = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = PrefetchedPrimaryKeyRelatedField(
         queryset=Category.objects.none(), required=False, allow_null=True
     )
     description = serializers.CharField(max_length=255, required=False)
@@ -339,6 +408,18 @@ class TransactionBulkUpdateSerializer(serializers.Serializer):
                 context=self.context
             )
 
+    def to_internal_value(self, data):
+        """Validate all updates, resolving their categories in one query."""
+        category_field = self.fields["updates"].child.fields["category_id"]
+        updates = data.get("updates") if hasattr(data, "get") else None
+        if isinstance(updates, list):
+            _prefetch_categories(category_field, updates)
+
+        try:
+            return super().to_internal_value(data)
+        finally:
+            category_field.prefetched = None
+
 
 class TransactionBulkDeleteSerializer(serializers.Serializer):
     """Serializer for bulk deleting transactions."""
@@ -3,10 +3,15 @@ Signals for the expenses app.
 """
 
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Category
+from .models import Category, Transaction
+from .utils import (
+    invalidate_transaction_statistics,
+    invalidate_user_categories,
+    invalidate_user_storage_usage,
+)
 
 User = get_user_model()
 
@@ -22,3 +27,21 @@ def create_default_categories_for_new_user(sender, instance, created, **kwargs):
     if created:
         # Create default categories for the new user
         Category.create_default_categories(instance)
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+def invalidate_statistics_for_transaction(sender, instance, **kwargs):
+    """Drop the owner's cached transaction statistics when a transaction changes."""
+    invalidate_transaction_statistics(instance.user_id)
+
+    # A saved receipt may be a newly uploaded file
+    if instance.receipt:
+        invalidate_user_storage_usage(instance.user_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories_for_category(sender, instance, **kwargs):
+    """Drop the owner's cached category list when a category changes."""
+    invalidate_user_categories(instance.user_id)
@@ -6,17 +6,26 @@ and production (S3 with KMS encryption), with pre-signed URL generation
 and file cleanup policies.
 """
 
+import functools
 import logging
 import os
+import queue
 import re
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.parse import urlencode
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.files.storage import FileSystemStorage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.deconstruct import deconstructible
 
 from apps.core.security.validators import validate_receipt_file
@@ -29,6 +38,132 @@ try:
 except ImportError:
     boto3 = None
 
+SECONDS_PER_DAY = 86400
+
+# Recently uploaded files are never treated as orphans
+ORPHAN_GRACE_PERIOD_SECONDS = SECONDS_PER_DAY
+
+# Objects larger than this are re-encrypted with a ranged multipart copy
+MULTIPART_COPY_THRESHOLD = 100 * 1024 * 1024
+MULTIPART_COPY_PART_SIZE = 100 * 1024 * 1024
+# Shared by all multipart copies of a backend, not per object
+MULTIPART_COPY_WORKERS = 8
+
+# Object attributes a multipart copy must set again to match the source
+ROTATION_PRESERVED_ATTRIBUTES = (
+    "CacheControl",
+    "ContentDisposition",
+    "ContentEncoding",
+    "ContentLanguage",
+    "ContentType",
+    "Expires",
+    "StorageClass",
+)
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+S3_DELETE_BATCH_SIZE = 1000
+S3_DELETE_QUEUE_SIZE = 10000
+S3_DELETE_WORKERS = 4
+
+# Lifecycle rule expiring objects tagged for deferred deletion; one rule
+# serves every user, so the bucket's 1000-rule limit is never approached
+PENDING_DELETION_RULE_ID = "pending-deletion"
+PENDING_DELETION_TAG = {"Key": "pending-deletion", "Value": "true"}
+
+# Maximum number of head_object results cached per S3 storage instance
+FILE_INFO_CACHE_SIZE = 10000
+
+# Seconds a cached head_object result is trusted; other workers may change
+# or delete the object, and only this process's own writes invalidate it
+FILE_INFO_CACHE_TTL = 60
+
+# HTTP connections kept open by the shared S3 client; covers concurrent web
+# requests plus the multipart copy and batch delete worker pools
+S3_MAX_POOL_CONNECTIONS = 50
+S3_MAX_ATTEMPTS = 3
+
+
+class S3BatchDeleter:
+    """
+    Delete S3 objects in the background while the caller keeps listing.
+
+    The listing loop enqueues keys with submit(); worker threads drain the
+    queue into DeleteObjects batches of up to S3_DELETE_BATCH_SIZE keys, so
+    LIST pagination latency overlaps with DELETE latency. Use as a context
+    manager: leaving the block flushes remaining keys and waits for workers.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name,
+        workers=S3_DELETE_WORKERS,
+        batch_size=S3_DELETE_BATCH_SIZE,
+    ):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.workers = workers
+        self.batch_size = batch_size
+        self.deleted_count = 0
+        self.error_count = 0
+        self._queue = queue.Queue(maxsize=S3_DELETE_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        for _ in range(self.workers):
+            self._executor.submit(self._consume)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # One sentinel per worker terminates each consumer loop
+        for _ in range(self.workers):
+            self._queue.put(None)
+        self._executor.shutdown(wait=True)
+        return False
+
+    def submit(self, file_key):
+        """Queue a key for deletion, blocking if the queue is full."""
+        self._queue.put(file_key)
+
+    def _consume(self):
+        batch = []
+        while True:
+            file_key = self._queue.get()
+            if file_key is None:
+                break
+            batch.append(file_key)
+            if len(batch) >= self.batch_size:
+                self._delete_batch(batch)
+                batch = []
+        if batch:
+            self._delete_batch(batch)
+
+    def _delete_batch(self, keys):
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        except Exception as e:
+            # Never let a worker die: the producer would block on a full queue
+            logger.error(f"Failed to delete batch of {len(keys)} files: {e}")
+            with self._lock:
+                self.error_count += len(keys)
+            return
+
+        # Quiet mode only reports the keys that failed
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.error(f"Failed to delete {error.get('Key')}: {error.get('Message')}")
+
+        with self._lock:
+            self.deleted_count += len(keys) - len(errors)
+            self.error_count += len(errors)
+
+        logger.info(f"Deleted batch of {len(keys) - len(errors)} files")
+
 
 class BaseSecureStorage(ABC):
     """
@@ -179,9 +314,46 @@ class BaseSecureStorage(ABC):
         from apps.expenses.models import Transaction
 
         return Transaction.objects.filter(
-            user=user, receipt__icontains=file_key, is_active=True
+            user=user, receipt=file_key, is_active=True
         ).exists()
 
+    def get_referenced_file_keys(self):
+        """
+        Get the storage keys of every receipt an active transaction uses.
+
+        Returns:
+            set: Normalized receipt keys, for exact membership tests
+        """
+        from apps.expenses.models import Transaction
+
+        receipts = (
+            Transaction.objects.filter(receipt__isnull=False, is_active=True)
+            .exclude(receipt="")
+            .values_list("receipt", flat=True)
+        )
+        return {receipt.replace("\\", "/").lstrip("/") for receipt in receipts}
+
+    def delete_many(self, file_keys):
+        """
+        Delete several files.
+
+        Args:
+            file_keys (iterable): File paths/keys to delete
+
+        Returns:
+            int: Number of files deleted
+        """
+        deleted_count = 0
+
+        for file_key in file_keys:
+            try:
+                self.delete(file_key)
+                deleted_count += 1
+            except Exception as e:
+                logger.error(f"Failed to delete file {file_key}: {e}")
+
+        return deleted_count
+
     @abstractmethod
     def cleanup_orphaned_files(self, dry_run=False):
         """Clean up orphaned files not referenced by any transaction."""
@@ -193,7 +365,7 @@ class BaseSecureStorage(ABC):
         pass
 
     @abstractmethod
-    def cleanup_user_files(self, user_id, dry_run=False):
+    def cleanup_user_files(self, user_id, dry_run=False, immediate=True):
         """Clean up all files for a specific user."""
         pass
 
@@ -293,8 +465,6 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
         Returns:
             int: Number of files deleted
         """
-        from apps.expenses.models import Transaction
-
         logger.info(f"Starting orphaned files cleanup (dry_run={dry_run})")
 
         deleted_count = 0
@@ -304,12 +474,10 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
         if not receipts_dir.exists():
             return 0
 
-        # Get all referenced files from database
-        referenced_files = set(
-            Transaction.objects.filter(
-                receipt__isnull=False, is_active=True
-            ).values_list("receipt", flat=True)
-        )
+        referenced_keys = self.get_referenced_file_keys()
+
+        # Files modified after this epoch timestamp are within the grace period
+        grace_cutoff_ts = time.time() - ORPHAN_GRACE_PERIOD_SECONDS
 
         # Walk through receipts directory
         for user_dir in receipts_dir.iterdir():
@@ -321,17 +489,14 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
                     continue
 
                 # Get relative path from media root
-                relative_path = str(file_path.relative_to(media_root))
+                relative_path = file_path.relative_to(media_root).as_posix()
 
                 # Skip if file is referenced
-                if any(relative_path in ref_file for ref_file in referenced_files):
+                if relative_path in referenced_keys:
                     continue
 
                 # Skip recently uploaded files (grace period)
-                file_age = datetime.now() - datetime.fromtimestamp(
-                    file_path.stat().st_mtime
-                )
-                if file_age.days < 1:  # 1 day grace period
+                if file_path.stat().st_mtime > grace_cutoff_ts:
                     continue
 
                 if dry_run:
@@ -365,7 +530,9 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
         if retention_days is None:
             retention_days = self.retention_days
 
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        # Compare raw mtimes against an epoch cutoff computed once
+        expired_cutoff_ts = time.time() - retention_days * SECONDS_PER_DAY
+        cutoff_date = datetime.fromtimestamp(expired_cutoff_ts)
 
         logger.info(
             f"Starting expired files cleanup (retention: {retention_days} days, "
@@ -389,8 +556,8 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
                     continue
 
                 # Check file age
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_mtime > cutoff_date:
+                file_mtime = file_path.stat().st_mtime
+                if file_mtime > expired_cutoff_ts:
                     continue
 
                 relative_path = str(file_path.relative_to(media_root))
@@ -398,7 +565,7 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
                 if dry_run:
                     logger.info(
                         f"Would delete expired file: {relative_path} "
-                        f"(age: {file_mtime})"
+                        f"(age: {datetime.fromtimestamp(file_mtime)})"
                     )
                 else:
                     try:
@@ -415,13 +582,14 @@ class SecureLocalStorage(FileSystemStorage, BaseSecureStorage):
         )
         return deleted_count
 
-    def cleanup_user_files(self, user_id, dry_run=False):
+    def cleanup_user_files(self, user_id, dry_run=False, immediate=True):
         """
         Clean up all files for a specific user.
 
         Args:
             user_id (int): User ID whose files to delete
             dry_run (bool): If True, only report what would be deleted
+            immediate (bool): Ignored in local storage (always immediate)
 
         Returns:
             int: Number of files deleted
@@ -525,10 +693,12 @@ class SecureS3Storage(BaseSecureStorage):
             )
 
         try:
+            from botocore.config import Config
             from botocore.exceptions import NoCredentialsError
             from storages.backends.s3boto3 import S3Boto3Storage
 
             self._boto3 = boto3
+            self._Config = Config
             self._NoCredentialsError = NoCredentialsError
             self._S3Boto3Storage = S3Boto3Storage
 
@@ -552,6 +722,14 @@ class SecureS3Storage(BaseSecureStorage):
         # Initialize S3 client for additional operations
         self._s3_client = None
 
+        # Thread pool for multipart copies, see _part_copy_executor()
+        self._part_copy_pool = None
+        self._part_copy_lock = threading.Lock()
+
+        # LRU cache of head_object metadata, see get_file_info()
+        self._file_info_cache = OrderedDict()
+        self._file_info_lock = threading.Lock()
+
         # Copy necessary attributes
         self.bucket_name = self._storage.bucket_name
         self.access_key = self._storage.access_key
@@ -568,6 +746,16 @@ class SecureS3Storage(BaseSecureStorage):
                     aws_access_key_id=self.access_key,
                     aws_secret_access_key=self.secret_key,
                     region_name=self.region_name,
+                    config=self._Config(
+                        # SigV4 is required to sign requests for KMS-encrypted
+                        # objects
+                        signature_version="s3v4",
+                        # The client lives as long as the process-wide backend,
+                        # so keep enough warm connections to avoid handshakes
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                        tcp_keepalive=True,
+                        retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": "adaptive"},
+                    ),
                 )
             except self._NoCredentialsError:
                 raise ImproperlyConfigured(
@@ -599,8 +787,18 @@ class SecureS3Storage(BaseSecureStorage):
 
     def delete(self, name):
         """Delete file from S3."""
+        self.invalidate_file_info(name)
         return self._storage.delete(name)
 
+    def delete_many(self, file_keys):
+        """Delete several files with batched DeleteObjects requests."""
+        with self._batch_deleter() as deleter:
+            for file_key in file_keys:
+                self.invalidate_file_info(file_key)
+                deleter.submit(file_key)
+
+        return deleter.deleted_count
+
     def exists(self, name):
         """Check if file exists in S3."""
         return self._storage.exists(name)
@@ -644,7 +842,12 @@ class SecureS3Storage(BaseSecureStorage):
 
             url = self.s3_client.generate_presigned_url(
                 "get_object",
-                Params={"Bucket": self.bucket_name, "Key": file_key},
+                Params={
+                    "Bucket": self.bucket_name,
+                    "Key": file_key,
+                    # Let the browser reuse the download while the URL is valid
+                    "ResponseCacheControl": f"private, max-age={expires_in}",
+                },
                 ExpiresIn=expires_in,
             )
 
@@ -666,80 +869,80 @@ class SecureS3Storage(BaseSecureStorage):
 
         return self.generate_presigned_url(file_key, expires_in)
 
+    def _batch_deleter(self):
+        """Create a batch deleter sized to the cleanup listing page."""
+        return S3BatchDeleter(
+            self.s3_client,
+            self.bucket_name,
+            batch_size=min(self.cleanup_batch_size, S3_DELETE_BATCH_SIZE),
+        )
+
     def cleanup_orphaned_files(self, dry_run=False):
         """Clean up files not referenced by any active transaction."""
         from botocore.exceptions import ClientError
 
-        from apps.expenses.models import Transaction
-
         logger.info(f"Starting orphaned files cleanup (dry_run={dry_run})")
 
         deleted_count = 0
         continuation_token = None
 
-        try:
-            while True:
-                # List objects in receipts directory
-                list_params = {
-                    "Bucket": self.bucket_name,
-                    "Prefix": "receipts/",
-                    "MaxKeys": self.cleanup_batch_size,
-                }
-
-                if continuation_token:
-                    list_params["ContinuationToken"] = continuation_token
+        # Loaded once; a receipt saved during the run is still new enough to
+        # fall within the grace period
+        referenced_keys = self.get_referenced_file_keys()
 
-                response = self.s3_client.list_objects_v2(**list_params)
+        try:
+            with self._batch_deleter() as deleter:
+                while True:
+                    # List objects in receipts directory
+                    list_params = {
+                        "Bucket": self.bucket_name,
+                        "Prefix": "receipts/",
+                        "MaxKeys": self.cleanup_batch_size,
+                    }
 
-                if "Contents" not in response:
-                    break
+                    if continuation_token:
+                        list_params["ContinuationToken"] = continuation_token
 
-                # Get all referenced file paths from database
-                referenced_files = set(
-                    Transaction.objects.filter(
-                        receipt__isnull=False, is_active=True
-                    ).values_list("receipt", flat=True)
-                )
+                    response = self.s3_client.list_objects_v2(**list_params)
 
-                # Check each file
-                for obj in response["Contents"]:
-                    file_key = obj["Key"]
+                    if "Contents" not in response:
+                        break
 
-                    # Skip if file is referenced by active transaction
-                    if any(file_key in ref_file for ref_file in referenced_files):
-                        continue
+                    # Check each file
+                    for obj in response["Contents"]:
+                        file_key = obj["Key"]
 
-                    # Skip recently uploaded files (grace period)
-                    file_age = (
-                        datetime.now(obj["LastModified"].tzinfo) - obj["LastModified"]
-                    )
-                    if file_age.days < 1:  # 1 day grace period
-                        continue
+                        # Skip if file is referenced by active transaction
+                        if file_key in referenced_keys:
+                            continue
 
-                    if dry_run:
-                        logger.info(f"Would delete orphaned file: {file_key}")
-                    else:
-                        try:
-                            self.s3_client.delete_object(
-                                Bucket=self.bucket_name, Key=file_key
-                            )
-                            logger.info(f"Deleted orphaned file: {file_key}")
-                        except ClientError as e:
-                            logger.error(f"Failed to delete {file_key}: {e}")
+                        # Skip recently uploaded files (grace period)
+                        file_age = (
+                            datetime.now(obj["LastModified"].tzinfo)
+                            - obj["LastModified"]
+                        )
+                        if file_age.days < 1:  # 1 day grace period
                             continue
 
-                    deleted_count += 1
+                        if dry_run:
+                            logger.info(f"Would delete orphaned file: {file_key}")
+                            deleted_count += 1
+                        else:
+                            self.invalidate_file_info(file_key)
+                            deleter.submit(file_key)
 
-                # Check if there are more objects
-                if not response.get("IsTruncated"):
-                    break
+                    # Check if there are more objects
+                    if not response.get("IsTruncated"):
+                        break
 
-                continuation_token = response.get("NextContinuationToken")
+                    continuation_token = response.get("NextContinuationToken")
 
         except ClientError as e:
             logger.error(f"Error during orphaned files cleanup: {e}")
             raise
 
+        deleted_count += deleter.deleted_count
+
         logger.info(
             f"Orphaned files cleanup completed. Files processed: {deleted_count}"
         )
@@ -763,69 +966,80 @@ class SecureS3Storage(BaseSecureStorage):
         continuation_token = None
 
         try:
-            while True:
-                # List objects in receipts directory
-                list_params = {
-                    "Bucket": self.bucket_name,
-                    "Prefix": "receipts/",
-                    "MaxKeys": self.cleanup_batch_size,
-                }
-
-                if continuation_token:
-                    list_params["ContinuationToken"] = continuation_token
-
-                response = self.s3_client.list_objects_v2(**list_params)
-
-                if "Contents" not in response:
-                    break
-
-                # Check each file
-                for obj in response["Contents"]:
-                    file_key = obj["Key"]
-                    file_modified = obj["LastModified"]
-
-                    # Skip if file is not expired
-                    if file_modified.replace(tzinfo=None) > cutoff_date:
-                        continue
-
-                    if dry_run:
-                        logger.info(
-                            f"Would delete expired file: {file_key} "
-                            f"(age: {file_modified})"
-                        )
-                    else:
-                        try:
-                            self.s3_client.delete_object(
-                                Bucket=self.bucket_name, Key=file_key
-                            )
-                            logger.info(f"Deleted expired file: {file_key}")
-                        except ClientError as e:
-                            logger.error(f"Failed to delete {file_key}: {e}")
+            with self._batch_deleter() as deleter:
+                while True:
+                    # List objects in receipts directory
+                    list_params = {
+                        "Bucket": self.bucket_name,
+                        "Prefix": "receipts/",
+                        "MaxKeys": self.cleanup_batch_size,
+                    }
+
+                    if continuation_token:
+                        list_params["ContinuationToken"] = continuation_token
+
+                    response = self.s3_client.list_objects_v2(**list_params)
+
+                    if "Contents" not in response:
+                        break
+
+                    # Check each file
+                    for obj in response["Contents"]:
+                        file_key = obj["Key"]
+                        file_modified = obj["LastModified"]
+
+                        # Skip if file is not expired
+                        if file_modified.replace(tzinfo=None) > cutoff_date:
                             continue
 
-                    deleted_count += 1
+                        if dry_run:
+                            logger.info(
+                                f"Would delete expired file: {file_key} "
+                                f"(age: {file_modified})"
+                            )
+                            deleted_count += 1
+                        else:
+                            self.invalidate_file_info(file_key)
+                            deleter.submit(file_key)
 
-                # Check if there are more objects
-                if not response.get("IsTruncated"):
-                    break
+                    # Check if there are more objects
+                    if not response.get("IsTruncated"):
+                        break
 
-                continuation_token = response.get("NextContinuationToken")
+                    continuation_token = response.get("NextContinuationToken")
 
         except ClientError as e:
             logger.error(f"Error during expired files cleanup: {e}")
             raise
 
+        deleted_count += deleter.deleted_count
+
         logger.info(
             f"Expired files cleanup completed. Files processed: {deleted_count}"
         )
         return deleted_count
 
-    def cleanup_user_files(self, user_id, dry_run=False):
-        """Clean up all files for a specific user."""
+    def cleanup_user_files(self, user_id, dry_run=False, immediate=True):
+        """
+        Clean up all files for a specific user.
+
+        With immediate=False the user's objects are tagged for an S3
+        lifecycle rule that expires them within a day, instead of being
+        deleted batch by batch. Use the immediate path when a deletion
+        deadline applies.
+        """
         from botocore.exceptions import ClientError
 
         user_prefix = f"receipts/{user_id}/"
 
+        if not immediate and not dry_run:
+            tagged_count = self.schedule_prefix_expiration(user_prefix)
+            logger.info(
+                f"Scheduled lifecycle expiration of {tagged_count} files "
+                f"for user {user_id}"
+            )
+            return 0
+
         logger.info(
             f"Starting user files cleanup for user {user_id} (dry_run={dry_run})"
         )
@@ -834,72 +1048,178 @@ class SecureS3Storage(BaseSecureStorage):
         continuation_token = None
 
         try:
-            while True:
-                # List objects for specific user
-                list_params = {
-                    "Bucket": self.bucket_name,
-                    "Prefix": user_prefix,
-                    "MaxKeys": self.cleanup_batch_size,
-                }
-
-                if continuation_token:
-                    list_params["ContinuationToken"] = continuation_token
+            with self._batch_deleter() as deleter:
+                while True:
+                    # List objects for specific user
+                    list_params = {
+                        "Bucket": self.bucket_name,
+                        "Prefix": user_prefix,
+                        "MaxKeys": self.cleanup_batch_size,
+                    }
 
-                response = self.s3_client.list_objects_v2(**list_params)
+                    if continuation_token:
+                        list_params["ContinuationToken"] = continuation_token
 
-                if "Contents" not in response:
-                    break
+                    response = self.s3_client.list_objects_v2(**list_params)
 
-                # Delete all files for this user
-                for obj in response["Contents"]:
-                    file_key = obj["Key"]
+                    if "Contents" not in response:
+                        break
 
-                    if dry_run:
-                        logger.info(f"Would delete user file: {file_key}")
-                    else:
-                        try:
-                            self.s3_client.delete_object(
-                                Bucket=self.bucket_name, Key=file_key
-                            )
-                            logger.info(f"Deleted user file: {file_key}")
-                        except ClientError as e:
-                            logger.error(f"Failed to delete {file_key}: {e}")
-                            continue
+                    # Delete all files for this user
+                    for obj in response["Contents"]:
+                        file_key = obj["Key"]
 
-                    deleted_count += 1
+                        if dry_run:
+                            logger.info(f"Would delete user file: {file_key}")
+                            deleted_count += 1
+                        else:
+                            self.invalidate_file_info(file_key)
+                            deleter.submit(file_key)
 
-                # Check if there are more objects
-                if not response.get("IsTruncated"):
-                    break
+                    # Check if there are more objects
+                    if not response.get("IsTruncated"):
+                        break
 
-                continuation_token = response.get("NextContinuationToken")
+                    continuation_token = response.get("NextContinuationToken")
 
         except ClientError as e:
             logger.error(f"Error during user files cleanup: {e}")
             raise
 
+        deleted_count += deleter.deleted_count
+
         logger.info(
             f"User files cleanup completed for user {user_id}. "
             f"Files processed: {deleted_count}"
         )
         return deleted_count
 
+    def schedule_prefix_expiration(self, prefix, days=1):
+        """
+        Tag every object under a prefix for lifecycle expiration.
+
+        Args:
+            prefix (str): Key prefix to expire
+            days (int): Days after creation before tagged objects expire
+
+        Returns:
+            int: Number of objects tagged
+        """
+        self.ensure_pending_deletion_rule(days=days)
+
+        tagged_count = 0
+        continuation_token = None
+
+        while True:
+            list_params = {
+                "Bucket": self.bucket_name,
+                "Prefix": prefix,
+                "MaxKeys": self.cleanup_batch_size,
+            }
+
+            if continuation_token:
+                list_params["ContinuationToken"] = continuation_token
+
+            response = self.s3_client.list_objects_v2(**list_params)
+
+            for obj in response.get("Contents", []):
+                self.s3_client.put_object_tagging(
+                    Bucket=self.bucket_name,
+                    Key=obj["Key"],
+                    Tagging={"TagSet": [PENDING_DELETION_TAG]},
+                )
+                tagged_count += 1
+
+            if not response.get("IsTruncated"):
+                break
+
+            continuation_token = response.get("NextContinuationToken")
+
+        return tagged_count
+
+    def ensure_pending_deletion_rule(self, days=1):
+        """
+        Make sure the bucket has the lifecycle rule for tagged deletions.
+
+        The configuration is only rewritten when the rule is missing or
+        differs. Every caller writes the same single rule, so concurrent
+        calls cannot drop each other's rules.
+
+        Args:
+            days (int): Days after creation before tagged objects expire
+        """
+        from botocore.exceptions import ClientError
+
+        rule = {
+            "ID": PENDING_DELETION_RULE_ID,
+            "Filter": {"Tag": PENDING_DELETION_TAG},
+            "Status": "Enabled",
+            "Expiration": {"Days": days},
+        }
+
+        try:
+            config = self.s3_client.get_bucket_lifecycle_configuration(
+                Bucket=self.bucket_name
+            )
+            rules = config["Rules"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "NoSuchLifecycleConfiguration":
+                raise
+            rules = []
+
+        if rule in rules:
+            return
+
+        rules = [r for r in rules if r.get("ID") != PENDING_DELETION_RULE_ID]
+        rules.append(rule)
+        self.s3_client.put_bucket_lifecycle_configuration(
+            Bucket=self.bucket_name, LifecycleConfiguration={"Rules": rules}
+        )
+
     def rotate_encryption_key(self, file_key, old_key_id, new_key_id):
-        """Rotate KMS encryption key for an existing file."""
+        """
+        Rotate KMS encryption key for an existing file.
+
+        Objects up to MULTIPART_COPY_THRESHOLD are re-encrypted with a single
+        in-place copy_object call. Larger objects are copied with a ranged
+        multipart copy, since copy_object is limited to 5GB and copies the
+        whole object serially.
+        """
         from botocore.exceptions import ClientError
 
         try:
-            # Copy object with new encryption key
-            copy_source = {"Bucket": self.bucket_name, "Key": file_key}
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=file_key)
+
+            object_size = head.get("ContentLength") or 0
+            if object_size > MULTIPART_COPY_THRESHOLD:
+                self._multipart_copy(
+                    file_key,
+                    object_size,
+                    self._rotation_upload_params(file_key, head, new_key_id),
+                    head["ETag"],
+                )
+            else:
+                # Copy object with new encryption key. Metadata and tags are
+                # copied from the source; only the encryption changes.
+                copy_source = {"Bucket": self.bucket_name, "Key": file_key}
+                copy_params = {}
+                if head.get("StorageClass"):
+                    # Copies default to STANDARD unless told otherwise
+                    copy_params["StorageClass"] = head["StorageClass"]
+
+                self.s3_client.copy_object(
+                    Bucket=self.bucket_name,
+                    Key=file_key,
+                    CopySource=copy_source,
+                    CopySourceIfMatch=head["ETag"],
+                    MetadataDirective="COPY",
+                    TaggingDirective="COPY",
+                    ServerSideEncryption="aws:kms",
+                    SSEKMSKeyId=new_key_id,
+                    **copy_params,
+                )
 
-            self.s3_client.copy_object(
-                CopySource=copy_source,
-                Bucket=self.bucket_name,
-                Key=file_key,
-                ServerSideEncryption="aws:kms",
-                SSEKMSKeyId=new_key_id,
-                MetadataDirective="COPY",
-            )
+            self.invalidate_file_info(file_key)
 
             logger.info(
                 f"Encryption key rotated for {file_key}: {old_key_id} -> {new_key_id}"
@@ -910,14 +1230,151 @@ class SecureS3Storage(BaseSecureStorage):
             logger.error(f"Failed to rotate encryption key for {file_key}: {e}")
             return False
 
+    def _rotation_upload_params(self, file_key, head, new_key_id):
+        """
+        Build multipart upload parameters that recreate an object as-is.
+
+        A multipart upload starts from an empty object, so every attribute
+        of the source has to be passed again; only the encryption changes.
+
+        Args:
+            file_key (str): S3 object key
+            head (dict): head_object response for the source object
+            new_key_id (str): KMS key to encrypt the new object with
+
+        Returns:
+            dict: Parameters for create_multipart_upload()
+        """
+        params = {
+            "Bucket": self.bucket_name,
+            "Key": file_key,
+            "ServerSideEncryption": "aws:kms",
+            "SSEKMSKeyId": new_key_id,
+            "Metadata": head.get("Metadata", {}),
+        }
+        for attribute in ROTATION_PRESERVED_ATTRIBUTES:
+            if head.get(attribute):
+                params[attribute] = head[attribute]
+
+        tag_set = self.s3_client.get_object_tagging(
+            Bucket=self.bucket_name, Key=file_key
+        ).get("TagSet", [])
+        if tag_set:
+            params["Tagging"] = urlencode(
+                [(tag["Key"], tag["Value"]) for tag in tag_set]
+            )
+
+        return params
+
+    def _part_copy_executor(self):
+        """
+        Get the thread pool shared by every multipart copy of this backend.
+
+        Sharing one pool caps concurrent part copies at
+        MULTIPART_COPY_WORKERS however many objects are rotated at once.
+        """
+        with self._part_copy_lock:
+            if self._part_copy_pool is None:
+                self._part_copy_pool = ThreadPoolExecutor(
+                    max_workers=MULTIPART_COPY_WORKERS,
+                    thread_name_prefix="s3-part-copy",
+                )
+            return self._part_copy_pool
+
+    def _multipart_copy(self, file_key, object_size, copy_params, etag):
+        """
+        Copy an object onto itself in MULTIPART_COPY_PART_SIZE ranges.
+
+        Parts are copied concurrently. Every part is pinned to the source
+        ETag, so a write during the copy fails the copy with a 412 instead
+        of mixing old and new bytes. The upload is aborted if any part
+        fails, so no incomplete multipart upload is left in the bucket.
+
+        Args:
+            file_key (str): S3 object key
+            object_size (int): Object size in bytes
+            copy_params (dict): Destination parameters (bucket, key, encryption)
+            etag (str): ETag of the source object when the copy started
+        """
+        from botocore.exceptions import ClientError
+
+        upload = self.s3_client.create_multipart_upload(**copy_params)
+        upload_id = upload["UploadId"]
+        copy_source = {"Bucket": self.bucket_name, "Key": file_key}
+
+        def copy_part(part_number, start):
+            end = min(start + MULTIPART_COPY_PART_SIZE, object_size) - 1
+            response = self.s3_client.upload_part_copy(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                CopySource=copy_source,
+                CopySourceIfMatch=etag,
+                CopySourceRange=f"bytes={start}-{end}",
+                PartNumber=part_number,
+                UploadId=upload_id,
+            )
+            return {
+                "PartNumber": part_number,
+                "ETag": response["CopyPartResult"]["ETag"],
+            }
+
+        executor = self._part_copy_executor()
+        futures = [
+            executor.submit(copy_part, part_number, start)
+            for part_number, start in enumerate(
+                range(0, object_size, MULTIPART_COPY_PART_SIZE), start=1
+            )
+        ]
+
+        try:
+            parts = [future.result() for future in futures]
+
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception as e:
+            if (
+                isinstance(e, ClientError)
+                and e.response["Error"]["Code"] == "PreconditionFailed"
+            ):
+                logger.warning(f"{file_key} changed during multipart copy")
+
+            # Let parts already in progress finish before aborting
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=file_key, UploadId=upload_id
+            )
+            raise
+
     def get_file_info(self, file_key):
-        """Get metadata information for a file."""
+        """
+        Get metadata information for a file.
+
+        Results are kept for FILE_INFO_CACHE_TTL seconds in a bounded LRU
+        cache so repeated lookups of the same key skip the HEAD round-trip.
+        Missing files are not cached.
+        """
         from botocore.exceptions import ClientError
 
+        with self._file_info_lock:
+            cached = self._file_info_cache.get(file_key)
+            if cached is not None:
+                cached_at, file_info = cached
+                if time.monotonic() - cached_at < FILE_INFO_CACHE_TTL:
+                    self._file_info_cache.move_to_end(file_key)
+                    return dict(file_info)
+                del self._file_info_cache[file_key]
+
         try:
             response = self.s3_client.head_object(Bucket=self.bucket_name, Key=file_key)
 
-            return {
+            file_info = {
                 "size": response.get("ContentLength"),
                 "last_modified": response.get("LastModified"),
                 "content_type": response.get("ContentType"),
@@ -932,11 +1389,27 @@ class SecureS3Storage(BaseSecureStorage):
             logger.error(f"Failed to get file info for {file_key}: {e}")
             raise
 
+        with self._file_info_lock:
+            self._file_info_cache[file_key] = (time.monotonic(), file_info)
+            if len(self._file_info_cache) > FILE_INFO_CACHE_SIZE:
+                self._file_info_cache.popitem(last=False)
 
+        return dict(file_info)
+
+    def invalidate_file_info(self, file_key):
+        """Drop cached metadata for a file after it is changed or deleted."""
+        with self._file_info_lock:
+            self._file_info_cache.pop(file_key, None)
+
+
+@functools.cache
 def get_storage_backend():
     """
     Get appropriate storage backend based on environment.
 
+    The backend is created once per process and shared, so its S3 client and
+    file info cache are reused across tasks and requests.
+
     Returns:
         Storage backend instance (SecureLocalStorage or SecureS3Storage)
     """
@@ -949,3 +1422,9 @@ def get_storage_backend():
     else:
         # Use local storage for development
         return SecureLocalStorage()
+
+
+@receiver(setting_changed)
+def reset_storage_backend(**kwargs):
+    """Drop the shared storage backend when settings change (tests)."""
+    get_storage_backend.cache_clear()
@@ -5,25 +5,165 @@ Handles automated recurring transaction generation, file cleanup,
 and other asynchronous operations.
 """
 
+import functools
 import logging
-from datetime import date, timedelta
+import uuid
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import timedelta
+from itertools import islice
+from types import MappingProxyType, SimpleNamespace
 
 from celery import shared_task
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
 from django.db import transaction as db_transaction
-
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from apps.expenses.imports import (
+    IMPORT_MAX_REPORTED_ERRORS,
+    import_transaction_rows,
+    read_import_rows,
+)
 from apps.expenses.models import Transaction
-from apps.expenses.storage import get_storage_backend
+from apps.expenses.storage import (
+    MULTIPART_COPY_WORKERS,
+    S3_MAX_POOL_CONNECTIONS,
+    get_storage_backend,
+)
+from apps.expenses.utils import invalidate_transaction_statistics
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Number of recurring transactions processed per database transaction
+RECURRING_CHUNK_SIZE = 500
+
+# Columns read by Transaction.generate_next_transaction() and the child
+# transaction's validation; everything else on the row stays deferred
+RECURRING_GENERATION_FIELDS = (
+    "id",
+    "user__id",
+    "category__id",
+    "category__user",
+    "transaction_type",
+    "amount",
+    "description",
+    "notes",
+    "merchant",
+    "receipt",
+    "is_recurring",
+    "recurring_frequency",
+    "recurring_interval",
+    "recurring_end_date",
+    "next_occurrence",
+)
+
+# Rows fetched per chunk when validating, and rows per bulk INSERT or UPDATE
+VALIDATION_CHUNK_SIZE = 1000
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Relations whose existence the database already guarantees
+VALIDATION_SKIPPED_FIELDS = ["user", "category", "parent_transaction"]
+
+# Connections of the shared S3 client left free for web requests during
+# encryption key rotation
+ROTATION_SPARE_CONNECTIONS = 10
+
+# Concurrent rotations, and the cap on rotations submitted but not yet
+# collected. Each rotation holds at most one connection; large objects add
+# part copies from the backend's shared pool of MULTIPART_COPY_WORKERS, so
+# the two pools together stay within the client's connection pool.
+ROTATION_WORKERS = (
+    S3_MAX_POOL_CONNECTIONS - MULTIPART_COPY_WORKERS - ROTATION_SPARE_CONNECTIONS
+)
+ROTATION_MAX_IN_FLIGHT = ROTATION_WORKERS * 4
+
+# Hard time limits of the long-running storage tasks. Celery kills a run
+# that exceeds its limit, so a lock that outlives the limit is never lost
+# while the run holding it is still working.
+ORPHAN_CLEANUP_TIME_LIMIT = 4 * 60 * 60
+EXPIRED_CLEANUP_TIME_LIMIT = 4 * 60 * 60
+KEY_ROTATION_TIME_LIMIT = 24 * 60 * 60
+
+# Single-instance lock expiry for tasks without a hard time limit, and the
+# time a lock outlives a task's hard limit
+TASK_LOCK_TIMEOUT = 60 * 60
+TASK_LOCK_MARGIN = 5 * 60
+
+
+def _single_instance(task_func):
+    """
+    Skip a bound task run while another run of the same task holds its lock.
 
-@shared_task(bind=True, max_retries=3)
-def generate_recurring_transactions(self, user_id: int = None) -> dict:
+    The lock is a cache key added atomically with cache.add(), so concurrent
+    runs triggered by beat and by hand do not repeat the same S3 work. It
+    holds a token unique to the run, and a run only releases a lock that
+    still holds its own token. The lock expires shortly after the task's
+    hard time limit, in case a worker dies without releasing it.
+
+    Args:
+        task_func: Task function taking the bound task as first argument
+
+    Returns:
+        Wrapped task function
     """
-    Generate all due recurring transactions.
+
+    @functools.wraps(task_func)
+    def wrapper(self, *args, **kwargs):
+        lock_key = f"task-lock:{self.name}"
+        token = uuid.uuid4().hex
+        timeout = (
+            self.time_limit + TASK_LOCK_MARGIN if self.time_limit else TASK_LOCK_TIMEOUT
+        )
+
+        if not cache.add(lock_key, token, timeout):
+            logger.info(f"Skipping {self.name}: another run is in progress")
+            return {
+                "success": False,
+                "skipped": True,
+                "error": "Task is already running",
+            }
+
+        try:
+            return task_func(self, *args, **kwargs)
+        finally:
+            # Leave a lock taken by another run after ours expired
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    return wrapper
+
+
+def _chunked(iterable, size):
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _iter_storage_keys(storage, prefix):
+    """Yield S3 object keys under ``prefix`` one at a time, page by page."""
+    paginator = storage.s3_client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=storage.bucket_name,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": storage.cleanup_batch_size},
+    )
+    for page in pages:
+        for obj in page.get("Contents", []):
+            yield obj["Key"]
+
+
+def _generate_recurring_transactions(user_id: int = None) -> dict:
+    """
+    Generate all due recurring transactions, optionally for one user.
+
+    Shared by the Celery tasks below so that neither has to enqueue the
+    other and block on its result.
 
     Args:
         user_id: Optional user ID to process only one user's transactions
@@ -31,50 +171,76 @@ def generate_recurring_transactions(self, user_id: int = None) -> dict:
     Returns:
         Dictionary with generation statistics
     """
-    try:
-        stats = {
-            "processed": 0,
-            "generated": 0,
-            "errors": 0,
-            "user_count": 0,
-        }
+    stats = {
+        "processed": 0,
+        "generated": 0,
+        "errors": 0,
+        "user_count": 0,
+    }
 
-        # Get transactions that are due for generation
-        queryset = Transaction.objects.filter(
-            is_recurring=True,
-            is_active=True,
-            next_occurrence__lte=date.today(),
-        ).select_related("user", "category")
+    # Get transactions that are due for generation
+    queryset = (
+        Transaction.objects.recurring_due(timezone.localdate())
+        .select_related("user", "category")
+        .only(*RECURRING_GENERATION_FIELDS)
+    )
 
-        if user_id:
-            queryset = queryset.filter(user_id=user_id)
+    if user_id:
+        queryset = queryset.filter(user_id=user_id)
 
-        # Group by user for processing
-        users_processed = set()
+    # Group by user for processing
+    users_processed = set()
 
-        for recurring_transaction in queryset:
-            try:
-                with db_transaction.atomic():
-                    # Generate the next transaction
-                    generated = recurring_transaction.generate_next_transaction()
+    # Snapshot the due IDs up front: generating a transaction moves its
+    # next_occurrence, so rows must not be re-read from a live cursor
+    due_ids = list(queryset.values_list("id", flat=True))
 
-                    if generated:
-                        stats["generated"] += 1
+    for chunk_ids in _chunked(due_ids, RECURRING_CHUNK_SIZE):
+        # One commit per chunk; each row gets its own savepoint so a
+        # failure only rolls back that row
+        with db_transaction.atomic():
+            for recurring_transaction in queryset.filter(id__in=chunk_ids):
+                try:
+                    with db_transaction.atomic():
+                        # Generate the next transaction
+                        generated = recurring_transaction.generate_next_transaction()
 
-                    stats["processed"] += 1
-                    users_processed.add(recurring_transaction.user_id)
+                        if generated:
+                            stats["generated"] += 1
 
-            except Exception as exc:
-                stats["errors"] += 1
-                # Log the error but continue processing other transactions
-                self.retry(countdown=60, exc=exc)
+                        stats["processed"] += 1
+                        users_processed.add(recurring_transaction.user_id)
 
-        stats["user_count"] = len(users_processed)
-        return stats
+                except Exception:
+                    stats["errors"] += 1
+                    # Log the error but continue processing other transactions
+                    logger.exception(
+                        f"Failed to generate recurring transaction "
+                        f"{recurring_transaction.id}"
+                    )
+
+    stats["user_count"] = len(users_processed)
+    return stats
+
+
+@shared_task(bind=True, max_retries=3)
+def generate_recurring_transactions(self, user_id: int = None) -> dict:
+    """
+    Generate all due recurring transactions.
+
+    Args:
+        user_id: Optional user ID to process only one user's transactions
+
+    Returns:
+        Dictionary with generation statistics
+    """
+    try:
+        return _generate_recurring_transactions(user_id=user_id)
 
     except Exception as exc:
-        # Log the error and retry
-        raise self.retry(countdown=60, exc=exc)
+        logger.error(f"Recurring transaction generation failed: {exc}")
+        # Retry with exponential backoff
+        raise self.retry(exc=exc, countdown=60 * (2**self.request.retries))
 
 
 @shared_task(bind=True)
@@ -82,13 +248,17 @@ def generate_user_recurring_transactions(self, user_id: int) -> dict:
     """
     Generate recurring transactions for a specific user.
 
+    Runs the generation in this worker rather than enqueueing
+    generate_recurring_transactions and waiting on its result, which would
+    hold two worker slots and can deadlock a saturated pool.
+
     Args:
         user_id: ID of the user to process
 
     Returns:
         Dictionary with generation statistics
     """
-    return generate_recurring_transactions.delay(user_id=user_id).get()
+    return _generate_recurring_transactions(user_id=user_id)
 
 
 @shared_task
@@ -99,24 +269,20 @@ def cleanup_expired_recurring_transactions() -> dict:
     Returns:
         Dictionary with cleanup statistics
     """
-    stats = {
-        "stopped": 0,
-        "processed": 0,
-    }
-
     # Find recurring transactions that have passed their end date
     expired_transactions = Transaction.objects.filter(
         is_recurring=True,
         is_active=True,
-        recurring_end_date__lt=date.today(),
+        recurring_end_date__lt=timezone.localdate(),
     )
 
-    for transaction in expired_transactions:
-        transaction.stop_recurring()
-        stats["stopped"] += 1
-        stats["processed"] += 1
+    # Stop them all in a single UPDATE; update() bypasses auto_now. The
+    # matched row count is the whole of the statistics
+    stopped = expired_transactions.update(
+        **Transaction.stop_recurring_updates(), updated_at=timezone.now()
+    )
 
-    return stats
+    return {"stopped": stopped, "processed": stopped}
 
 
 @shared_task
@@ -139,35 +305,96 @@ def generate_upcoming_recurring_transactions(days_ahead: int = 7) -> dict:
         "errors": 0,
     }
 
-    future_date = date.today() + timedelta(days=days_ahead)
+    today = timezone.localdate()
+    future_date = today + timedelta(days=days_ahead)
+
+    # Get transactions due within the next N days, with the occurrences
+    # already generated inside the window loaded in one extra query
+    upcoming_transactions = (
+        Transaction.objects.recurring_due(future_date)
+        .filter(next_occurrence__gt=today)
+        .select_related("user", "category")
+        .only(*RECURRING_GENERATION_FIELDS)
+        .prefetch_related(
+            Prefetch(
+                "recurring_children",
+                queryset=Transaction.objects.filter(
+                    date__gt=today,
+                    date__lte=future_date,
+                    is_active=True,
+                ).only("id", "parent_transaction_id", "date"),
+                to_attr="upcoming_children",
+            )
+        )
+    )
 
-    # Get transactions due within the next N days
-    upcoming_transactions = Transaction.objects.filter(
-        is_recurring=True,
-        is_active=True,
-        next_occurrence__lte=future_date,
-        next_occurrence__gt=date.today(),
-    ).select_related("user", "category")
+    children = []
+    advanced = []
 
     for recurring_transaction in upcoming_transactions:
-        try:
-            with db_transaction.atomic():
-                # Check if this transaction was already generated
-                existing = Transaction.objects.filter(
-                    parent_transaction=recurring_transaction,
-                    date=recurring_transaction.next_occurrence,
+        stats["processed"] += 1
+
+        # Skip occurrences that were already generated
+        if any(
+            child.date == recurring_transaction.next_occurrence
+            for child in recurring_transaction.upcoming_children
+        ):
+            continue
+
+        child = recurring_transaction.build_next_transaction()
+        if child is None:
+            continue
+
+        children.append(child)
+        recurring_transaction.next_occurrence = (
+            recurring_transaction.following_occurrence()
+        )
+        advanced.append(recurring_transaction)
+
+    if not children:
+        return stats
+
+    # Children are copies of already-validated series, so they are inserted
+    # in bulk without per-row full_clean(). Occurrences generated by a
+    # concurrent run are dropped by the uniq_child_by_date constraint.
+    try:
+        with db_transaction.atomic():
+            # A concurrent run may have inserted some occurrences since the
+            # series were read; leave those out so only rows this run
+            # inserts are counted as generated
+            existing = set(
+                Transaction.objects.filter(
+                    parent_transaction_id__in={
+                        child.parent_transaction_id for child in children
+                    },
+                    date__in={child.date for child in children},
                     is_active=True,
-                ).exists()
+                ).values_list("parent_transaction_id", "date")
+            )
+            children = [
+                child
+                for child in children
+                if (child.parent_transaction_id, child.date) not in existing
+            ]
+
+            Transaction.objects.bulk_create(
+                children,
+                batch_size=BULK_UPDATE_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            Transaction.objects.bulk_update(
+                advanced, ["next_occurrence"], batch_size=BULK_UPDATE_BATCH_SIZE
+            )
 
-                if not existing:
-                    generated = recurring_transaction.generate_next_transaction()
-                    if generated:
-                        stats["generated"] += 1
+        stats["generated"] = len(children)
 
-                stats["processed"] += 1
+        # bulk_create() sends no post_save signals
+        for user_id in {child.user_id for child in children}:
+            invalidate_transaction_statistics(user_id)
 
-        except Exception:
-            stats["errors"] += 1
+    except Exception:
+        stats["errors"] = len(children)
+        logger.exception("Failed to pre-generate upcoming recurring transactions")
 
     return stats
 
@@ -188,37 +415,57 @@ def validate_recurring_transactions() -> dict:
         "errors": [],
     }
 
-    # Get all active recurring transactions
+    # Get all active recurring transactions; clean() compares the category
+    # owner with the transaction owner, so load both with the row
     recurring_transactions = Transaction.objects.filter(
         is_recurring=True,
         is_active=True,
-    )
+    ).select_related("user", "category__user")
 
-    for transaction in recurring_transactions:
-        stats["total"] += 1
+    for chunk in _chunked(
+        recurring_transactions.iterator(chunk_size=VALIDATION_CHUNK_SIZE),
+        VALIDATION_CHUNK_SIZE,
+    ):
+        to_fix = []
 
-        try:
-            # Validate the transaction
-            transaction.full_clean()
-
-            # Check if next_occurrence is correctly calculated
-            expected_next = transaction.calculate_next_occurrence()
-            if transaction.next_occurrence != expected_next:
-                # Fix the next occurrence
-                transaction.next_occurrence = expected_next
-                transaction.save(update_fields=["next_occurrence"])
-                stats["fixed"] += 1
-
-            stats["valid"] += 1
-
-        except Exception as e:
-            stats["invalid"] += 1
-            stats["errors"].append(
-                {
-                    "transaction_id": transaction.id,
-                    "error": str(e),
-                }
-            )
+        for transaction in chunk:
+            stats["total"] += 1
+
+            try:
+                # Validate the transaction. Skip full_clean()'s uniqueness
+                # and constraint checks, which cost a SELECT per row: the
+                # only unique constraint, uniq_child_by_date, covers
+                # parent_transaction and date, which this task never
+                # changes, and the database already enforces it on the
+                # stored rows. Foreign keys are likewise enforced by the
+                # database, and re-checking them would cost a SELECT per
+                # relation per row.
+                transaction.clean_fields(exclude=VALIDATION_SKIPPED_FIELDS)
+                transaction.clean()
+
+                # Check if next_occurrence is correctly calculated
+                expected_next = transaction.calculate_next_occurrence()
+                if transaction.next_occurrence != expected_next:
+                    # Fix the next occurrence
+                    transaction.next_occurrence = expected_next
+                    to_fix.append(transaction)
+                    stats["fixed"] += 1
+
+                stats["valid"] += 1
+
+            except Exception as e:
+                stats["invalid"] += 1
+                stats["errors"].append(
+                    {
+                        "transaction_id": transaction.id,
+                        "error": str(e),
+                    }
+                )
+
+        # Write all corrections for this chunk at once
+        Transaction.objects.bulk_update(
+            to_fix, ["next_occurrence"], batch_size=BULK_UPDATE_BATCH_SIZE
+        )
 
     return stats
 
@@ -227,7 +474,8 @@ def validate_recurring_transactions() -> dict:
 # These would be configured in celery beat schedule
 
 
-@shared_task(bind=True)
+@shared_task(bind=True, rate_limit="1/m", time_limit=ORPHAN_CLEANUP_TIME_LIMIT)
+@_single_instance
 def cleanup_orphaned_files(self) -> dict:
     """
     Clean up files that are not referenced by any active transaction.
@@ -253,7 +501,8 @@ def cleanup_orphaned_files(self) -> dict:
         return stats
 
 
-@shared_task(bind=True)
+@shared_task(bind=True, rate_limit="1/m", time_limit=EXPIRED_CLEANUP_TIME_LIMIT)
+@_single_instance
 def cleanup_expired_files(self, retention_days: int = None) -> dict:
     """
     Clean up files older than the retention period.
@@ -297,12 +546,14 @@ def cleanup_expired_files(self, retention_days: int = None) -> dict:
 
 
 @shared_task(bind=True)
-def cleanup_user_files(self, user_id: int) -> dict:
+def cleanup_user_files(self, user_id: int, immediate: bool = True) -> dict:
     """
     Clean up all files for a specific user (e.g., when user account is deleted).
 
     Args:
         user_id: ID of the user whose files should be deleted
+        immediate: Delete now; if False, S3 storage tags the user's files
+            for lifecycle expiration instead
 
     Returns:
         Dictionary with cleanup statistics
@@ -312,12 +563,15 @@ def cleanup_user_files(self, user_id: int) -> dict:
         storage = get_storage_backend()
 
         logger.info(f"Starting user files cleanup for user {user_id}")
-        deleted_count = storage.cleanup_user_files(user_id, dry_run=False)
+        deleted_count = storage.cleanup_user_files(
+            user_id, dry_run=False, immediate=immediate
+        )
 
         stats = {
             "success": True,
             "deleted_count": deleted_count,
             "user_id": user_id,
+            "immediate": immediate,
             "error": None,
         }
 
@@ -333,12 +587,87 @@ def cleanup_user_files(self, user_id: int) -> dict:
             "success": False,
             "deleted_count": 0,
             "user_id": user_id,
+            "immediate": immediate,
             "error": str(exc),
         }
         return stats
 
 
 @shared_task(bind=True)
+def import_transactions(self, user_id: int, file_path: str) -> dict:
+    """
+    Import transactions from an upload saved by store_import_upload().
+
+    Queued by the import API action for files too large to import during
+    the request. The file is streamed from storage and deleted afterwards.
+    Progress is reported in the PROGRESS state's metadata.
+
+    Args:
+        user_id: ID of the user the transactions are imported for
+        file_path: Storage path of the uploaded file
+
+    Returns:
+        Dictionary with the imported count and the first row errors
+    """
+
+    def report_progress(processed):
+        # Eager runs have no result backend entry to update
+        if not self.request.is_eager:
+            self.update_state(
+                state="PROGRESS",
+                meta={"user_id": user_id, "processed": processed},
+            )
+
+    try:
+        user = User.objects.get(id=user_id)
+
+        logger.info(f"Starting import of {file_path} for user {user_id}")
+        with default_storage.open(file_path, "rb") as import_file:
+            rows = read_import_rows(import_file)
+            try:
+                # The serializers read the importing user from the request in
+                # their context; no HTTP request exists here
+                imported_count, errors = import_transaction_rows(
+                    rows,
+                    user,
+                    {"request": SimpleNamespace(user=user)},
+                    progress=report_progress,
+                )
+            finally:
+                rows.close()
+
+        logger.info(
+            f"Import completed for user {user_id}. Imported {imported_count} "
+            f"transactions, {len(errors)} rows rejected"
+        )
+        # Row data stays out of the result backend; the row number and
+        # message are enough to find and fix a rejected row
+        return {
+            "user_id": user_id,
+            "imported_count": imported_count,
+            "error_count": len(errors),
+            "errors": [
+                {"row": error["row"], "error": error["error"]}
+                for error in errors[:IMPORT_MAX_REPORTED_ERRORS]
+            ],
+        }
+
+    except Exception as exc:
+        logger.error(f"Import failed for user {user_id}: {exc}")
+        return {
+            "user_id": user_id,
+            "imported_count": 0,
+            "error_count": 0,
+            "errors": [],
+            "error": f"File processing error: {exc}",
+        }
+
+    finally:
+        default_storage.delete(file_path)
+
+
+@shared_task(bind=True, rate_limit="1/m", time_limit=KEY_ROTATION_TIME_LIMIT)
+@_single_instance
 def rotate_file_encryption_keys(self, old_key_id: str, new_key_id: str) -> dict:
     """
     Rotate KMS encryption keys for all stored files.
@@ -374,46 +703,38 @@ def rotate_file_encryption_keys(self, old_key_id: str, new_key_id: str) -> dict:
             "error": None,
         }
 
-        # List all files and rotate keys
-        continuation_token = None
+        def record(future, file_key):
+            stats["processed"] += 1
 
-        while True:
-            list_params = {
-                "Bucket": storage.bucket_name,
-                "Prefix": "receipts/",
-                "MaxKeys": storage.cleanup_batch_size,
-            }
-
-            if continuation_token:
-                list_params["ContinuationToken"] = continuation_token
-
-            response = storage.s3_client.list_objects_v2(**list_params)
-
-            if "Contents" not in response:
-                break
+            try:
+                if future.result():
+                    stats["rotated"] += 1
+                else:
+                    stats["errors"] += 1
 
-            for obj in response["Contents"]:
-                file_key = obj["Key"]
-                stats["processed"] += 1
+            except Exception as e:
+                logger.error(f"Failed to rotate key for {file_key}: {e}")
+                stats["errors"] += 1
 
-                try:
-                    success = storage.rotate_encryption_key(
-                        file_key, old_key_id, new_key_id
-                    )
-                    if success:
-                        stats["rotated"] += 1
-                    else:
-                        stats["errors"] += 1
+        # Keys are listed lazily, page by page, while earlier rotations run.
+        # At most ROTATION_MAX_IN_FLIGHT rotations are pending at once, so
+        # memory stays constant regardless of bucket size.
+        in_flight = {}
 
-                except Exception as e:
-                    logger.error(f"Failed to rotate key for {file_key}: {e}")
-                    stats["errors"] += 1
+        with ThreadPoolExecutor(max_workers=ROTATION_WORKERS) as executor:
+            for file_key in _iter_storage_keys(storage, "receipts/"):
+                if len(in_flight) >= ROTATION_MAX_IN_FLIGHT:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record(future, in_flight.pop(future))
 
-            # Check if there are more objects
-            if not response.get("IsTruncated"):
-                break
+                future = executor.submit(
+                    storage.rotate_encryption_key, file_key, old_key_id, new_key_id
+                )
+                in_flight[future] = file_key
 
-            continuation_token = response.get("NextContinuationToken")
+            for future in as_completed(in_flight):
+                record(future, in_flight[future])
 
         logger.info(
             f"Encryption key rotation completed. "
@@ -437,14 +758,11 @@ def rotate_file_encryption_keys(self, old_key_id: str, new_key_id: str) -> dict:
         return stats
 
 
-def get_recurring_transaction_schedules() -> dict:
-    """
-    Get the periodic task schedules for recurring transactions.
-
-    This function returns the schedule configuration that should be
-    added to CELERY_BEAT_SCHEDULE in settings.
-    """
-    return {
+# Periodic task schedules for recurring transactions and file maintenance.
+# Built once at import and exposed read-only; see
+# get_recurring_transaction_schedules().
+_SCHEDULES = MappingProxyType(
+    {
         "generate-recurring-transactions": {
             "task": "apps.expenses.tasks.generate_recurring_transactions",
             "schedule": 60.0 * 60,  # Every hour
@@ -471,3 +789,15 @@ def get_recurring_transaction_schedules() -> dict:
             "options": {"queue": "maintenance"},
         },
     }
+)
+
+
+def get_recurring_transaction_schedules() -> Mapping:
+    """
+    Get the periodic task schedules for recurring transactions.
+
+    This function returns the schedule configuration that should be
+    added to CELERY_BEAT_SCHEDULE in settings. The same read-only mapping
+    is returned on every call; copy it before modifying.
+    """
+    return _SCHEDULES
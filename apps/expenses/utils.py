@@ -5,44 +5,201 @@ Provides helper functions for file handling, URL generation, and other
 common operations.
 """
 
+import hashlib
 import logging
+import os
+import time
+from collections import Counter
 from datetime import datetime
 from typing import Optional
 
+from django.core.cache import cache
 from django.http import Http404
 
-from apps.expenses.models import Transaction
+from apps.expenses.models import Category, Transaction
 from apps.expenses.storage import get_storage_backend
 
 logger = logging.getLogger(__name__)
 
+# Keys per list_objects_v2 page (the S3 maximum)
+S3_LIST_PAGE_SIZE = 1000
 
-def generate_secure_file_url(
-    file_path: str, user, expires_in: int = 3600
-) -> Optional[str]:
+# Seconds a user's transaction statistics stay cached; writes that bypass
+# the Transaction signals are covered by this bound
+STATISTICS_CACHE_TIMEOUT = 60
+
+# Seconds the transaction list page count is reused across page and filter
+# requests; transaction changes invalidate it sooner
+TRANSACTION_COUNT_CACHE_TIMEOUT = 30
+
+# Seconds a user's active categories stay cached for the transaction pages;
+# category changes invalidate them sooner
+USER_CATEGORIES_CACHE_TIMEOUT = 60
+
+# Seconds a user's receipt storage usage stays cached; the scan lists every
+# stored receipt, and receipt uploads invalidate it sooner
+STORAGE_USAGE_CACHE_TIMEOUT = 5 * 60
+
+# Pre-signed URLs are reused for up to this many seconds, so repeated renders
+# of a receipt get the same URL and the browser can cache the download
+PRESIGNED_URL_WINDOW = 30 * 60
+
+
+def get_transaction_statistics_cache_key(user_id: int, date_from, date_to) -> str:
     """
-    Generate a secure pre-signed URL for file access with user validation.
+    Build the cache key for a user's transaction statistics.
+
+    The key embeds the user's statistics version, so bumping the version with
+    invalidate_transaction_statistics() retires every cached date range.
+
+    Args:
+        user_id (int): ID of the user
+        date_from: Start date filter, or None
+        date_to: End date filter, or None
+
+    Returns:
+        str: Cache key
+    """
+    version = cache.get(f"transaction_statistics_version_{user_id}")
+    return f"transaction_statistics_{user_id}_{version}_{date_from}_{date_to}"
+
+
+def get_user_categories(user) -> list:
+    """
+    Get a user's active categories ordered by name, cached between requests.
+
+    Args:
+        user (User): User whose categories to return
+
+    Returns:
+        list: Active categories ordered by name
+    """
+    return cache.get_or_set(
+        f"user_categories_{user.id}",
+        lambda: list(
+            Category.objects.filter(user=user, is_active=True).order_by("name")
+        ),
+        USER_CATEGORIES_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_user_categories(user_id: int) -> None:
+    """
+    Invalidate the cached categories of a user.
+
+    Args:
+        user_id (int): ID of the user whose categories changed
+    """
+    cache.delete(f"user_categories_{user_id}")
+
+
+def get_transaction_count_cache_key(user_id: int, params) -> str:
+    """
+    Build the cache key for the size of a user's filtered transaction list.
+
+    Like the statistics key, it embeds the user's statistics version, so any
+    transaction change retires the cached counts.
+
+    Args:
+        user_id (int): ID of the user
+        params: List query parameters; the page number is ignored
+
+    Returns:
+        str: Cache key
+    """
+    version = cache.get(f"transaction_statistics_version_{user_id}")
+    filters = sorted((key, value) for key, value in params.items() if key != "page")
+    filters_hash = hashlib.sha256(repr(filters).encode()).hexdigest()
+    return f"transaction_count_{user_id}_{version}_{filters_hash}"
+
+
+def invalidate_transaction_statistics(user_id: int) -> None:
+    """
+    Invalidate all cached transaction statistics for a user.
+
+    Args:
+        user_id (int): ID of the user whose transactions changed
+    """
+    cache.set(f"transaction_statistics_version_{user_id}", time.time_ns(), None)
+
+
+def get_presigned_url_reuse_window(expires_in: int) -> int:
+    """
+    Get how long a pre-signed URL with the given lifetime is reused.
+
+    URLs are signed for exactly expires_in seconds, so reuse is capped at
+    half of it. A reused URL therefore always has at least
+    expires_in minus this window left.
+
+    Args:
+        expires_in (int): Requested URL lifetime in seconds
+
+    Returns:
+        int: Seconds the signed URL is served from the cache
+    """
+    return max(1, min(PRESIGNED_URL_WINDOW, expires_in // 2))
+
+
+def _presigned_url_cache_key(file_path: str, user, expires_in: int) -> str:
+    """
+    Build the cache key for a user's pre-signed URL in the current window.
 
     Args:
         file_path (str): Path to the file in storage
         user (User): User requesting access
-        expires_in (int): URL expiration time in seconds (default: 1 hour)
+        expires_in (int): Requested URL lifetime in seconds
 
     Returns:
-        str: Pre-signed URL or None if access denied
+        str: Cache key that changes when the window rolls over
+    """
+    # Offset each user's windows so cached URLs do not all expire together
+    window = (int(time.time()) + user.id) // get_presigned_url_reuse_window(expires_in)
+    path_hash = hashlib.sha256(file_path.encode()).hexdigest()
+    return f"receipt-url:{user.id}:{expires_in}:{window}:{path_hash}"
+
+
+def _is_user_file_path(file_path: str, user_id: int) -> bool:
+    """
+    Check that a file path lives in a user's receipt directory.
+
+    Args:
+        file_path (str): Path to the file in storage
+        user_id (int): ID of the user expected to own the file
+
+    Returns:
+        bool: True if the path is under the user's receipt directory
+    """
+    return file_path.startswith(f"receipts/{user_id}/")
+
+
+def _sign_file_url(file_path: str, user, expires_in: int, sign) -> Optional[tuple]:
+    """
+    Sign a URL for a file once per window, reusing it until the window rolls.
+
+    Args:
+        file_path (str): Path to the file in storage
+        user (User): User requesting access
+        expires_in (int): URL expiration time in seconds
+        sign (callable): Called as sign(file_path, expires_in) to sign the URL
+
+    Returns:
+        tuple: Pre-signed URL and the seconds it stays valid, or None if
+            signing failed
 
     Raises:
         PermissionError: If user doesn't have access to the file
     """
     try:
-        # Get appropriate storage backend
-        storage = get_storage_backend()
-
-        # Generate pre-signed URL with user validation
-        url = storage.generate_presigned_url_for_user(file_path, user, expires_in)
+        # The URL never outlives expires_in; it is only reused for part of
+        # its lifetime, so the signing time is kept to report what is left
+        url, signed_at = cache.get_or_set(
+            _presigned_url_cache_key(file_path, user, expires_in),
+            lambda: (sign(file_path, expires_in), int(time.time())),
+            get_presigned_url_reuse_window(expires_in),
+        )
 
         logger.info(f"Generated secure URL for user {user.id}, file: {file_path}")
-        return url
+        return url, max(0, expires_in - (int(time.time()) - signed_at))
 
     except PermissionError:
         logger.warning(f"Access denied for user {user.id} to file: {file_path}")
@@ -52,6 +209,38 @@ def generate_secure_file_url(
         return None
 
 
+def generate_secure_file_url(
+    file_path: str, user, expires_in: int = 3600
+) -> Optional[str]:
+    """
+    Generate a secure pre-signed URL for file access with user validation.
+
+    Args:
+        file_path (str): Path to the file in storage
+        user (User): User requesting access
+        expires_in (int): URL expiration time in seconds (default: 1 hour)
+
+    Returns:
+        str: Pre-signed URL or None if access denied
+
+    Raises:
+        PermissionError: If user doesn't have access to the file
+    """
+    # Get appropriate storage backend
+    storage = get_storage_backend()
+
+    # Generate pre-signed URL with user validation
+    signed = _sign_file_url(
+        file_path,
+        user,
+        expires_in,
+        lambda path, seconds: storage.generate_presigned_url_for_user(
+            path, user, seconds
+        ),
+    )
+    return signed[0] if signed else None
+
+
 def get_user_receipt_url(
     transaction_id: int, user, expires_in: int = 3600
 ) -> Optional[str]:
@@ -66,6 +255,30 @@ def get_user_receipt_url(
     Returns:
         str: Pre-signed URL or None if not found/no access
 
+    Raises:
+        Http404: If transaction doesn't exist or user doesn't have access
+    """
+    signed = get_user_receipt_url_with_expiry(transaction_id, user, expires_in)
+    return signed[0] if signed else None
+
+
+def get_user_receipt_url_with_expiry(
+    transaction_id: int, user, expires_in: int = 3600
+) -> Optional[tuple]:
+    """
+    Get a secure URL for a transaction receipt and how long it stays valid.
+
+    A URL reused from the cache has less than expires_in seconds left.
+
+    Args:
+        transaction_id (int): ID of the transaction
+        user (User): User requesting access
+        expires_in (int): Longest URL lifetime in seconds
+
+    Returns:
+        tuple: Pre-signed URL and its remaining lifetime in seconds, or None
+            if there is no receipt or signing failed
+
     Raises:
         Http404: If transaction doesn't exist or user doesn't have access
     """
@@ -79,8 +292,17 @@ def get_user_receipt_url(
         if not transaction.receipt:
             return None
 
-        # Generate secure URL for the receipt
-        return generate_secure_file_url(transaction.receipt.name, user, expires_in)
+        # The query above already proved the user owns an active transaction
+        # referencing this receipt, so only the path check is repeated
+        file_path = transaction.receipt.name
+        if not _is_user_file_path(file_path, user.id):
+            logger.warning(f"Access denied for user {user.id} to file: {file_path}")
+            raise PermissionError("Access denied to this file")
+
+        storage = get_storage_backend()
+        return _sign_file_url(
+            file_path, user, expires_in, storage.generate_presigned_url
+        )
 
     except Transaction.DoesNotExist:
         raise Http404("Transaction not found")
@@ -99,13 +321,12 @@ def validate_file_ownership(file_path: str, user) -> bool:
     """
     try:
         # Check if file path starts with user's directory
-        expected_prefix = f"receipts/{user.id}/"
-        if not file_path.startswith(expected_prefix):
+        if not _is_user_file_path(file_path, user.id):
             return False
 
         # Verify the file is referenced by user's active transactions
         return Transaction.objects.filter(
-            user=user, receipt__icontains=file_path, is_active=True
+            user=user, receipt=file_path, is_active=True
         ).exists()
 
     except Exception as e:
@@ -169,39 +390,60 @@ def cleanup_transaction_receipt(transaction):
     Args:
         transaction (Transaction): Transaction being deleted
     """
-    try:
-        if not transaction.receipt:
-            return
+    cleanup_transaction_receipts([transaction])
 
-        file_path = transaction.receipt.name
 
-        # Check if any other active transactions reference this file
-        other_references = (
-            Transaction.objects.filter(receipt=transaction.receipt, is_active=True)
-            .exclude(id=transaction.id)
-            .exists()
+def cleanup_transaction_receipts(transactions) -> int:
+    """
+    Clean up receipt files for several deleted transactions at once.
+
+    Files still referenced by another active transaction are kept. One query
+    finds those references for the whole batch, and the storage backend
+    deletes the rest in bulk.
+
+    Args:
+        transactions (iterable): Transactions being deleted
+
+    Returns:
+        int: Number of receipt files deleted
+    """
+    transactions = [transaction for transaction in transactions if transaction.receipt]
+    if not transactions:
+        return 0
+
+    try:
+        receipt_paths = {transaction.receipt.name for transaction in transactions}
+
+        # Check if any other active transactions reference these files
+        still_referenced = set(
+            Transaction.objects.filter(receipt__in=receipt_paths, is_active=True)
+            .exclude(id__in=[transaction.id for transaction in transactions])
+            .values_list("receipt", flat=True)
         )
 
-        # Only delete if no other references exist
-        if not other_references:
-            # Get appropriate storage backend
-            storage = get_storage_backend()
-
-            # Delete the file
-            try:
-                storage.delete(file_path)
-                logger.info(f"Deleted receipt file: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to delete receipt file {file_path}: {e}")
-        else:
+        for file_path in receipt_paths & still_referenced:
             logger.info(
                 f"Receipt file {file_path} still referenced by other transactions"
             )
 
+        # Only delete files no other transaction references
+        orphaned_paths = receipt_paths - still_referenced
+        if not orphaned_paths:
+            return 0
+
+        # Get appropriate storage backend
+        storage = get_storage_backend()
+
+        deleted_count = storage.delete_many(sorted(orphaned_paths))
+        logger.info(f"Deleted {deleted_count} receipt files")
+        return deleted_count
+
     except Exception as e:
+        transaction_ids = [transaction.id for transaction in transactions]
         logger.error(
-            f"Error during receipt cleanup for transaction {transaction.id}: {e}"
+            f"Error during receipt cleanup for transactions {transaction_ids}: {e}"
         )
+        return 0
 
 
 def get_user_storage_usage(user) -> dict:
@@ -218,86 +460,54 @@ def get_user_storage_usage(user) -> dict:
         # Get appropriate storage backend
         storage = get_storage_backend()
 
-        stats = {
-            "total_files": 0,
-            "total_size": 0,
-            "oldest_file": None,
-            "newest_file": None,
-            "file_types": {},
-        }
+        # Collect raw values per object and reduce them once at the end; the
+        # builtins and Counter do the per-object work in C
+        sizes = []
+        dates = []
+        file_types = Counter()
 
         # Handle S3 storage
         if hasattr(storage, "s3_client"):
             user_prefix = f"receipts/{user.id}/"
-            continuation_token = None
-
-            while True:
-                list_params = {
-                    "Bucket": storage.bucket_name,
-                    "Prefix": user_prefix,
-                    "MaxKeys": 1000,
-                }
-
-                if continuation_token:
-                    list_params["ContinuationToken"] = continuation_token
-
-                response = storage.s3_client.list_objects_v2(**list_params)
-
-                if "Contents" not in response:
-                    break
-
-                for obj in response["Contents"]:
-                    stats["total_files"] += 1
-                    stats["total_size"] += obj["Size"]
+            paginator = storage.s3_client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
+                Bucket=storage.bucket_name,
+                Prefix=user_prefix,
+                PaginationConfig={"PageSize": S3_LIST_PAGE_SIZE},
+            )
 
-                    # Track oldest and newest files
-                    file_date = obj["LastModified"]
-                    if not stats["oldest_file"] or file_date < stats["oldest_file"]:
-                        stats["oldest_file"] = file_date
-                    if not stats["newest_file"] or file_date > stats["newest_file"]:
-                        stats["newest_file"] = file_date
+            for page in pages:
+                for obj in page.get("Contents", []):
+                    sizes.append(obj["Size"])
+                    dates.append(obj["LastModified"])
+                    file_types[obj["Key"].rpartition(".")[2].lower()] += 1
+        else:
+            # Handle local storage. scandir() entries carry their file type,
+            # so each file costs a single stat() call.
+            user_dir = os.path.join(storage.location, "receipts", str(user.id))
 
-                    # Track file types
-                    file_ext = obj["Key"].split(".")[-1].lower()
-                    stats["file_types"][file_ext] = (
-                        stats["file_types"].get(file_ext, 0) + 1
-                    )
+            if os.path.isdir(user_dir):
+                with os.scandir(user_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
 
-                # Check if there are more objects
-                if not response.get("IsTruncated"):
-                    break
+                        stat = entry.stat(follow_symlinks=False)
+                        sizes.append(stat.st_size)
+                        dates.append(datetime.fromtimestamp(stat.st_mtime))
 
-                continuation_token = response.get("NextContinuationToken")
-        else:
-            # Handle local storage
-            from pathlib import Path
+                        stem, _, suffix = entry.name.lstrip(".").rpartition(".")
+                        file_types[
+                            suffix.lower() if stem and suffix else "unknown"
+                        ] += 1
 
-            media_root = Path(storage.location)
-            user_dir = media_root / "receipts" / str(user.id)
-
-            if user_dir.exists():
-                for file_path in user_dir.iterdir():
-                    if file_path.is_file():
-                        stats["total_files"] += 1
-                        stat = file_path.stat()
-                        stats["total_size"] += stat.st_size
-
-                        # Track oldest and newest files
-                        file_date = datetime.fromtimestamp(stat.st_mtime)
-                        if not stats["oldest_file"] or file_date < stats["oldest_file"]:
-                            stats["oldest_file"] = file_date
-                        if not stats["newest_file"] or file_date > stats["newest_file"]:
-                            stats["newest_file"] = file_date
-
-                        # Track file types
-                        file_ext = (
-                            file_path.suffix[1:].lower()
-                            if file_path.suffix
-                            else "unknown"
-                        )
-                        stats["file_types"][file_ext] = (
-                            stats["file_types"].get(file_ext, 0) + 1
-                        )
+        stats = {
+            "total_files": len(sizes),
+            "total_size": sum(sizes),
+            "oldest_file": min(dates, default=None),
+            "newest_file": max(dates, default=None),
+            "file_types": dict(file_types),
+        }
 
         logger.info(f"Retrieved storage usage for user {user.id}: {stats}")
         return stats
@@ -312,3 +522,34 @@ def get_user_storage_usage(user) -> dict:
             "file_types": {},
             "error": str(e),
         }
+
+
+def get_cached_user_storage_usage(user) -> dict:
+    """
+    Get storage usage statistics for a user, cached between requests.
+
+    Failed scans are not cached, so the next request retries.
+
+    Args:
+        user (User): User to get statistics for
+
+    Returns:
+        dict: Storage usage statistics
+    """
+    cache_key = f"storage_usage_{user.id}"
+    stats = cache.get(cache_key)
+    if stats is None:
+        stats = get_user_storage_usage(user)
+        if "error" not in stats:
+            cache.set(cache_key, stats, STORAGE_USAGE_CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_user_storage_usage(user_id: int) -> None:
+    """
+    Invalidate the cached storage usage of a user.
+
+    Args:
+        user_id (int): ID of the user whose stored receipts changed
+    """
+    cache.delete(f"storage_usage_{user_id}")
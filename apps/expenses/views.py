@@ -1,5 +1,8 @@
-from decimal import Decimal
+import uuid
+from datetime import date
+from decimal import Decimal, InvalidOperation
 
+from celery.result import AsyncResult
 from django_filters import rest_framework as filters
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -8,15 +11,27 @@ from rest_framework.response import Response
 
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db import transaction as db_transaction
+from django.db.models import Count, Q, Sum
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, render
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django.views.decorators.http import require_http_methods
 from django.views.generic import CreateView, ListView
 
 from .forms import TransactionForm
+from .imports import (
+    IMPORT_ASYNC_THRESHOLD,
+    IMPORT_OWNER_CACHE_TIMEOUT,
+    get_import_owner_cache_key,
+    import_transaction_rows,
+    read_import_rows,
+    store_import_upload,
+)
 from .models import Category, Transaction
 from .serializers import (
     TransactionBulkDeleteSerializer,
@@ -25,7 +40,85 @@ from .serializers import (
     TransactionSerializer,
     TransactionStatisticsSerializer,
 )
-from .utils import get_user_receipt_url, get_user_storage_usage
+from .tasks import import_transactions
+from .utils import (
+    STATISTICS_CACHE_TIMEOUT,
+    TRANSACTION_COUNT_CACHE_TIMEOUT,
+    cleanup_transaction_receipts,
+    get_cached_user_storage_usage,
+    get_transaction_count_cache_key,
+    get_transaction_statistics_cache_key,
+    get_user_categories,
+    get_user_receipt_url_with_expiry,
+    invalidate_transaction_statistics,
+)
+
+# Seconds before a signed receipt URL expires that a browser must stop
+# reusing the cached receipt-url response
+RECEIPT_URL_EXPIRY_MARGIN = 30
+
+# Maximum transaction IDs bound into a single bulk delete UPDATE
+BULK_DELETE_BATCH_SIZE = 5000
+
+# Rows per UPDATE statement when editing transactions in bulk
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Bulk update payload fields that are set through a different model attribute;
+# category_id arrives as an already validated Category instance
+BULK_UPDATE_FIELD_ATTRS = {"category_id": "category"}
+
+# Columns read by TransactionSerializer, including the user's currency for
+# formatted_amount and the nested category
+TRANSACTION_READ_FIELDS = (
+    "id",
+    "user__id",
+    "user__currency",
+    "transaction_type",
+    "amount",
+    "category__id",
+    "category__name",
+    "category__parent",
+    "category__color",
+    "category__icon",
+    "category__is_active",
+    "category__created_at",
+    "category__updated_at",
+    "description",
+    "notes",
+    "merchant",
+    "date",
+    "receipt",
+    "is_recurring",
+    "recurring_frequency",
+    "recurring_interval",
+    "recurring_start_date",
+    "recurring_end_date",
+    "next_occurrence",
+    "parent_transaction",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+# Columns rendered by _transaction_row.html on the transaction list pages.
+# The plaintext amount_index mirror is shown instead of decrypting amount.
+TRANSACTION_ROW_FIELDS = (
+    "id",
+    "transaction_type",
+    "amount_index",
+    "category__id",
+    "category__name",
+    "description",
+    "notes",
+    "merchant",
+    "date",
+    "receipt",
+)
+
+# Expense categories listed individually in the statistics breakdown; the
+# rest are folded into a single "Other" entry to bound the response size
+STATISTICS_TOP_CATEGORIES = 20
+STATISTICS_OTHER_CATEGORY = "Other"
 
 
 class TransactionFilter(filters.FilterSet):
@@ -53,6 +146,19 @@ class TransactionFilter(filters.FilterSet):
             "is_recurring",
         ]
 
+    def get_form_class(self):
+        """
+        Return the filter form class, building it once per process.
+
+        django-filter rebuilds the form class (and every field label) on each
+        request; these filters never vary per request, so the class is reused.
+        """
+        form_class = type(self).__dict__.get("_form_class")
+        if form_class is None:
+            form_class = super().get_form_class()
+            type(self)._form_class = form_class
+        return form_class
+
 
 class TransactionViewSet(viewsets.ModelViewSet):
     """
@@ -76,34 +182,48 @@ class TransactionViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return transactions for the current user only."""
-        return Transaction.objects.filter(
-            user=self.request.user, is_active=True
-        ).select_related("category", "parent_transaction")
+        queryset = Transaction.objects.filter(user=self.request.user, is_active=True)
+
+        # Reads load only the serialized columns; writes keep whole rows
+        # because save() validates every field
+        if self.action in ("list", "retrieve"):
+            return queryset.select_related("user", "category").only(
+                *TRANSACTION_READ_FIELDS
+            )
+
+        return queryset.select_related("category", "parent_transaction")
 
     def perform_destroy(self, instance):
         """Soft delete by setting is_active to False."""
+        # Narrow UPDATE: skips full_clean() and re-encrypting fields. update()
+        # bypasses auto_now, so updated_at is set explicitly.
+        now = timezone.now()
+        Transaction.objects.filter(pk=instance.pk).update(
+            is_active=False, updated_at=now
+        )
         instance.is_active = False
-        instance.save()
+        instance.updated_at = now
+
+        # update() sends no post_save signals
+        invalidate_transaction_statistics(instance.user_id)
 
     @action(detail=False, methods=["post"], url_path="bulk-create")
     def bulk_create(self, request):
         """Bulk create multiple transactions."""
-        created_transactions = []
-        for transaction_data in request.data.get("transactions", []):
-            serializer = TransactionSerializer(
-                data=transaction_data, context={"request": request}
-            )
-            serializer.is_valid(raise_exception=True)
-            transaction = serializer.save()
-            created_transactions.append(transaction)
-
-        # Serialize the created transactions
-        transaction_serializer = TransactionSerializer(
-            created_transactions, many=True, context={"request": request}
+        # Validate every transaction before inserting any of them
+        serializer = TransactionSerializer(
+            data=request.data.get("transactions", []),
+            many=True,
+            context={"request": request},
         )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        # bulk_create() sends no post_save signals
+        invalidate_transaction_statistics(request.user.id)
 
         return Response(
-            {"transactions": transaction_serializer.data},
+            {"transactions": serializer.data},
             status=status.HTTP_201_CREATED,
         )
 
@@ -127,38 +247,16 @@ class TransactionViewSet(viewsets.ModelViewSet):
         if date_to:
             queryset = queryset.filter(date__lte=date_to)
 
-        # Calculate statistics in Python since encrypted fields can't use aggregation
-        expenses = queryset.filter(transaction_type=Transaction.EXPENSE)
-        income = queryset.filter(transaction_type=Transaction.INCOME)
-
-        # Calculate totals in Python
-        total_expenses = sum(expense.amount for expense in expenses) or Decimal("0")
-        total_income = sum(inc.amount for inc in income) or Decimal("0")
-
-        # Category breakdown for expenses
-        category_breakdown = {}
-        for expense in expenses:
-            if expense.category and expense.category.name:
-                category_name = expense.category.name
-                if category_name not in category_breakdown:
-                    category_breakdown[category_name] = Decimal("0")
-                category_breakdown[category_name] += expense.amount
-
-        # Convert to strings for JSON serialization
-        for name, amount in category_breakdown.items():
-            category_breakdown[name] = str(amount)
-
-        # Prepare response data
-        data = {
-            "total_expenses": str(total_expenses),
-            "total_income": str(total_income),
-            "net_amount": str(total_income - total_expenses),
-            "transaction_count": queryset.count(),
-            "expense_count": expenses.count(),
-            "income_count": income.count(),
-            "category_breakdown": category_breakdown,
-        }
+        cache_key = get_transaction_statistics_cache_key(
+            request.user.id, date_from, date_to
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._compute_statistics(queryset)
+            cache.set(cache_key, data, STATISTICS_CACHE_TIMEOUT)
 
+        # Echo the requested range back without storing it in the cache entry
+        data = dict(data)
         if date_from:
             data["date_from"] = date_from
         if date_to:
@@ -167,102 +265,114 @@ class TransactionViewSet(viewsets.ModelViewSet):
         serializer = TransactionStatisticsSerializer(data)
         return Response(serializer.data)
 
+    def _compute_statistics(self, queryset):
+        """
+        Compute totals, counts and the expense category breakdown.
+
+        Args:
+            queryset: Transactions to summarize
+
+        Returns:
+            dict: Statistics ready for TransactionStatisticsSerializer
+        """
+        # Aggregate over amount_index, the plaintext mirror of the encrypted
+        # amount, so the database computes totals without decrypting rows.
+        # One GROUP BY yields a handful of rows from which the totals, counts
+        # and category breakdown are all derived.
+        groups = (
+            queryset.order_by()
+            .values("transaction_type", "category__name")
+            .annotate(
+                total=Sum("amount_index", default=Decimal("0")), count=Count("id")
+            )
+        )
+
+        total_expenses = Decimal("0")
+        total_income = Decimal("0")
+        transaction_count = 0
+        expense_count = 0
+        income_count = 0
+        category_totals = {}
+
+        for group in groups:
+            transaction_count += group["count"]
+            if group["transaction_type"] == Transaction.EXPENSE:
+                total_expenses += group["total"]
+                expense_count += group["count"]
+                if group["category__name"]:
+                    category_totals[group["category__name"]] = group["total"]
+            elif group["transaction_type"] == Transaction.INCOME:
+                total_income += group["total"]
+                income_count += group["count"]
+
+        # Category breakdown for expenses: the largest categories, with the
+        # remainder summed into one bucket
+        ranked = sorted(category_totals.items(), key=lambda item: -item[1])
+        top_categories = dict(ranked[:STATISTICS_TOP_CATEGORIES])
+        remaining = ranked[STATISTICS_TOP_CATEGORIES:]
+        if remaining:
+            top_categories[STATISTICS_OTHER_CATEGORY] = top_categories.get(
+                STATISTICS_OTHER_CATEGORY, Decimal("0")
+            ) + sum((total for _, total in remaining), Decimal("0"))
+        category_breakdown = {
+            name: str(total) for name, total in top_categories.items()
+        }
+
+        return {
+            "total_expenses": str(total_expenses),
+            "total_income": str(total_income),
+            "net_amount": str(total_income - total_expenses),
+            "transaction_count": transaction_count,
+            "expense_count": expense_count,
+            "income_count": income_count,
+            "category_breakdown": category_breakdown,
+        }
+
     @action(detail=False, methods=["post"], url_path="import-csv")
     def import_csv(self, request):
-        """Import transactions from CSV/Excel file."""
-        import csv
-        import io
-        from decimal import Decimal, InvalidOperation
+        """
+        Import transactions from CSV/Excel file.
 
+        Files larger than IMPORT_ASYNC_THRESHOLD are imported by a Celery
+        task; the response is then 202 Accepted with a status URL to poll.
+        """
         serializer = TransactionCSVImportSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         uploaded_file = serializer.validated_data["file"]
 
+        if uploaded_file.size > IMPORT_ASYNC_THRESHOLD:
+            # The upload only lives for this request, so it is stored for the
+            # task to stream rather than parsed here
+            file_path = store_import_upload(uploaded_file, request.user.id)
+            task_id = uuid.uuid4().hex
+
+            # Recorded before queueing so the owner is known whatever state
+            # the task ends in
+            cache.set(
+                get_import_owner_cache_key(task_id),
+                request.user.id,
+                IMPORT_OWNER_CACHE_TIMEOUT,
+            )
+            import_transactions.apply_async(
+                args=[request.user.id, file_path], task_id=task_id
+            )
+            return Response(
+                {
+                    "task_id": task_id,
+                    "status_url": reverse(
+                        "api:transaction-import-status", args=[task_id]
+                    ),
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        rows = read_import_rows(uploaded_file)
+
         try:
-            # Handle different file types
-            if uploaded_file.name.lower().endswith(".csv"):
-                # CSV file handling
-                file_content = uploaded_file.read().decode("utf-8")
-                csv_reader = csv.DictReader(io.StringIO(file_content))
-            elif uploaded_file.name.lower().endswith((".xlsx", ".xls")):
-                # Excel file handling
-                import openpyxl
-
-                workbook = openpyxl.load_workbook(uploaded_file)
-                sheet = workbook.active
-
-                # Get headers from first row
-                headers = [cell.value for cell in sheet[1]]
-                csv_reader = []
-
-                # Convert Excel rows to dictionary format
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    row_dict = dict(zip(headers, row))
-                    csv_reader.append(row_dict)
-
-            imported_count = 0
-            errors = []
-
-            for row_number, row in enumerate(csv_reader, start=2):
-                try:
-                    # Clean and prepare data
-                    transaction_data = {}
-
-                    # Required fields
-                    if row.get("date"):
-                        from datetime import datetime
-
-                        if isinstance(row["date"], str):
-                            transaction_data["date"] = datetime.strptime(
-                                row["date"], "%Y-%m-%d"
-                            ).date()
-                        else:
-                            transaction_data["date"] = row["date"]
-
-                    if row.get("amount"):
-                        try:
-                            transaction_data["amount"] = Decimal(str(row["amount"]))
-                        except (InvalidOperation, ValueError):
-                            raise ValueError(f"Invalid amount: {row['amount']}")
-
-                    transaction_data["description"] = row.get("description", "")
-                    transaction_data["transaction_type"] = row.get(
-                        "transaction_type", "expense"
-                    )
-                    transaction_data["merchant"] = row.get("merchant", "")
-                    transaction_data["notes"] = row.get("notes", "")
-
-                    # Handle category by name
-                    category_name = row.get("category_name", "").strip()
-                    if (
-                        category_name
-                        and transaction_data["transaction_type"] == "expense"
-                    ):
-                        try:
-                            category = Category.objects.get(
-                                user=request.user, name=category_name, is_active=True
-                            )
-                            transaction_data["category_id"] = category.id
-                        except Category.DoesNotExist:
-                            raise ValueError(f"Category '{category_name}' not found")
-
-                    # Validate using serializer
-                    transaction_serializer = TransactionSerializer(
-                        data=transaction_data, context={"request": request}
-                    )
-                    transaction_serializer.is_valid(raise_exception=True)
-                    transaction_serializer.save()
-                    imported_count += 1
-
-                except Exception as e:
-                    errors.append(
-                        {
-                            "row": row_number,
-                            "error": str(e),
-                            "data": dict(row) if hasattr(row, "items") else row,
-                        }
-                    )
+            imported_count, errors = import_transaction_rows(
+                rows, request.user, {"request": request}
+            )
 
             # Return response based on results
             if errors and imported_count == 0:
@@ -285,6 +395,38 @@ class TransactionViewSet(viewsets.ModelViewSet):
                 {"error": f"File processing error: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        finally:
+            rows.close()
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"import-status/(?P<task_id>[^/.]+)",
+    )
+    def import_status(self, request, task_id=None):
+        """Report the progress or outcome of a queued transaction import."""
+        # The owner is recorded when the import is queued; a failed task's
+        # result holds the exception instead of the task's metadata
+        owner_id = cache.get(get_import_owner_cache_key(task_id))
+        if owner_id != request.user.id:
+            return Response(
+                {"error": "Import not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        result = AsyncResult(task_id, app=import_transactions.app)
+        info = result.info if isinstance(result.info, dict) else {}
+
+        response_data = {"task_id": task_id, "state": result.state}
+        if result.state == "PROGRESS":
+            response_data["processed"] = info.get("processed", 0)
+        elif result.state == "SUCCESS":
+            for key in ("imported_count", "error_count", "errors", "error"):
+                if key in info:
+                    response_data[key] = info[key]
+        elif result.state == "FAILURE":
+            response_data["error"] = "Import failed"
+
+        return Response(response_data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["post"], url_path="import-excel")
     def import_excel(self, request):
@@ -304,30 +446,51 @@ class TransactionViewSet(viewsets.ModelViewSet):
         updated_count = 0
         errors = []
 
+        # Load every targeted transaction in one query
+        transactions = Transaction.objects.filter(
+            user=request.user, is_active=True
+        ).in_bulk([update_data["id"] for update_data in updates])
+
+        changed_transactions = []
+        changed_fields = {"amount_index", "next_occurrence", "updated_at"}
+        now = timezone.now()
+
         for update_data in updates:
             transaction_id = update_data.pop("id")
-            try:
-                transaction = Transaction.objects.get(
-                    id=transaction_id, user=request.user, is_active=True
+            transaction = transactions.get(transaction_id)
+            if transaction is None:
+                errors.append(
+                    {"transaction_id": transaction_id, "error": "Transaction not found"}
                 )
+                continue
 
+            try:
                 # Update fields
                 for field, value in update_data.items():
-                    if field == "category_id":
-                        transaction.category = value
-                    else:
-                        setattr(transaction, field, value)
-
-                transaction.save()
+                    attr = BULK_UPDATE_FIELD_ATTRS.get(field, field)
+                    setattr(transaction, attr, value)
+                    changed_fields.add(attr)
+
+                # The category was checked against the user's own categories
+                # by the serializer; bulk_update() skips auto_now
+                transaction.prepare_for_save(exclude=["user", "category"])
+                transaction.updated_at = now
+                changed_transactions.append(transaction)
                 updated_count += 1
 
-            except Transaction.DoesNotExist:
-                errors.append(
-                    {"transaction_id": transaction_id, "error": "Transaction not found"}
-                )
             except Exception as e:
                 errors.append({"transaction_id": transaction_id, "error": str(e)})
 
+        if changed_transactions:
+            Transaction.objects.bulk_update(
+                changed_transactions,
+                sorted(changed_fields),
+                batch_size=BULK_UPDATE_BATCH_SIZE,
+            )
+
+            # bulk_update() sends no post_save signals
+            invalidate_transaction_statistics(request.user.id)
+
         response_data = {"updated_count": updated_count}
         if errors:
             response_data["errors"] = errors
@@ -342,10 +505,34 @@ class TransactionViewSet(viewsets.ModelViewSet):
 
         transaction_ids = serializer.validated_data["transaction_ids"]
 
-        # Only delete user's own transactions
-        deleted_count = Transaction.objects.filter(
-            id__in=transaction_ids, user=request.user, is_active=True
-        ).update(is_active=False)
+        # Only delete user's own transactions, in batches that stay within
+        # the database's query parameter limit
+        deleted_count = 0
+        with_receipts = []
+        with db_transaction.atomic():
+            for start in range(0, len(transaction_ids), BULK_DELETE_BATCH_SIZE):
+                batch = Transaction.objects.filter(
+                    id__in=transaction_ids[start : start + BULK_DELETE_BATCH_SIZE],
+                    user=request.user,
+                    is_active=True,
+                )
+                with_receipts.extend(
+                    batch.exclude(receipt="")
+                    .exclude(receipt__isnull=True)
+                    .only("id", "receipt")
+                )
+                deleted_count += batch.update(is_active=False)
+
+            # Remove the receipt files in one pass once the delete is
+            # committed, so a rollback never loses them
+            if with_receipts:
+                db_transaction.on_commit(
+                    lambda: cleanup_transaction_receipts(with_receipts)
+                )
+
+        # update() sends no post_save signals
+        if deleted_count:
+            invalidate_transaction_statistics(request.user.id)
 
         return Response({"deleted_count": deleted_count}, status=status.HTTP_200_OK)
 
@@ -371,17 +558,26 @@ class TransactionViewSet(viewsets.ModelViewSet):
                 expires_in = 60
 
             # Get secure URL for the receipt
-            url = get_user_receipt_url(pk, request.user, expires_in)
+            signed = get_user_receipt_url_with_expiry(pk, request.user, expires_in)
 
-            if url:
-                return Response(
+            if signed:
+                url, seconds_left = signed
+                response = Response(
                     {
                         "receipt_url": url,
-                        "expires_in": expires_in,
+                        "expires_in": seconds_left,
                         "transaction_id": pk,
                     },
                     status=status.HTTP_200_OK,
                 )
+                # The browser may reuse this response until shortly before the
+                # signed URL expires
+                patch_cache_control(
+                    response,
+                    private=True,
+                    max_age=max(0, seconds_left - RECEIPT_URL_EXPIRY_MARGIN),
+                )
+                return response
             else:
                 return Response(
                     {"error": "No receipt found for this transaction"},
@@ -412,7 +608,7 @@ class TransactionViewSet(viewsets.ModelViewSet):
             Response with storage usage information
         """
         try:
-            usage_stats = get_user_storage_usage(request.user)
+            usage_stats = get_cached_user_storage_usage(request.user)
 
             return Response(
                 {"user_id": request.user.id, "storage_usage": usage_stats},
@@ -457,9 +653,7 @@ class TransactionCreateView(LoginRequiredMixin, CreateView):
         context = super().get_context_data(**kwargs)
 
         # Add user's categories for the form
-        context["categories"] = Category.objects.filter(
-            user=self.request.user, is_active=True
-        ).order_by("name")
+        context["categories"] = get_user_categories(self.request.user)
 
         return context
 
@@ -492,6 +686,100 @@ class TransactionCreateView(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
 
 
+def parse_transaction_filters(params):
+    """
+    Parse the transaction list's filter parameters into lookups.
+
+    Malformed values are ignored rather than rejected, as the list page's
+    filter form submits on every change.
+
+    Args:
+        params: Query parameters (usually request.GET)
+
+    Returns:
+        dict: Field lookups to pass to QuerySet.filter()
+    """
+    lookups = {}
+
+    category_id = params.get("category")
+    if category_id:
+        try:
+            lookups["category_id"] = int(category_id)
+        except (ValueError, TypeError):
+            pass
+
+    for param, lookup, parse in (
+        ("date_after", "date__gte", date.fromisoformat),
+        ("date_before", "date__lte", date.fromisoformat),
+        ("amount_min", "amount_index__gte", Decimal),
+        ("amount_max", "amount_index__lte", Decimal),
+    ):
+        value = params.get(param)
+        if value:
+            try:
+                lookups[lookup] = parse(value)
+            except (InvalidOperation, ValueError, TypeError):
+                pass
+
+    transaction_type = params.get("transaction_type")
+    if transaction_type in [
+        Transaction.EXPENSE,
+        Transaction.INCOME,
+        Transaction.TRANSFER,
+    ]:
+        lookups["transaction_type"] = transaction_type
+
+    return lookups
+
+
+def apply_transaction_filters(queryset, params):
+    """
+    Apply the transaction list's search and filter parameters.
+
+    Args:
+        queryset: Transactions to filter
+        params: Query parameters (usually request.GET)
+
+    Returns:
+        QuerySet: Filtered transactions
+    """
+    # The description match is backed by a trigram index on PostgreSQL
+    search_query = params.get("search", "").strip()
+    if search_query:
+        queryset = queryset.filter(
+            Q(description__icontains=search_query)
+            | Q(merchant__icontains=search_query)
+            | Q(notes__icontains=search_query)
+        )
+
+    lookups = parse_transaction_filters(params)
+    return queryset.filter(**lookups) if lookups else queryset
+
+
+def cached_count_paginator(request, queryset, per_page):
+    """
+    Build a paginator that reuses the filtered list's COUNT(*).
+
+    The transaction list re-renders on every page change and filter edit;
+    the count only changes when the filters or the user's transactions do.
+
+    Args:
+        request: Current request, providing the user and filters
+        queryset: Filtered transactions to paginate
+        per_page (int): Transactions per page
+
+    Returns:
+        Paginator: Paginator with its count filled in
+    """
+    paginator = Paginator(queryset, per_page)
+    paginator.count = cache.get_or_set(
+        get_transaction_count_cache_key(request.user.id, request.GET),
+        queryset.count,
+        TRANSACTION_COUNT_CACHE_TIMEOUT,
+    )
+    return paginator
+
+
 class TransactionListView(LoginRequiredMixin, ListView):
     """
     Frontend view for displaying paginated list of transactions.
@@ -513,76 +801,23 @@ class TransactionListView(LoginRequiredMixin, ListView):
         """Return filtered and ordered transactions for the current user."""
         queryset = (
             Transaction.objects.filter(user=self.request.user, is_active=True)
-            .select_related("category", "parent_transaction")
+            .select_related("category")
+            .only(*TRANSACTION_ROW_FIELDS)
             .order_by("-date", "-created_at")
         )
 
-        # Apply search filter
-        search_query = self.request.GET.get("search", "").strip()
-        if search_query:
-            queryset = queryset.filter(
-                Q(description__icontains=search_query)
-                | Q(merchant__icontains=search_query)
-                | Q(notes__icontains=search_query)
-            )
-
-        # Apply category filter
-        category_id = self.request.GET.get("category")
-        if category_id:
-            try:
-                queryset = queryset.filter(category_id=int(category_id))
-            except (ValueError, TypeError):
-                pass
+        return apply_transaction_filters(queryset, self.request.GET)
 
-        # Apply date range filters
-        date_after = self.request.GET.get("date_after")
-        if date_after:
-            try:
-                queryset = queryset.filter(date__gte=date_after)
-            except ValueError:
-                pass
-
-        date_before = self.request.GET.get("date_before")
-        if date_before:
-            try:
-                queryset = queryset.filter(date__lte=date_before)
-            except ValueError:
-                pass
-
-        # Apply amount range filters
-        amount_min = self.request.GET.get("amount_min")
-        if amount_min:
-            try:
-                queryset = queryset.filter(amount_index__gte=Decimal(amount_min))
-            except (ValueError, TypeError):
-                pass
-
-        amount_max = self.request.GET.get("amount_max")
-        if amount_max:
-            try:
-                queryset = queryset.filter(amount_index__lte=Decimal(amount_max))
-            except (ValueError, TypeError):
-                pass
-
-        # Apply transaction type filter
-        transaction_type = self.request.GET.get("transaction_type")
-        if transaction_type in [
-            Transaction.EXPENSE,
-            Transaction.INCOME,
-            Transaction.TRANSFER,
-        ]:
-            queryset = queryset.filter(transaction_type=transaction_type)
-
-        return queryset
+    def get_paginator(self, queryset, per_page, *args, **kwargs):
+        """Return a paginator whose total count comes from the cache."""
+        return cached_count_paginator(self.request, queryset, per_page)
 
     def get_context_data(self, **kwargs):
         """Add additional context data for the template."""
         context = super().get_context_data(**kwargs)
 
         # Add user's categories for filter dropdown
-        context["categories"] = Category.objects.filter(
-            user=self.request.user, is_active=True
-        ).order_by("name")
+        context["categories"] = get_user_categories(self.request.user)
 
         # Add current filter values to context
         context["search_query"] = self.request.GET.get("search", "")
@@ -622,9 +857,7 @@ def transaction_edit_form_partial(request, pk):
     transaction = get_object_or_404(
         Transaction, pk=pk, user=request.user, is_active=True
     )
-    categories = Category.objects.filter(user=request.user, is_active=True).order_by(
-        "name"
-    )
+    categories = get_user_categories(request.user)
 
     return render(
         request,
@@ -664,9 +897,7 @@ def transaction_update_htmx(request, pk):
         # Handle date
         date_str = request.POST.get("date", "").strip()
         if date_str:
-            from datetime import datetime
-
-            transaction.date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            transaction.date = date.fromisoformat(date_str)
 
         # Handle category (only for expenses)
         if transaction.transaction_type == Transaction.EXPENSE:
@@ -718,68 +949,14 @@ def transaction_filter_partial(request):
     # Use the same filtering logic as TransactionListView
     queryset = (
         Transaction.objects.filter(user=request.user, is_active=True)
-        .select_related("category", "parent_transaction")
+        .select_related("category")
+        .only(*TRANSACTION_ROW_FIELDS)
         .order_by("-date", "-created_at")
     )
-
-    # Apply search filter
-    search_query = request.GET.get("search", "").strip()
-    if search_query:
-        queryset = queryset.filter(
-            Q(description__icontains=search_query)
-            | Q(merchant__icontains=search_query)
-            | Q(notes__icontains=search_query)
-        )
-
-    # Apply category filter
-    category_id = request.GET.get("category")
-    if category_id:
-        try:
-            queryset = queryset.filter(category_id=int(category_id))
-        except (ValueError, TypeError):
-            pass
-
-    # Apply date range filters
-    date_after = request.GET.get("date_after")
-    if date_after:
-        try:
-            queryset = queryset.filter(date__gte=date_after)
-        except ValueError:
-            pass
-
-    date_before = request.GET.get("date_before")
-    if date_before:
-        try:
-            queryset = queryset.filter(date__lte=date_before)
-        except ValueError:
-            pass
-
-    # Apply amount range filters
-    amount_min = request.GET.get("amount_min")
-    if amount_min:
-        try:
-            queryset = queryset.filter(amount_index__gte=Decimal(amount_min))
-        except (ValueError, TypeError):
-            pass
-
-    amount_max = request.GET.get("amount_max")
-    if amount_max:
-        try:
-            queryset = queryset.filter(amount_index__lte=Decimal(amount_max))
-        except (ValueError, TypeError):
-            pass
-
-    # Apply transaction type filter
-    transaction_type = request.GET.get("transaction_type")
-    if transaction_type in [
-        Transaction.EXPENSE,
-        Transaction.INCOME,
-        Transaction.TRANSFER,
-    ]:
-        queryset = queryset.filter(transaction_type=transaction_type)
+    queryset = apply_transaction_filters(queryset, request.GET)
 
     # Apply pagination
-    paginator = Paginator(queryset, 20)
+    paginator = cached_count_paginator(request, queryset, 20)
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
 
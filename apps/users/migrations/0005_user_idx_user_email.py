@@ -0,0 +1,16 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0004_alter_user_totp_secret"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["email"], name="idx_user_email"),
+        ),
+    ]
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 import pytz
 
 from django.contrib.auth.models import AbstractUser
@@ -28,10 +31,24 @@ CURRENCY_CHOICES = [
 
 def validate_timezone(value):
     """Validate that the timezone is a valid pytz timezone."""
-    if value not in pytz.all_timezones:
+    # all_timezones is a list; the set gives a hash lookup
+    if value not in pytz.all_timezones_set:
         raise ValidationError(f"{value} is not a valid timezone")
 
 
+def hash_backup_code(code):
+    """
+    Return the SHA-256 hex digest stored for a 2FA backup code.
+
+    Args:
+        code (str): Backup code as shown to or entered by the user
+
+    Returns:
+        str: Hex digest of the normalized code
+    """
+    return hashlib.sha256(code.strip().upper().encode()).hexdigest()
+
+
 class User(AbstractUser):
     """
     Custom User model extending Django's AbstractUser.
@@ -82,6 +99,47 @@ class User(AbstractUser):
         db_table = "users_user"
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            # EmailBackend and registration look users up by email, which
+            # AbstractUser leaves unindexed. Not unique: email may be blank.
+            models.Index(fields=["email"], name="idx_user_email"),
+        ]
+
+    def set_backup_codes(self, codes):
+        """
+        Replace the user's 2FA backup codes.
+
+        Only digests are stored, so the plain codes can be shown once and
+        never recovered from the database.
+
+        Args:
+            codes (list): Plain backup codes
+        """
+        self.backup_codes = json.dumps([hash_backup_code(code) for code in codes])
+        self.save(update_fields=["backup_codes"])
+
+    def use_backup_code(self, code):
+        """
+        Redeem a 2FA backup code, removing it so it cannot be used again.
+
+        Args:
+            code (str): Backup code entered by the user
+
+        Returns:
+            bool: True if the code was valid and unused
+        """
+        if not self.backup_codes:
+            return False
+
+        digests = json.loads(self.backup_codes)
+        digest = hash_backup_code(code)
+        if digest not in digests:
+            return False
+
+        digests.remove(digest)
+        self.backup_codes = json.dumps(digests)
+        self.save(update_fields=["backup_codes"])
+        return True
 
 
 class UserProfile(models.Model):
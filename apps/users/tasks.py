@@ -0,0 +1,60 @@
+"""
+Celery tasks for user account emails.
+"""
+
+import logging
+
+from celery import shared_task
+
+from django.core.mail import send_mail
+from django.template.loader import render_to_string
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+# Subject line of the account verification email
+VERIFICATION_EMAIL_SUBJECT = "Verify your Personal Finance Dashboard account"
+
+
+@shared_task(bind=True, max_retries=3)
+def deliver_verification_email(self, user_id: int, verification_url: str) -> bool:
+    """
+    Send an account verification email outside the request.
+
+    Args:
+        user_id: ID of the user to verify
+        verification_url: Absolute verification link built by the view
+
+    Returns:
+        bool: True if the email was sent, False if the user no longer exists
+    """
+    try:
+        user = User.objects.get(id=user_id)
+    except User.DoesNotExist:
+        logger.warning(f"Skipping verification email for missing user {user_id}")
+        return False
+
+    # The template engine's cached loader keeps the compiled template
+    message = render_to_string(
+        "registration/verification_email.txt",
+        {
+            "user": user,
+            "verification_url": verification_url,
+        },
+    )
+
+    try:
+        send_mail(
+            subject=VERIFICATION_EMAIL_SUBJECT,
+            message=message,
+            from_email=None,  # Use default
+            recipient_list=[user.email],
+            fail_silently=False,
+        )
+    except Exception as exc:
+        logger.error(f"Verification email to user {user_id} failed: {exc}")
+        # Retry with exponential backoff
+        raise self.retry(exc=exc, countdown=60 * (2**self.request.retries))
+
+    return True
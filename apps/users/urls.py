@@ -7,12 +7,57 @@ from django.contrib.auth.views import (
     PasswordResetConfirmView,
     PasswordResetDoneView,
 )
-from django.urls import path
+from django.urls import include, path
 
 from . import views
 
 app_name = "users"
 
+# Routes sharing a prefix are mounted with include(), so the resolver skips
+# the whole group when the prefix does not match. The names stay in the
+# "users" namespace.
+password_reset_patterns = [
+    path("", views.PasswordResetView.as_view(), name="password_reset"),
+    path(
+        "done/",
+        PasswordResetDoneView.as_view(
+            template_name="registration/password_reset_done.html"
+        ),
+        name="password_reset_done",
+    ),
+    path(
+        "confirm/<uidb64>/<token>/",
+        PasswordResetConfirmView.as_view(
+            template_name="registration/password_reset_confirm.html",
+            success_url="/auth/password-reset/complete/",
+        ),
+        name="password_reset_confirm",
+    ),
+    path(
+        "complete/",
+        PasswordResetCompleteView.as_view(
+            template_name="registration/password_reset_complete.html"
+        ),
+        name="password_reset_complete",
+    ),
+]
+
+two_factor_patterns = [
+    path("setup/", views.TwoFactorSetupView.as_view(), name="2fa_setup"),
+    path("verify/", views.TwoFactorVerifyView.as_view(), name="2fa_verify"),
+    path("disable/", views.TwoFactorDisableView.as_view(), name="2fa_disable"),
+    path(
+        "disabled-success/",
+        views.TwoFactorDisabledSuccessView.as_view(),
+        name="2fa_disabled_success",
+    ),
+    path(
+        "backup-codes/",
+        views.TwoFactorBackupCodesView.as_view(),
+        name="2fa_backup_codes",
+    ),
+]
+
 urlpatterns = [
     # Registration
     path("register/", views.RegisterView.as_view(), name="register"),
@@ -51,43 +96,9 @@ urlpatterns = [
     path("logout/", views.LogoutView.as_view(), name="logout"),
     path("logout-success/", views.LogoutSuccessView.as_view(), name="logout_success"),
     # Password Reset
-    path("password-reset/", views.PasswordResetView.as_view(), name="password_reset"),
-    path(
-        "password-reset/done/",
-        PasswordResetDoneView.as_view(
-            template_name="registration/password_reset_done.html"
-        ),
-        name="password_reset_done",
-    ),
-    path(
-        "password-reset/confirm/<uidb64>/<token>/",
-        PasswordResetConfirmView.as_view(
-            template_name="registration/password_reset_confirm.html",
-            success_url="/auth/password-reset/complete/",
-        ),
-        name="password_reset_confirm",
-    ),
-    path(
-        "password-reset/complete/",
-        PasswordResetCompleteView.as_view(
-            template_name="registration/password_reset_complete.html"
-        ),
-        name="password_reset_complete",
-    ),
+    path("password-reset/", include(password_reset_patterns)),
     # Two-Factor Authentication
-    path("2fa/setup/", views.TwoFactorSetupView.as_view(), name="2fa_setup"),
-    path("2fa/verify/", views.TwoFactorVerifyView.as_view(), name="2fa_verify"),
-    path("2fa/disable/", views.TwoFactorDisableView.as_view(), name="2fa_disable"),
-    path(
-        "2fa/disabled-success/",
-        views.TwoFactorDisabledSuccessView.as_view(),
-        name="2fa_disabled_success",
-    ),
-    path(
-        "2fa/backup-codes/",
-        views.TwoFactorBackupCodesView.as_view(),
-        name="2fa_backup_codes",
-    ),
+    path("2fa/", include(two_factor_patterns)),
     # Profile and Settings (temporary placeholder views)
     path("profile/", views.ProfileView.as_view(), name="profile"),
     path("settings/", views.SettingsView.as_view(), name="settings"),
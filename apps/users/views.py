@@ -4,7 +4,6 @@ User authentication views.
 
 import base64
 import io
-import json
 import secrets
 
 import pyotp
@@ -15,9 +14,7 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth.views import PasswordResetView as BasePasswordResetView
-from django.core.mail import send_mail
 from django.shortcuts import get_object_or_404, redirect, render
-from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
 from django.utils.decorators import method_decorator
 from django.utils.encoding import force_bytes, force_str
@@ -33,6 +30,32 @@ from .forms import (
     UserRegistrationForm,
 )
 from .models import User
+from .tasks import deliver_verification_email
+
+# Number of 2FA backup codes issued at a time
+BACKUP_CODE_COUNT = 10
+
+# Hex characters per 2FA backup code
+BACKUP_CODE_LENGTH = 8
+
+
+def send_verification_email(request, user):
+    """
+    Queue an email verification link for a newly registered user.
+
+    Args:
+        request: Current request, used to build the absolute link
+        user (User): Inactive user to verify
+    """
+    token = default_token_generator.make_token(user)
+    uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
+
+    verification_url = request.build_absolute_uri(
+        reverse("users:verify_email", kwargs={"uidb64": uidb64, "token": token})
+    )
+
+    # SMTP runs in a worker, so the response does not wait on the mail server
+    deliver_verification_email.delay(user.pk, verification_url)
 
 
 class RegisterView(View):
@@ -57,38 +80,12 @@ class RegisterView(View):
             user.save()
 
             # Send verification email
-            self._send_verification_email(request, user)
+            send_verification_email(request, user)
 
             return redirect(reverse("users:registration_sent"))
 
         return render(request, self.template_name, {"form": form})
 
-    def _send_verification_email(self, request, user):
-        """Send email verification link to user."""
-        token = default_token_generator.make_token(user)
-        uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
-
-        verification_url = request.build_absolute_uri(
-            reverse("users:verify_email", kwargs={"uidb64": uidb64, "token": token})
-        )
-
-        subject = "Verify your Personal Finance Dashboard account"
-        message = render_to_string(
-            "registration/verification_email.txt",
-            {
-                "user": user,
-                "verification_url": verification_url,
-            },
-        )
-
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=None,  # Use default
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
-
 
 class EmailVerificationView(View):
     """Email verification view."""
@@ -214,7 +211,7 @@ class ResendVerificationView(View):
                 user = User.objects.get(email=email)
                 if not user.is_active:
                     # Resend verification email
-                    self._send_verification_email(request, user)
+                    send_verification_email(request, user)
                     return redirect(reverse("users:registration_sent"))
                 else:
                     form.add_error("email", "This account is already verified.")
@@ -223,32 +220,6 @@ class ResendVerificationView(View):
 
         return render(request, self.template_name, {"form": form})
 
-    def _send_verification_email(self, request, user):
-        """Send email verification link to user."""
-        token = default_token_generator.make_token(user)
-        uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
-
-        verification_url = request.build_absolute_uri(
-            reverse("users:verify_email", kwargs={"uidb64": uidb64, "token": token})
-        )
-
-        subject = "Verify your Personal Finance Dashboard account"
-        message = render_to_string(
-            "registration/verification_email.txt",
-            {
-                "user": user,
-                "verification_url": verification_url,
-            },
-        )
-
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=None,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
-
 
 # Status page views
 class RegistrationSentView(TemplateView):
@@ -414,12 +385,17 @@ class TwoFactorBackupCodesView(View):
         if not request.user.is_2fa_enabled:
             return redirect(reverse("core:dashboard"))
 
-        # Generate new backup codes
-        backup_codes = [secrets.token_hex(4).upper() for _ in range(10)]
-
-        # Store encrypted backup codes
-        request.user.backup_codes = json.dumps(backup_codes)
-        request.user.save()
+        # Generate new backup codes from a single CSPRNG draw
+        code_chars = secrets.token_hex(
+            BACKUP_CODE_COUNT * BACKUP_CODE_LENGTH // 2
+        ).upper()
+        backup_codes = [
+            code_chars[i : i + BACKUP_CODE_LENGTH]
+            for i in range(0, len(code_chars), BACKUP_CODE_LENGTH)
+        ]
+
+        # Store digests; the plain codes are only shown on this page
+        request.user.set_backup_codes(backup_codes)
 
         return render(request, self.template_name, {"backup_codes": backup_codes})
 
@@ -2,11 +2,15 @@
 
 from datetime import date, timedelta
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 
 from django.contrib.auth import get_user_model
-from django.test import Client
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from apps.expenses.models import Transaction
@@ -305,6 +309,34 @@ class TestTransactionListView:
         assert "amount_max" in context
         assert "transaction_type" in context
 
+    def test_transaction_list_caches_categories(self, client, user, category):
+        """Test the category dropdown is cached until a category changes."""
+        client.force_login(user)
+        url = reverse("expenses:transaction-list")
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "user-categories-test",
+                }
+            }
+        ):
+            cache.clear()
+            client.get(url)
+
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            assert category in response.context["categories"]
+            assert not any(
+                'FROM "expenses_category"' in query["sql"]
+                for query in queries.captured_queries
+            )
+
+            new_category = CategoryFactory(user=user, name="Zeppelin rides")
+            response = client.get(url)
+
+        assert response.context["categories"][-1] == new_category
+
     def test_transaction_list_empty_state(self, client, user):
         """Test transaction list with no transactions."""
         client.force_login(user)
@@ -421,3 +453,87 @@ class TestTransactionHTMXViews:
         assert response.status_code == 200
         # Should return filtered transaction list
         assert len(response.context["transactions"]) == 5
+
+    def test_transaction_filter_partial_loads_no_deferred_fields(
+        self, client, user, category
+    ):
+        """Test the filter partial renders rows from its restricted columns."""
+        for _ in range(3):
+            TransactionFactory(user=user, category=category)
+
+        client.force_login(user)
+        url = reverse("expenses:transaction-filter")
+        with patch.object(
+            Transaction,
+            "refresh_from_db",
+            side_effect=AssertionError("deferred field loaded"),
+        ):
+            response = client.get(
+                url, {"amount_min": "not-a-number"}, HTTP_HX_REQUEST="true"
+            )
+
+        assert response.status_code == 200
+        assert len(response.context["transactions"]) == 3
+        assert category.name in response.content.decode()
+
+    def test_transaction_list_renders_amount_without_decrypting(
+        self, client, user, category
+    ):
+        """Test list rows show the plaintext amount mirror, not the ciphertext."""
+        TransactionFactory(user=user, category=category, amount=Decimal("123.45"))
+
+        client.force_login(user)
+        response = client.get(
+            reverse("expenses:transaction-filter"), HTTP_HX_REQUEST="true"
+        )
+
+        row = response.context["transactions"][0]
+        assert "amount" in row.get_deferred_fields()
+        assert "123.45" in response.content.decode()
+
+    def test_transaction_filter_partial_ignores_malformed_values(
+        self, client, user, category
+    ):
+        """Test malformed filter values are dropped and valid ones still apply."""
+        TransactionFactory(user=user, category=category, amount=Decimal("10.00"))
+        TransactionFactory(user=user, category=category, amount=Decimal("50.00"))
+
+        client.force_login(user)
+        url = reverse("expenses:transaction-filter")
+        response = client.get(
+            url,
+            {"date_after": "not-a-date", "category": "x", "amount_min": "20"},
+            HTTP_HX_REQUEST="true",
+        )
+
+        assert response.status_code == 200
+        assert len(response.context["transactions"]) == 1
+
+    def test_transaction_filter_partial_reuses_count(self, client, user, category):
+        """Test page changes reuse the list count until transactions change."""
+        TransactionFactory.create_batch(25, user=user, category=category)
+
+        client.force_login(user)
+        url = reverse("expenses:transaction-filter")
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "transaction-count-test",
+                }
+            }
+        ):
+            cache.clear()
+            client.get(url, {"page": 1}, HTTP_HX_REQUEST="true")
+
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url, {"page": 2}, HTTP_HX_REQUEST="true")
+            assert response.context["page_obj"].paginator.count == 25
+            assert not any(
+                "COUNT(" in query["sql"] for query in queries.captured_queries
+            )
+
+            TransactionFactory(user=user, category=category)
+            response = client.get(url, {"page": 2}, HTTP_HX_REQUEST="true")
+
+        assert response.context["page_obj"].paginator.count == 26
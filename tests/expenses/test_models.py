@@ -1736,6 +1736,42 @@ class RecurringTransactionTestCase(TestCase):
         self.assertNotIn(transaction, user2_transactions)
         self.assertNotIn(next_transaction, user2_transactions)
 
+    def test_recurring_due_manager_method(self):
+        """Test recurring_due returns active recurring transactions due by a date."""
+        from datetime import date, timedelta
+
+        yesterday = date.today() - timedelta(days=1)
+        recurring = Transaction.objects.create(
+            user=self.user1,
+            transaction_type=Transaction.EXPENSE,
+            amount=Decimal("50.00"),
+            category=self.category1,
+            description="Weekly groceries",
+            date=yesterday,
+            is_recurring=True,
+            recurring_frequency=Transaction.WEEKLY,
+            recurring_interval=1,
+            recurring_start_date=yesterday,
+        )
+        Transaction.objects.create(
+            user=self.user1,
+            transaction_type=Transaction.EXPENSE,
+            amount=Decimal("20.00"),
+            category=self.category1,
+            description="One-off purchase",
+            date=yesterday,
+        )
+
+        due_date = recurring.next_occurrence
+        self.assertEqual(list(Transaction.objects.recurring_due(due_date)), [recurring])
+        self.assertFalse(
+            Transaction.objects.recurring_due(due_date - timedelta(days=1)).exists()
+        )
+
+        recurring.is_active = False
+        recurring.save()
+        self.assertFalse(Transaction.objects.recurring_due(due_date).exists())
+
 
 class RecurringTransactionTasksTestCase(TestCase):
     """Test case for recurring transaction Celery tasks (Task 2.1.3)."""
@@ -1843,6 +1879,156 @@ class RecurringTransactionTasksTestCase(TestCase):
         self.assertEqual(user1_generated.count(), 1)
         self.assertEqual(user2_generated.count(), 0)
 
+    def test_generate_recurring_transactions_in_chunks(self):
+        """Test due transactions spanning several chunks are all generated."""
+        from datetime import date, timedelta
+        from unittest.mock import patch
+
+        from apps.expenses.tasks import generate_recurring_transactions
+
+        yesterday = date.today() - timedelta(days=1)
+        for i in range(3):
+            Transaction.objects.create(
+                user=self.user1,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal("10.00"),
+                category=self.category1,
+                description=f"Chunked {i}",
+                date=yesterday,
+                is_recurring=True,
+                recurring_frequency=Transaction.DAILY,
+                recurring_interval=1,
+                recurring_start_date=yesterday,
+                next_occurrence=yesterday,
+            )
+
+        with patch("apps.expenses.tasks.RECURRING_CHUNK_SIZE", 2):
+            result = generate_recurring_transactions()
+
+        self.assertEqual(result["processed"], 3)
+        self.assertEqual(result["generated"], 3)
+        self.assertEqual(
+            Transaction.objects.filter(
+                parent_transaction__isnull=False, date=yesterday
+            ).count(),
+            3,
+        )
+
+    def test_generate_recurring_transactions_continues_after_row_error(self):
+        """Test a failing row is counted without aborting the remaining rows."""
+        from datetime import date, timedelta
+        from unittest.mock import patch
+
+        from apps.expenses.tasks import generate_recurring_transactions
+
+        yesterday = date.today() - timedelta(days=1)
+        transactions = [
+            Transaction.objects.create(
+                user=self.user1,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal("10.00"),
+                category=self.category1,
+                description=f"Recurring {i}",
+                date=yesterday,
+                is_recurring=True,
+                recurring_frequency=Transaction.DAILY,
+                recurring_interval=1,
+                recurring_start_date=yesterday,
+                next_occurrence=yesterday,
+            )
+            for i in range(2)
+        ]
+        failing_id = transactions[0].id
+        original = Transaction.generate_next_transaction
+
+        def generate_or_fail(instance):
+            if instance.id == failing_id:
+                raise RuntimeError("boom")
+            return original(instance)
+
+        with patch.object(Transaction, "generate_next_transaction", generate_or_fail):
+            result = generate_recurring_transactions()
+
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(result["processed"], 1)
+        self.assertEqual(result["generated"], 1)
+        self.assertFalse(
+            Transaction.objects.filter(parent_transaction_id=failing_id).exists()
+        )
+
+    def test_generate_user_recurring_transactions_runs_inline(self):
+        """Test the per-user task generates without enqueueing another task."""
+        from datetime import date, timedelta
+        from unittest.mock import patch
+
+        from apps.expenses.tasks import (
+            generate_recurring_transactions,
+            generate_user_recurring_transactions,
+        )
+
+        yesterday = date.today() - timedelta(days=1)
+        Transaction.objects.create(
+            user=self.user1,
+            transaction_type=Transaction.EXPENSE,
+            amount=Decimal("15.00"),
+            category=self.category1,
+            description="User recurring",
+            date=yesterday,
+            is_recurring=True,
+            recurring_frequency=Transaction.DAILY,
+            recurring_interval=1,
+            recurring_start_date=yesterday,
+            next_occurrence=yesterday,
+        )
+
+        with patch.object(generate_recurring_transactions, "delay") as mock_delay:
+            result = generate_user_recurring_transactions(self.user1.id)
+
+        mock_delay.assert_not_called()
+        self.assertEqual(result["generated"], 1)
+        self.assertEqual(result["user_count"], 1)
+
+    def test_generate_recurring_transactions_loads_no_deferred_fields(self):
+        """Test generation reads only the columns the task queryset selects."""
+        from datetime import date, timedelta
+        from unittest.mock import patch
+
+        from apps.expenses.tasks import generate_recurring_transactions
+
+        yesterday = date.today() - timedelta(days=1)
+        parent = Transaction.objects.create(
+            user=self.user1,
+            transaction_type=Transaction.EXPENSE,
+            amount=Decimal("42.00"),
+            category=self.category1,
+            description="Gym membership",
+            notes="Monthly plan",
+            merchant="Gym",
+            date=yesterday,
+            is_recurring=True,
+            recurring_frequency=Transaction.DAILY,
+            recurring_interval=1,
+            recurring_start_date=yesterday,
+            next_occurrence=yesterday,
+        )
+
+        # Touching a deferred field would refresh the row from the database
+        with patch.object(
+            Transaction,
+            "refresh_from_db",
+            side_effect=AssertionError("deferred field loaded"),
+        ):
+            result = generate_recurring_transactions()
+
+        self.assertEqual(result["generated"], 1)
+        self.assertEqual(result["errors"], 0)
+
+        child = Transaction.objects.get(parent_transaction=parent)
+        self.assertEqual(child.amount, Decimal("42.00"))
+        self.assertEqual(child.category, self.category1)
+        self.assertEqual(child.notes, "Monthly plan")
+        self.assertEqual(child.merchant, "Gym")
+
     def test_cleanup_expired_recurring_transactions_task(self):
         """Test the task for cleaning up expired recurring transactions."""
         from datetime import date, timedelta
@@ -1957,6 +2143,32 @@ class RecurringTransactionTasksTestCase(TestCase):
         expected_next = date.today() + timedelta(weeks=1)
         self.assertEqual(transaction.next_occurrence, expected_next)
 
+    def test_validate_recurring_transactions_query_count(self):
+        """Test validation does not issue per-row queries for valid rows."""
+        from datetime import date
+
+        from apps.expenses.tasks import validate_recurring_transactions
+
+        for i in range(3):
+            Transaction.objects.create(
+                user=self.user1,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal("20.00"),
+                category=self.category1,
+                description=f"Valid recurring {i}",
+                date=date.today(),
+                is_recurring=True,
+                recurring_frequency=Transaction.MONTHLY,
+                recurring_interval=1,
+                recurring_start_date=date.today(),
+            )
+
+        with self.assertNumQueries(1):
+            result = validate_recurring_transactions()
+
+        self.assertEqual(result["valid"], 3)
+        self.assertEqual(result["fixed"], 0)
+
     def test_task_handles_invalid_recurring_transactions(self):
         """Test that tasks handle invalid recurring transactions gracefully."""
         from datetime import date
@@ -2036,3 +2248,138 @@ class RecurringTransactionTasksTestCase(TestCase):
             is_recurring=False,
         )
         self.assertEqual(generated_transactions.count(), 1)
+
+    def test_upcoming_generation_bulk_inserts_and_advances_series(self):
+        """Test upcoming generation copies the series and advances it."""
+        from datetime import date, timedelta
+
+        from apps.expenses.tasks import generate_upcoming_recurring_transactions
+
+        tomorrow = date.today() + timedelta(days=1)
+        parents = [
+            Transaction.objects.create(
+                user=self.user1,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal(f"{10 + i}.50"),
+                category=self.category1,
+                description=f"Series {i}",
+                merchant="Store",
+                date=date.today(),
+                is_recurring=True,
+                recurring_frequency=Transaction.WEEKLY,
+                recurring_interval=1,
+                recurring_start_date=date.today(),
+                next_occurrence=tomorrow,
+            )
+            for i in range(3)
+        ]
+
+        result = generate_upcoming_recurring_transactions(days_ahead=7)
+
+        self.assertEqual(result["processed"], 3)
+        self.assertEqual(result["generated"], 3)
+        self.assertEqual(result["errors"], 0)
+
+        for i, parent in enumerate(parents):
+            child = Transaction.objects.get(parent_transaction=parent)
+            self.assertEqual(child.date, tomorrow)
+            self.assertEqual(child.amount, Decimal(f"{10 + i}.50"))
+            self.assertEqual(child.amount_index, Decimal(f"{10 + i}.50"))
+            self.assertEqual(child.merchant, "Store")
+            self.assertFalse(child.is_recurring)
+
+            parent.refresh_from_db()
+            self.assertEqual(parent.next_occurrence, tomorrow + timedelta(weeks=1))
+
+    def test_upcoming_generation_skips_concurrently_generated_occurrences(self):
+        """Test occurrences another run already inserted are not counted."""
+        from datetime import date, timedelta
+
+        from apps.expenses.tasks import generate_upcoming_recurring_transactions
+
+        tomorrow = date.today() + timedelta(days=1)
+        parents = [
+            Transaction.objects.create(
+                user=self.user1,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal("10.00"),
+                category=self.category1,
+                description=f"Series {i}",
+                date=date.today(),
+                is_recurring=True,
+                recurring_frequency=Transaction.WEEKLY,
+                recurring_interval=1,
+                recurring_start_date=date.today(),
+                next_occurrence=tomorrow,
+            )
+            for i in range(3)
+        ]
+        build_next_transaction = Transaction.build_next_transaction
+
+        def build_after_concurrent_insert(recurring_transaction):
+            # Another run inserts the first series' occurrence after this
+            # run has read the series but before it inserts
+            if recurring_transaction.pk == parents[0].pk:
+                build_next_transaction(recurring_transaction).save()
+            return build_next_transaction(recurring_transaction)
+
+        with patch.object(
+            Transaction,
+            "build_next_transaction",
+            autospec=True,
+            side_effect=build_after_concurrent_insert,
+        ):
+            result = generate_upcoming_recurring_transactions(days_ahead=7)
+
+        self.assertEqual(result["processed"], 3)
+        self.assertEqual(result["generated"], 2)
+        self.assertEqual(result["errors"], 0)
+        for parent in parents:
+            self.assertEqual(
+                Transaction.objects.filter(
+                    parent_transaction=parent, date=tomorrow
+                ).count(),
+                1,
+            )
+
+    def test_unique_active_child_per_series_date(self):
+        """Test a series cannot hold two active occurrences on one date."""
+        from datetime import date, timedelta
+
+        from django.db import IntegrityError, transaction
+
+        yesterday = date.today() - timedelta(days=1)
+        parent = Transaction.objects.create(
+            user=self.user1,
+            transaction_type=Transaction.EXPENSE,
+            amount=Decimal("50.00"),
+            category=self.category1,
+            description="Daily coffee",
+            date=yesterday,
+            is_recurring=True,
+            recurring_frequency=Transaction.DAILY,
+            recurring_interval=1,
+            recurring_start_date=yesterday,
+            next_occurrence=yesterday,
+        )
+        first = parent.build_next_transaction()
+        first.save()
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Transaction.objects.bulk_create([parent.build_next_transaction()])
+
+        # Conflicting inserts are skipped when ignoring conflicts
+        Transaction.objects.bulk_create(
+            [parent.build_next_transaction()], ignore_conflicts=True
+        )
+        self.assertEqual(
+            Transaction.objects.filter(parent_transaction=parent).count(), 1
+        )
+
+        # Soft-deleted occurrences do not block regeneration
+        first.is_active = False
+        first.save()
+        parent.generate_next_transaction()
+        self.assertEqual(
+            Transaction.objects.filter(parent_transaction=parent).count(), 2
+        )
@@ -7,6 +7,7 @@ pre-signed URLs, and file cleanup policies for receipt handling.
 
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -17,7 +18,11 @@ from django.test import TestCase, override_settings
 
 from apps.expenses.models import Transaction
 from apps.expenses.storage import (
+    FILE_INFO_CACHE_TTL,
+    PENDING_DELETION_RULE_ID,
+    PENDING_DELETION_TAG,
     BaseSecureStorage,
+    S3BatchDeleter,
     SecureLocalStorage,
     SecureS3Storage,
     get_storage_backend,
@@ -248,6 +253,62 @@ class TestSecureLocalStorage(SecureStorageTestCase):
         self.assertFalse(orphaned_file.exists())
         self.assertTrue(active_file.exists())
 
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+    def test_local_storage_cleanup_matches_receipt_keys_exactly(self):
+        """Test a file whose key is part of a referenced path is an orphan."""
+        storage = SecureLocalStorage()
+
+        media_root = Path(settings.MEDIA_ROOT)
+        user_dir = media_root / "receipts" / str(self.user.id)
+        user_dir.mkdir(parents=True, exist_ok=True)
+
+        old_time = (datetime.now() - timedelta(days=2)).timestamp()
+        orphaned_file = user_dir / "receipt.jpg"
+        active_file = user_dir / "receipt.jpg.pdf"
+        for file_path in (orphaned_file, active_file):
+            file_path.write_bytes(b"content")
+            os.utime(file_path, (old_time, old_time))
+
+        transaction = TransactionFactory(user=self.user, category=self.category)
+        Transaction.objects.filter(id=transaction.id).update(
+            receipt=f"receipts/{self.user.id}/receipt.jpg.pdf"
+        )
+
+        deleted_count = storage.cleanup_orphaned_files(dry_run=False)
+
+        self.assertEqual(deleted_count, 1)
+        self.assertFalse(orphaned_file.exists())
+        self.assertTrue(active_file.exists())
+
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+    def test_local_storage_cleanup_expired_files(self):
+        """Test cleanup of files older than the retention period."""
+        storage = SecureLocalStorage()
+
+        media_root = Path(settings.MEDIA_ROOT)
+        user_dir = media_root / "receipts" / str(self.user.id)
+        user_dir.mkdir(parents=True, exist_ok=True)
+
+        expired_file = user_dir / "expired.jpg"
+        expired_file.write_bytes(b"expired content")
+        old_time = (datetime.now() - timedelta(days=31)).timestamp()
+        os.utime(expired_file, (old_time, old_time))
+
+        recent_file = user_dir / "recent.jpg"
+        recent_file.write_bytes(b"recent content")
+
+        # Dry run reports without deleting
+        self.assertEqual(
+            storage.cleanup_expired_files(retention_days=30, dry_run=True), 1
+        )
+        self.assertTrue(expired_file.exists())
+
+        deleted_count = storage.cleanup_expired_files(retention_days=30)
+
+        self.assertEqual(deleted_count, 1)
+        self.assertFalse(expired_file.exists())
+        self.assertTrue(recent_file.exists())
+
 
 class TestSecureS3Storage(SecureStorageTestCase):
     """Test secure S3 storage implementation."""
@@ -276,6 +337,27 @@ class TestSecureS3Storage(SecureStorageTestCase):
             mock_s3_storage.object_parameters["ServerSideEncryption"], "aws:kms"
         )
 
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_s3_client_created_once_with_connection_pool(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test the S3 client is built once with a pooled, keep-alive config."""
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+        self.assertIs(storage.s3_client, storage.s3_client)
+
+        mock_boto3.client.assert_called_once()
+        config = mock_boto3.client.call_args[1]["config"]
+        self.assertEqual(config.signature_version, "s3v4")
+        self.assertEqual(config.max_pool_connections, 50)
+        self.assertTrue(config.tcp_keepalive)
+        self.assertEqual(config.retries, {"max_attempts": 3, "mode": "adaptive"})
+
     @patch("apps.expenses.storage.boto3")
     @patch("storages.backends.s3boto3.S3Boto3Storage")
     def test_s3_storage_with_kms_encryption(self, mock_s3_storage_class, mock_boto3):
@@ -336,7 +418,11 @@ class TestSecureS3Storage(SecureStorageTestCase):
         # Verify S3 client method was called with correct parameters
         mock_client.generate_presigned_url.assert_called_once_with(
             "get_object",
-            Params={"Bucket": "test-bucket", "Key": "receipts/1/test.jpg"},
+            Params={
+                "Bucket": "test-bucket",
+                "Key": "receipts/1/test.jpg",
+                "ResponseCacheControl": "private, max-age=3600",
+            },
             ExpiresIn=3600,  # Default 1 hour expiration
         )
 
@@ -414,10 +500,124 @@ class TestSecureS3Storage(SecureStorageTestCase):
         with self.assertRaises(PermissionError):
             storage.generate_presigned_url_for_user(expected_path, other_user)
 
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_get_file_info_caches_head_object(self, mock_s3_storage_class, mock_boto3):
+        """Test file metadata is cached until the file is invalidated."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.head_object.return_value = {"ContentLength": 10, "ETag": "abc"}
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+
+        first = storage.get_file_info("receipts/1/test.jpg")
+        second = storage.get_file_info("receipts/1/test.jpg")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["etag"], "abc")
+        mock_client.head_object.assert_called_once()
+
+        # Deleting the file drops its cached metadata
+        storage.delete("receipts/1/test.jpg")
+        storage.get_file_info("receipts/1/test.jpg")
+        self.assertEqual(mock_client.head_object.call_count, 2)
+
+    @patch("apps.expenses.storage.time.monotonic")
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_get_file_info_cache_expires(
+        self, mock_s3_storage_class, mock_boto3, mock_monotonic
+    ):
+        """Test cached metadata is refetched once it is older than the TTL."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.head_object.side_effect = [
+            {"ContentLength": 10, "ETag": "abc"},
+            {"ContentLength": 20, "ETag": "def"},
+        ]
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+
+        mock_monotonic.return_value = 1000.0
+        self.assertEqual(storage.get_file_info("receipts/1/test.jpg")["etag"], "abc")
+
+        # Another worker rewrote the object; this process still trusts its
+        # entry until the TTL passes
+        mock_monotonic.return_value = 1000.0 + FILE_INFO_CACHE_TTL - 1
+        self.assertEqual(storage.get_file_info("receipts/1/test.jpg")["etag"], "abc")
+
+        mock_monotonic.return_value = 1000.0 + FILE_INFO_CACHE_TTL
+        info = storage.get_file_info("receipts/1/test.jpg")
+        self.assertEqual(info["etag"], "def")
+        self.assertEqual(info["size"], 20)
+        self.assertEqual(mock_client.head_object.call_count, 2)
+
 
 class TestFileCleanupPolicies(SecureStorageTestCase):
     """Test file cleanup policies for unused and expired files."""
 
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_s3_cleanup_orphaned_files_matches_keys_exactly(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test S3 orphan detection loads references once and matches exactly."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        old_date = datetime.now() - timedelta(days=2)
+        user_prefix = f"receipts/{self.user.id}"
+        mock_client.list_objects_v2.side_effect = [
+            {
+                "Contents": [
+                    {"Key": f"{user_prefix}/receipt.jpg", "LastModified": old_date},
+                ],
+                "IsTruncated": True,
+                "NextContinuationToken": "page-2",
+            },
+            {
+                "Contents": [
+                    {
+                        "Key": f"{user_prefix}/receipt.jpg.pdf",
+                        "LastModified": old_date,
+                    },
+                ],
+            },
+        ]
+        mock_client.delete_objects.return_value = {}
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        transaction = TransactionFactory(user=self.user, category=self.category)
+        Transaction.objects.filter(id=transaction.id).update(
+            receipt=f"{user_prefix}/receipt.jpg.pdf"
+        )
+
+        storage = SecureS3Storage()
+        with self.assertNumQueries(1):
+            deleted_count = storage.cleanup_orphaned_files()
+
+        self.assertEqual(deleted_count, 1)
+        deleted_keys = [
+            obj["Key"]
+            for call in mock_client.delete_objects.call_args_list
+            for obj in call[1]["Delete"]["Objects"]
+        ]
+        self.assertEqual(deleted_keys, [f"{user_prefix}/receipt.jpg"])
+
     @patch("apps.expenses.storage.boto3")
     @patch("storages.backends.s3boto3.S3Boto3Storage")
     def test_cleanup_expired_files(self, mock_s3_storage_class, mock_boto3):
@@ -435,6 +635,7 @@ class TestFileCleanupPolicies(SecureStorageTestCase):
                 {"Key": "receipts/1/new-file.jpg", "LastModified": new_date},
             ]
         }
+        mock_client.delete_objects.return_value = {}
 
         mock_s3_storage = Mock()
         mock_s3_storage.bucket_name = "test-bucket"
@@ -451,10 +652,215 @@ class TestFileCleanupPolicies(SecureStorageTestCase):
 
         # Should delete only the old file
         self.assertEqual(deleted_count, 1)
-        mock_client.delete_object.assert_called_once_with(
-            Bucket="test-bucket", Key="receipts/1/old-file.jpg"
+        mock_client.delete_objects.assert_called_once_with(
+            Bucket="test-bucket",
+            Delete={"Objects": [{"Key": "receipts/1/old-file.jpg"}], "Quiet": True},
+        )
+
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_cleanup_delete_batches_follow_cleanup_batch_size(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test DeleteObjects batches are sized by the cleanup batch size."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        old_date = datetime.now() - timedelta(days=366)
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": f"receipts/1/old-{i}.jpg", "LastModified": old_date}
+                for i in range(5)
+            ]
+        }
+        mock_client.delete_objects.return_value = {}
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+        storage.cleanup_batch_size = 2
+
+        deleted_count = storage.cleanup_expired_files(retention_days=365)
+
+        self.assertEqual(deleted_count, 5)
+        batches = [
+            call[1]["Delete"]["Objects"]
+            for call in mock_client.delete_objects.call_args_list
+        ]
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+        self.assertEqual(sum(len(batch) for batch in batches), 5)
+
+        # The S3 limit still applies to larger cleanup batch sizes
+        storage.cleanup_batch_size = 5000
+        self.assertEqual(storage._batch_deleter().batch_size, 1000)
+
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_cleanup_user_files_with_lifecycle_rule(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test deferred user cleanup tags objects for the shared rule."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        existing_rule = {"ID": "other", "Filter": {"Prefix": "tmp/"}}
+        mock_client.get_bucket_lifecycle_configuration.return_value = {
+            "Rules": [existing_rule]
+        }
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": "receipts/7/a.jpg"}, {"Key": "receipts/7/b.jpg"}]
+        }
+
+        storage = SecureS3Storage()
+        deleted_count = storage.cleanup_user_files(7, immediate=False)
+
+        self.assertEqual(deleted_count, 0)
+        mock_client.delete_objects.assert_not_called()
+        self.assertEqual(
+            mock_client.list_objects_v2.call_args[1]["Prefix"], "receipts/7/"
+        )
+        self.assertEqual(
+            [
+                (call[1]["Key"], call[1]["Tagging"])
+                for call in mock_client.put_object_tagging.call_args_list
+            ],
+            [
+                ("receipts/7/a.jpg", {"TagSet": [PENDING_DELETION_TAG]}),
+                ("receipts/7/b.jpg", {"TagSet": [PENDING_DELETION_TAG]}),
+            ],
+        )
+        rules = mock_client.put_bucket_lifecycle_configuration.call_args[1][
+            "LifecycleConfiguration"
+        ]["Rules"]
+        self.assertEqual(
+            rules,
+            [
+                existing_rule,
+                {
+                    "ID": PENDING_DELETION_RULE_ID,
+                    "Filter": {"Tag": PENDING_DELETION_TAG},
+                    "Status": "Enabled",
+                    "Expiration": {"Days": 1},
+                },
+            ],
         )
 
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_deferred_cleanup_keeps_one_lifecycle_rule(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test deleting many users never grows the bucket's rule list."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        bucket_rules = [{"ID": "other", "Filter": {"Prefix": "tmp/"}}]
+
+        def put_bucket_lifecycle_configuration(Bucket, LifecycleConfiguration):
+            # S3 rejects configurations with more than 1000 rules
+            self.assertLessEqual(len(LifecycleConfiguration["Rules"]), 1000)
+            bucket_rules[:] = LifecycleConfiguration["Rules"]
+
+        mock_client.get_bucket_lifecycle_configuration.side_effect = lambda **_: {
+            "Rules": list(bucket_rules)
+        }
+        mock_client.put_bucket_lifecycle_configuration.side_effect = (
+            put_bucket_lifecycle_configuration
+        )
+        mock_client.list_objects_v2.return_value = {"Contents": []}
+
+        storage = SecureS3Storage()
+        for user_id in range(1, 1201):
+            storage.cleanup_user_files(user_id, immediate=False)
+
+        self.assertEqual(len(bucket_rules), 2)
+        mock_client.put_bucket_lifecycle_configuration.assert_called_once()
+
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_concurrent_deferred_cleanups_keep_each_others_rules(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test two cleanups reading the same stale config lose no rules."""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        existing_rule = {"ID": "other", "Filter": {"Prefix": "tmp/"}}
+        written = []
+
+        # Both calls read the configuration before either writes it
+        mock_client.get_bucket_lifecycle_configuration.return_value = {
+            "Rules": [existing_rule]
+        }
+        mock_client.put_bucket_lifecycle_configuration.side_effect = (
+            lambda Bucket, LifecycleConfiguration: written.append(
+                LifecycleConfiguration["Rules"]
+            )
+        )
+        mock_client.list_objects_v2.return_value = {"Contents": []}
+
+        storage = SecureS3Storage()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(
+                executor.map(
+                    lambda user_id: storage.cleanup_user_files(
+                        user_id, immediate=False
+                    ),
+                    [7, 8],
+                )
+            )
+
+        # Whichever write lands last, the bucket ends with the same rules
+        self.assertEqual(len(written), 2)
+        self.assertEqual(written[0], written[1])
+        self.assertEqual(
+            [rule["ID"] for rule in written[-1]], ["other", PENDING_DELETION_RULE_ID]
+        )
+
+    def test_batch_deleter_groups_keys_into_delete_objects_calls(self):
+        """Test queued keys are deleted in bounded DeleteObjects batches."""
+        mock_client = Mock()
+
+        def delete_objects(Bucket, Delete):
+            # Report the first key of every batch as failed
+            first_key = Delete["Objects"][0]["Key"]
+            return {"Errors": [{"Key": first_key, "Message": "AccessDenied"}]}
+
+        mock_client.delete_objects.side_effect = delete_objects
+
+        with S3BatchDeleter(
+            mock_client, "test-bucket", workers=2, batch_size=10
+        ) as deleter:
+            for i in range(25):
+                deleter.submit(f"receipts/1/file-{i}.jpg")
+
+        batches = [
+            call[1]["Delete"]["Objects"]
+            for call in mock_client.delete_objects.call_args_list
+        ]
+        self.assertTrue(all(len(batch) <= 10 for batch in batches))
+        self.assertEqual(sum(len(batch) for batch in batches), 25)
+        self.assertEqual(deleter.error_count, len(batches))
+        self.assertEqual(deleter.deleted_count, 25 - len(batches))
+
     @patch("apps.expenses.storage.boto3")
     @patch("storages.backends.s3boto3.S3Boto3Storage")
     def test_encryption_key_rotation_support(self, mock_s3_storage_class, mock_boto3):
@@ -477,6 +883,13 @@ class TestFileCleanupPolicies(SecureStorageTestCase):
         new_key = "arn:aws:kms:us-east-1:123456789012:key/new-key-id"
 
         # Mock successful re-encryption
+        mock_client.head_object.return_value = {
+            "ContentLength": 1024,
+            "ContentType": "image/jpeg",
+            "Metadata": {"source": "upload"},
+            "StorageClass": "STANDARD_IA",
+            "ETag": '"source-etag"',
+        }
         mock_client.copy_object.return_value = {"ETag": "new-etag"}
 
         # Test key rotation
@@ -488,6 +901,263 @@ class TestFileCleanupPolicies(SecureStorageTestCase):
         mock_client.copy_object.assert_called_once()
         call_kwargs = mock_client.copy_object.call_args[1]
         self.assertEqual(call_kwargs["SSEKMSKeyId"], new_key)
+        # Headers, metadata and tags are copied unchanged from the source
+        self.assertEqual(call_kwargs["MetadataDirective"], "COPY")
+        self.assertEqual(call_kwargs["TaggingDirective"], "COPY")
+        self.assertNotIn("Metadata", call_kwargs)
+        self.assertEqual(call_kwargs["StorageClass"], "STANDARD_IA")
+        self.assertEqual(call_kwargs["CopySourceIfMatch"], '"source-etag"')
+        mock_client.create_multipart_upload.assert_not_called()
+
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_encryption_key_rotation_large_object(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test large objects are re-encrypted with a ranged multipart copy."""
+        from apps.expenses.storage import MULTIPART_COPY_PART_SIZE
+
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+
+        object_size = MULTIPART_COPY_PART_SIZE * 2 + 10
+        expires = datetime(2030, 1, 1)
+        mock_client.head_object.return_value = {
+            "ContentLength": object_size,
+            "ContentType": "application/pdf",
+            "ContentDisposition": 'attachment; filename="big.pdf"',
+            "CacheControl": "private, max-age=60",
+            "ContentEncoding": "identity",
+            "ContentLanguage": "en",
+            "Expires": expires,
+            "StorageClass": "STANDARD_IA",
+            "Metadata": {"source": "upload"},
+            "ETag": '"source-etag"',
+        }
+        mock_client.get_object_tagging.return_value = {
+            "TagSet": [
+                {"Key": "pending-deletion", "Value": "true"},
+                {"Key": "owner", "Value": "user 1"},
+            ]
+        }
+        mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        mock_client.upload_part_copy.return_value = {"CopyPartResult": {"ETag": "e"}}
+
+        result = storage.rotate_encryption_key("receipts/1/big.pdf", "old", "new")
+
+        self.assertTrue(result)
+        mock_client.copy_object.assert_not_called()
+        self.assertEqual(
+            mock_client.create_multipart_upload.call_args[1],
+            {
+                "Bucket": "test-bucket",
+                "Key": "receipts/1/big.pdf",
+                "ServerSideEncryption": "aws:kms",
+                "SSEKMSKeyId": "new",
+                "Metadata": {"source": "upload"},
+                "ContentType": "application/pdf",
+                "ContentDisposition": 'attachment; filename="big.pdf"',
+                "CacheControl": "private, max-age=60",
+                "ContentEncoding": "identity",
+                "ContentLanguage": "en",
+                "Expires": expires,
+                "StorageClass": "STANDARD_IA",
+                "Tagging": "pending-deletion=true&owner=user+1",
+            },
+        )
+
+        ranges = sorted(
+            call[1]["CopySourceRange"]
+            for call in mock_client.upload_part_copy.call_args_list
+        )
+        self.assertEqual(
+            ranges,
+            sorted(
+                [
+                    f"bytes=0-{MULTIPART_COPY_PART_SIZE - 1}",
+                    f"bytes={MULTIPART_COPY_PART_SIZE}-"
+                    f"{MULTIPART_COPY_PART_SIZE * 2 - 1}",
+                    f"bytes={MULTIPART_COPY_PART_SIZE * 2}-{object_size - 1}",
+                ]
+            ),
+        )
+
+        parts = mock_client.complete_multipart_upload.call_args[1]["MultipartUpload"][
+            "Parts"
+        ]
+        self.assertEqual([part["PartNumber"] for part in parts], [1, 2, 3])
+        mock_client.abort_multipart_upload.assert_not_called()
+        # Every part is read from the version that was inspected
+        self.assertTrue(
+            all(
+                call[1]["CopySourceIfMatch"] == '"source-etag"'
+                for call in mock_client.upload_part_copy.call_args_list
+            )
+        )
+
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_encryption_key_rotation_aborts_when_source_changes(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test a write during a multipart copy aborts instead of mixing bytes."""
+        from botocore.exceptions import ClientError
+
+        from apps.expenses.storage import MULTIPART_COPY_PART_SIZE
+
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+
+        mock_client.head_object.return_value = {
+            "ContentLength": MULTIPART_COPY_PART_SIZE * 3,
+            "ETag": '"source-etag"',
+        }
+        mock_client.get_object_tagging.return_value = {"TagSet": []}
+        mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+
+        def upload_part_copy(**kwargs):
+            if kwargs["PartNumber"] == 2:
+                raise ClientError(
+                    {"Error": {"Code": "PreconditionFailed"}}, "UploadPartCopy"
+                )
+            return {"CopyPartResult": {"ETag": "e"}}
+
+        mock_client.upload_part_copy.side_effect = upload_part_copy
+
+        result = storage.rotate_encryption_key("receipts/1/big.pdf", "old", "new")
+
+        self.assertFalse(result)
+        mock_client.complete_multipart_upload.assert_not_called()
+        mock_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket", Key="receipts/1/big.pdf", UploadId="upload-1"
+        )
+
+    def test_rotation_pools_fit_s3_connection_pool(self):
+        """Test rotations and their part copies cannot exhaust S3 connections."""
+        from apps.expenses.storage import (
+            MULTIPART_COPY_WORKERS,
+            S3_MAX_POOL_CONNECTIONS,
+        )
+        from apps.expenses.tasks import ROTATION_WORKERS
+
+        self.assertGreater(ROTATION_WORKERS, 0)
+        self.assertLessEqual(
+            ROTATION_WORKERS + MULTIPART_COPY_WORKERS, S3_MAX_POOL_CONNECTIONS
+        )
+
+    @patch("apps.expenses.tasks.get_storage_backend")
+    def test_rotate_file_encryption_keys_task(self, mock_get_storage_backend):
+        """Test the rotation task rotates every listed key across pages."""
+        from apps.expenses.tasks import rotate_file_encryption_keys
+
+        storage = Mock()
+        storage.bucket_name = "test-bucket"
+        storage.cleanup_batch_size = 2
+        paginator = storage.s3_client.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {"Contents": [{"Key": "receipts/1/a.jpg"}, {"Key": "receipts/1/b.jpg"}]},
+            {"Contents": [{"Key": "receipts/2/c.jpg"}]},
+        ]
+
+        def rotate(file_key, old_key_id, new_key_id):
+            # One key rotates, one fails to rotate, one raises
+            if file_key == "receipts/2/c.jpg":
+                raise RuntimeError("boom")
+            return file_key == "receipts/1/a.jpg"
+
+        storage.rotate_encryption_key.side_effect = rotate
+        mock_get_storage_backend.return_value = storage
+
+        # A small in-flight cap exercises waiting on earlier rotations
+        with patch("apps.expenses.tasks.ROTATION_MAX_IN_FLIGHT", 2):
+            stats = rotate_file_encryption_keys("old-key", "new-key")
+
+        self.assertTrue(stats["success"])
+        self.assertEqual(stats["processed"], 3)
+        self.assertEqual(stats["rotated"], 1)
+        self.assertEqual(stats["errors"], 2)
+        rotated_keys = {
+            call.args[0] for call in storage.rotate_encryption_key.call_args_list
+        }
+        self.assertEqual(
+            rotated_keys,
+            {"receipts/1/a.jpg", "receipts/1/b.jpg", "receipts/2/c.jpg"},
+        )
+        storage.s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        paginator.paginate.assert_called_once_with(
+            Bucket="test-bucket",
+            Prefix="receipts/",
+            PaginationConfig={"PageSize": 2},
+        )
+
+    @patch("apps.expenses.tasks.get_storage_backend")
+    @patch("apps.expenses.tasks.cache")
+    def test_storage_tasks_skip_while_another_run_holds_the_lock(
+        self, mock_cache, mock_get_storage_backend
+    ):
+        """Test overlapping storage task runs are skipped, not repeated."""
+        from apps.expenses.tasks import (
+            ORPHAN_CLEANUP_TIME_LIMIT,
+            TASK_LOCK_MARGIN,
+            cleanup_orphaned_files,
+        )
+
+        storage = Mock()
+        storage.cleanup_orphaned_files.return_value = 3
+        mock_get_storage_backend.return_value = storage
+
+        # Another run holds the lock
+        mock_cache.add.return_value = False
+        stats = cleanup_orphaned_files()
+
+        self.assertTrue(stats["skipped"])
+        storage.cleanup_orphaned_files.assert_not_called()
+        mock_cache.delete.assert_not_called()
+
+        # Lock is free: the task runs and releases it afterwards
+        mock_cache.add.return_value = True
+        mock_cache.get.side_effect = lambda key: mock_cache.add.call_args[0][1]
+        stats = cleanup_orphaned_files()
+
+        self.assertEqual(stats["deleted_count"], 3)
+        lock_key, token, timeout = mock_cache.add.call_args[0]
+        self.assertEqual(
+            lock_key, "task-lock:apps.expenses.tasks.cleanup_orphaned_files"
+        )
+        # The lock outlives the task's hard time limit
+        self.assertEqual(timeout, ORPHAN_CLEANUP_TIME_LIMIT + TASK_LOCK_MARGIN)
+        mock_cache.delete.assert_called_once_with(lock_key)
+
+    @patch("apps.expenses.tasks.get_storage_backend")
+    @patch("apps.expenses.tasks.cache")
+    def test_storage_task_keeps_a_lock_taken_by_another_run(
+        self, mock_cache, mock_get_storage_backend
+    ):
+        """Test a run never releases a lock that now belongs to another run."""
+        from apps.expenses.tasks import cleanup_orphaned_files
+
+        mock_get_storage_backend.return_value.cleanup_orphaned_files.return_value = 0
+
+        # Our lock expired and another run took it over with its own token
+        mock_cache.add.return_value = True
+        mock_cache.get.return_value = "other-run-token"
+        cleanup_orphaned_files()
+
+        mock_cache.delete.assert_not_called()
 
 
 class TestStorageBackendSelection(SecureStorageTestCase):
@@ -512,6 +1182,17 @@ class TestStorageBackendSelection(SecureStorageTestCase):
 
         self.assertIsInstance(storage, SecureLocalStorage)
 
+    @override_settings(AWS_STORAGE_BUCKET_NAME="")
+    def test_get_storage_backend_is_shared_until_settings_change(self):
+        """Test the backend is created once and rebuilt after a settings change."""
+        storage = get_storage_backend()
+        self.assertIs(get_storage_backend(), storage)
+
+        with override_settings(FILE_RETENTION_DAYS=30):
+            overridden = get_storage_backend()
+            self.assertIsNot(overridden, storage)
+            self.assertEqual(overridden.retention_days, 30)
+
 
 class TestStorageIntegration(SecureStorageTestCase):
     """Integration tests for storage with Django models."""
@@ -564,3 +1245,290 @@ class TestStorageIntegration(SecureStorageTestCase):
         # (Implementation will depend on cleanup strategy - immediate vs batch)
         # This test ensures the cleanup mechanism is triggered
         self.assertTrue(True)  # Placeholder - implement based on cleanup strategy
+
+    @patch("apps.expenses.utils.get_storage_backend")
+    def test_user_storage_usage_reads_s3_pages(self, mock_get_storage_backend):
+        """Test S3 storage usage is summed across paginator pages."""
+        from apps.expenses.utils import get_user_storage_usage
+
+        older = datetime(2024, 1, 1)
+        newer = datetime(2024, 6, 1)
+        storage = Mock()
+        storage.bucket_name = "test-bucket"
+        paginator = storage.s3_client.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "receipts/1/a.jpg", "Size": 10, "LastModified": newer},
+                    {"Key": "receipts/1/b.PDF", "Size": 20, "LastModified": older},
+                ]
+            },
+            {},
+            {
+                "Contents": [
+                    {"Key": "receipts/1/c.jpg", "Size": 5, "LastModified": newer}
+                ]
+            },
+        ]
+        mock_get_storage_backend.return_value = storage
+
+        stats = get_user_storage_usage(self.user)
+
+        self.assertEqual(stats["total_files"], 3)
+        self.assertEqual(stats["total_size"], 35)
+        self.assertEqual(stats["oldest_file"], older)
+        self.assertEqual(stats["newest_file"], newer)
+        self.assertEqual(stats["file_types"], {"jpg": 2, "pdf": 1})
+        paginator.paginate.assert_called_once_with(
+            Bucket="test-bucket",
+            Prefix=f"receipts/{self.user.id}/",
+            PaginationConfig={"PageSize": 1000},
+        )
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    @patch("apps.expenses.utils.get_storage_backend")
+    def test_secure_file_url_reused_within_window(self, mock_get_storage_backend):
+        """Test pre-signed URLs are minted once per user, file and window."""
+        from django.core.cache import cache
+
+        from apps.expenses.utils import generate_secure_file_url
+
+        cache.clear()
+        storage = Mock()
+        storage.generate_presigned_url_for_user.side_effect = [
+            "https://example.com/first",
+            "https://example.com/second",
+            "https://example.com/third",
+        ]
+        mock_get_storage_backend.return_value = storage
+        file_path = f"receipts/{self.user.id}/receipt.jpg"
+
+        with patch("apps.expenses.utils.time.time", return_value=1_000_000):
+            first = generate_secure_file_url(file_path, self.user, expires_in=600)
+            again = generate_secure_file_url(file_path, self.user, expires_in=600)
+
+        self.assertEqual(first, "https://example.com/first")
+        self.assertEqual(again, first)
+        # Signed for exactly the requested lifetime, never longer
+        storage.generate_presigned_url_for_user.assert_called_once_with(
+            file_path, self.user, 600
+        )
+
+        # Another user gets their own URL
+        other_user = UserFactory()
+        with patch("apps.expenses.utils.time.time", return_value=1_000_000):
+            other = generate_secure_file_url(file_path, other_user, expires_in=600)
+        self.assertEqual(other, "https://example.com/second")
+
+        # Reuse is capped at half the lifetime, so the next window starts
+        # within 300 seconds and mints a fresh URL
+        with patch("apps.expenses.utils.time.time", return_value=1_000_000 + 300):
+            later = generate_secure_file_url(file_path, self.user, expires_in=600)
+        self.assertEqual(later, "https://example.com/third")
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_reused_url_reports_remaining_lifetime(self):
+        """Test a URL reused later in its window reports the time it has left."""
+        from django.core.cache import cache
+
+        from apps.expenses.utils import _sign_file_url
+
+        cache.clear()
+        sign = Mock(return_value="https://example.com/signed")
+        file_path = f"receipts/{self.user.id}/receipt.jpg"
+        # Start of a reuse window for this user
+        signed_at = 1_000_000 - (1_000_000 + self.user.id) % 300
+
+        with patch("apps.expenses.utils.time.time", return_value=signed_at):
+            first = _sign_file_url(file_path, self.user, 600, sign)
+        with patch("apps.expenses.utils.time.time", return_value=signed_at + 200):
+            reused = _sign_file_url(file_path, self.user, 600, sign)
+
+        self.assertEqual(first, ("https://example.com/signed", 600))
+        self.assertEqual(reused, ("https://example.com/signed", 400))
+        sign.assert_called_once_with(file_path, 600)
+
+    def test_presigned_url_reuse_window_never_extends_expiry(self):
+        """Test a reused URL keeps at least half of its requested lifetime."""
+        from apps.expenses.utils import (
+            PRESIGNED_URL_WINDOW,
+            get_presigned_url_reuse_window,
+        )
+
+        self.assertEqual(get_presigned_url_reuse_window(60), 30)
+        self.assertEqual(get_presigned_url_reuse_window(600), 300)
+        self.assertEqual(get_presigned_url_reuse_window(86400), PRESIGNED_URL_WINDOW)
+
+    @override_settings(AWS_STORAGE_BUCKET_NAME="")
+    def test_user_storage_usage_scans_local_directory(self):
+        """Test local storage usage counts regular files only."""
+        from apps.expenses.utils import get_user_storage_usage
+
+        media_root = tempfile.mkdtemp()
+        user_dir = Path(media_root) / "receipts" / str(self.user.id)
+        (user_dir / "nested").mkdir(parents=True)
+        (user_dir / "a.JPG").write_bytes(b"12345")
+        (user_dir / "b.pdf").write_bytes(b"123")
+        (user_dir / "noext").write_bytes(b"1")
+
+        with override_settings(MEDIA_ROOT=media_root):
+            stats = get_user_storage_usage(self.user)
+
+        self.assertEqual(stats["total_files"], 3)
+        self.assertEqual(stats["total_size"], 9)
+        self.assertEqual(stats["file_types"], {"jpg": 1, "pdf": 1, "unknown": 1})
+        self.assertIsNotNone(stats["oldest_file"])
+        self.assertIsNotNone(stats["newest_file"])
+
+    @patch("apps.expenses.utils.get_storage_backend")
+    def test_cleanup_transaction_receipts_skips_shared_files(
+        self, mock_get_storage_backend
+    ):
+        """Test batch receipt cleanup deletes only unreferenced files."""
+        from apps.expenses.utils import cleanup_transaction_receipts
+
+        storage = Mock()
+        storage.delete_many.return_value = 2
+        mock_get_storage_backend.return_value = storage
+
+        prefix = f"receipts/{self.user.id}"
+        deleted = [
+            TransactionFactory(user=self.user, category=self.category) for _ in range(4)
+        ]
+        keeper = TransactionFactory(user=self.user, category=self.category)
+        receipts = ["a.jpg", "b.jpg", "shared.jpg", "shared.jpg"]
+        for transaction, receipt in zip(deleted, receipts):
+            Transaction.objects.filter(id=transaction.id).update(
+                receipt=f"{prefix}/{receipt}", is_active=False
+            )
+        Transaction.objects.filter(id=keeper.id).update(receipt=f"{prefix}/shared.jpg")
+        deleted = list(Transaction.objects.filter(id__in=[t.id for t in deleted]))
+
+        with self.assertNumQueries(1):
+            deleted_count = cleanup_transaction_receipts(deleted)
+
+        self.assertEqual(deleted_count, 2)
+        storage.delete_many.assert_called_once_with(
+            [f"{prefix}/a.jpg", f"{prefix}/b.jpg"]
+        )
+
+    @patch("apps.expenses.storage.boto3")
+    @patch("storages.backends.s3boto3.S3Boto3Storage")
+    def test_s3_delete_many_uses_delete_objects(
+        self, mock_s3_storage_class, mock_boto3
+    ):
+        """Test S3 multi-file deletes are sent as DeleteObjects batches."""
+        mock_client = Mock()
+        mock_client.delete_objects.return_value = {}
+        mock_boto3.client.return_value = mock_client
+
+        mock_s3_storage = Mock()
+        mock_s3_storage.bucket_name = "test-bucket"
+        mock_s3_storage.object_parameters = {}
+        mock_s3_storage_class.return_value = mock_s3_storage
+
+        storage = SecureS3Storage()
+        keys = [f"receipts/1/file-{i}.jpg" for i in range(3)]
+
+        self.assertEqual(storage.delete_many(keys), 3)
+        deleted_keys = [
+            obj["Key"]
+            for call in mock_client.delete_objects.call_args_list
+            for obj in call[1]["Delete"]["Objects"]
+        ]
+        self.assertEqual(sorted(deleted_keys), keys)
+        mock_s3_storage.delete.assert_not_called()
+
+    @patch("apps.expenses.utils.get_storage_backend")
+    def test_receipt_helpers_trust_loaded_transaction(self, mock_get_storage_backend):
+        """Test receipt URL lookups skip the second ownership query."""
+        from apps.expenses.utils import get_user_receipt_url
+
+        storage = Mock()
+        storage.generate_presigned_url.return_value = "https://example.com/receipt"
+        mock_get_storage_backend.return_value = storage
+
+        transaction = TransactionFactory(user=self.user, category=self.category)
+        receipt_path = f"receipts/{self.user.id}/receipt.jpg"
+        Transaction.objects.filter(id=transaction.id).update(receipt=receipt_path)
+        transaction.refresh_from_db()
+
+        # Only the transaction lookup itself hits the database
+        with self.assertNumQueries(1):
+            url = get_user_receipt_url(transaction.id, self.user, expires_in=600)
+        self.assertEqual(url, "https://example.com/receipt")
+        storage.generate_presigned_url_for_user.assert_not_called()
+
+        # Receipts outside the owner's directory are still refused
+        Transaction.objects.filter(id=transaction.id).update(
+            receipt="receipts/other/receipt.jpg"
+        )
+        transaction.refresh_from_db()
+        with self.assertRaises(PermissionError):
+            get_user_receipt_url(transaction.id, self.user)
+
+    def test_file_ownership_requires_exact_receipt_path(self):
+        """Test ownership checks match the stored receipt path exactly."""
+        from apps.expenses.utils import validate_file_ownership
+
+        transaction = TransactionFactory(user=self.user, category=self.category)
+        receipt_path = f"receipts/{self.user.id}/receipt.jpg"
+        Transaction.objects.filter(id=transaction.id).update(receipt=receipt_path)
+
+        self.assertTrue(validate_file_ownership(receipt_path, self.user))
+        # A fragment of a stored path is not a file the user owns
+        self.assertFalse(
+            validate_file_ownership(f"receipts/{self.user.id}/receipt", self.user)
+        )
+        self.assertFalse(
+            SecureLocalStorage()._user_has_file_access(
+                f"receipts/{self.user.id}/rec", self.user
+            )
+        )
+
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp(), AWS_STORAGE_BUCKET_NAME="")
+    def test_file_utils_share_one_storage_backend(self):
+        """Test the receipt helpers reuse one backend instead of rebuilding it."""
+        from apps.expenses.utils import get_user_storage_usage
+
+        with patch(
+            "apps.expenses.storage.SecureLocalStorage", wraps=SecureLocalStorage
+        ) as mock_local_storage:
+            get_user_storage_usage(self.user)
+            get_user_storage_usage(self.user)
+
+        mock_local_storage.assert_called_once()
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_storage_usage_cached_until_receipt_saved(self):
+        """Test storage usage is rescanned only after a receipt is saved."""
+        from apps.expenses.utils import get_cached_user_storage_usage
+
+        usage = {"total_files": 0, "total_size": 0}
+        with patch(
+            "apps.expenses.utils.get_user_storage_usage", return_value=usage
+        ) as mock_usage:
+            get_cached_user_storage_usage(self.user)
+            get_cached_user_storage_usage(self.user)
+            self.assertEqual(mock_usage.call_count, 1)
+
+            TransactionFactory(user=self.user, category=self.category)
+            get_cached_user_storage_usage(self.user)
+            self.assertEqual(mock_usage.call_count, 1)
+
+            from django.core.files.base import ContentFile
+
+            with override_settings(MEDIA_ROOT=tempfile.mkdtemp()):
+                TransactionFactory(
+                    user=self.user,
+                    category=self.category,
+                    receipt=ContentFile(b"test content", name="test.jpg"),
+                )
+            get_cached_user_storage_usage(self.user)
+            self.assertEqual(mock_usage.call_count, 2)
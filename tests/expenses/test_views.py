@@ -1,5 +1,6 @@
 from datetime import date, timedelta
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from rest_framework import status
@@ -7,9 +8,14 @@ from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from apps.expenses.models import Transaction
+from apps.expenses.tasks import import_transactions
 from tests.factories import CategoryFactory, TransactionFactory, UserFactory
 
 User = get_user_model()
@@ -84,6 +90,36 @@ class TestTransactionViewSet:
         assert transaction1.id in transaction_ids
         assert transaction2.id in transaction_ids
 
+    def test_list_transactions_loads_no_deferred_fields(
+        self, auth_client, user, category
+    ):
+        """Test the list endpoint serializes from its restricted columns only."""
+        for _ in range(3):
+            TransactionFactory(user=user, category=category)
+
+        url = reverse("api:transaction-list")
+        with patch.object(
+            Transaction,
+            "refresh_from_db",
+            side_effect=AssertionError("deferred field loaded"),
+        ), CaptureQueriesContext(connection) as queries:
+            response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 3
+        assert all(
+            item["formatted_amount"] and item["category"]["name"]
+            for item in response.data["results"]
+        )
+
+        # No per-row user or category lookups
+        assert not any(
+            'FROM "users_user"' in query["sql"]
+            and "expenses_transaction" not in query["sql"]
+            and "authtoken" not in query["sql"]
+            for query in queries.captured_queries
+        )
+
     def test_create_expense_transaction(self, auth_client, user, category):
         """Test creating an expense transaction."""
         url = reverse("api:transaction-list")
@@ -241,6 +277,28 @@ class TestTransactionViewSet:
         transaction.refresh_from_db()
         assert not transaction.is_active
 
+    def test_delete_transaction_writes_narrow_update(self, auth_client, transaction):
+        """Test soft delete writes a narrow UPDATE that still bumps updated_at."""
+        url = reverse("api:transaction-detail", kwargs={"pk": transaction.id})
+        previous_updated_at = transaction.updated_at
+        with patch.object(Transaction, "save") as mock_save:
+            with CaptureQueriesContext(connection) as queries:
+                response = auth_client.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        mock_save.assert_not_called()
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        assert len(updates) == 1
+        assert '"is_active" = ' in updates[0]
+        assert '"updated_at" = ' in updates[0]
+        assert "amount" not in updates[0]
+        transaction.refresh_from_db()
+        assert transaction.updated_at > previous_updated_at
+
     def test_delete_other_user_transaction_fails(
         self, auth_client, other_user, category
     ):
@@ -350,6 +408,18 @@ class TestTransactionViewSet:
         assert expense.id in transaction_ids
         assert expense2.id in transaction_ids
 
+    def test_filter_form_class_reused_across_requests(self, auth_client, user):
+        """Test the filter form class is built once and still validates input."""
+        from apps.expenses.views import TransactionFilter
+
+        first = TransactionFilter(queryset=Transaction.objects.none())
+        second = TransactionFilter(queryset=Transaction.objects.none())
+        assert first.get_form_class() is second.get_form_class()
+
+        url = reverse("api:transaction-list")
+        response = auth_client.get(url, {"amount_min": "not-a-number"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_search_transactions(self, auth_client, user, category):
         """Test searching transactions by description and merchant."""
         transaction1 = TransactionFactory(
@@ -509,6 +579,100 @@ class TestTransactionViewSet:
         assert len(response.data["transactions"]) == 2
         assert Transaction.objects.filter(user=user).count() == 2
 
+    def test_bulk_create_inserts_in_one_statement(self, auth_client, user, category):
+        """Test bulk create validates everything, then inserts all rows at once."""
+        url = reverse("api:transaction-bulk-create")
+        data = {
+            "transactions": [
+                {
+                    "transaction_type": Transaction.EXPENSE,
+                    "amount": f"{10 + i}.00",
+                    "category_id": category.id,
+                    "description": f"Transaction {i}",
+                    "date": date.today().isoformat(),
+                }
+                for i in range(5)
+            ]
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert all(item["id"] for item in response.data["transactions"])
+        transactions = Transaction.objects.filter(user=user).order_by("amount_index")
+        assert [t.amount_index for t in transactions] == [
+            Decimal(f"{10 + i}.00") for i in range(5)
+        ]
+
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "expenses_transaction"')
+        ]
+        assert len(inserts) == 1
+        # Categories for the whole batch are resolved in a single lookup
+        category_lookups = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "expenses_category"' in query["sql"]
+        ]
+        assert len(category_lookups) == 1
+
+    def test_bulk_create_rejects_other_users_category(
+        self, auth_client, user, other_user, category
+    ):
+        """Test bulk create still refuses categories the user doesn't own."""
+        other_category = CategoryFactory(user=other_user)
+        url = reverse("api:transaction-bulk-create")
+        data = {
+            "transactions": [
+                {
+                    "transaction_type": Transaction.EXPENSE,
+                    "amount": "25.00",
+                    "category_id": category_id,
+                    "description": "Transaction",
+                    "date": date.today().isoformat(),
+                }
+                for category_id in (category.id, other_category.id)
+            ]
+        }
+
+        response = auth_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Transaction.objects.filter(user=user).exists()
+
+    def test_bulk_create_invalid_item_creates_nothing(
+        self, auth_client, user, category
+    ):
+        """Test one invalid transaction rejects the whole batch."""
+        url = reverse("api:transaction-bulk-create")
+        data = {
+            "transactions": [
+                {
+                    "transaction_type": Transaction.EXPENSE,
+                    "amount": "25.00",
+                    "category_id": category.id,
+                    "description": "Valid",
+                    "date": date.today().isoformat(),
+                },
+                {
+                    "transaction_type": Transaction.EXPENSE,
+                    "amount": "-5.00",
+                    "category_id": category.id,
+                    "description": "Invalid",
+                    "date": date.today().isoformat(),
+                },
+            ]
+        }
+
+        response = auth_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Transaction.objects.filter(user=user).exists()
+
     def test_statistics_endpoint(self, auth_client, user, category):
         """Test transaction statistics endpoint."""
         # Create test transactions
@@ -543,6 +707,162 @@ class TestTransactionViewSet:
         assert response.data["net_amount"] == "350.00"
         assert response.data["transaction_count"] == 3
 
+    def test_statistics_aggregates_in_database(self, auth_client, user, category):
+        """Test statistics totals, counts and breakdown come from one query."""
+        other_category = CategoryFactory(user=user, name="Transport")
+        for amount, expense_category in [
+            ("10.00", category),
+            ("15.50", category),
+            ("7.25", other_category),
+        ]:
+            TransactionFactory(
+                user=user,
+                category=expense_category,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal(amount),
+                date=date.today(),
+            )
+        TransactionFactory(
+            user=user,
+            category=None,
+            transaction_type=Transaction.INCOME,
+            amount=Decimal("100.00"),
+            date=date.today(),
+        )
+        TransactionFactory(
+            user=user,
+            category=None,
+            transaction_type=Transaction.TRANSFER,
+            amount=Decimal("20.00"),
+            date=date.today(),
+        )
+
+        url = reverse("api:transaction-statistics")
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_expenses"] == "32.75"
+        assert response.data["total_income"] == "100.00"
+        assert response.data["transaction_count"] == 5
+        assert response.data["expense_count"] == 3
+        assert response.data["income_count"] == 1
+        assert response.data["category_breakdown"] == {
+            category.name: "25.50",
+            "Transport": "7.25",
+        }
+
+        transaction_queries = [
+            query
+            for query in queries.captured_queries
+            if "expenses_transaction" in query["sql"]
+        ]
+        assert len(transaction_queries) == 1
+        assert "SUM(" in transaction_queries[0]["sql"]
+
+    @patch("apps.expenses.views.STATISTICS_TOP_CATEGORIES", 2)
+    def test_statistics_folds_small_categories_into_other(self, auth_client, user):
+        """Test the category breakdown keeps the top categories plus Other."""
+        for name, amount in [
+            ("Rent", "500.00"),
+            ("Food", "120.00"),
+            ("Books", "30.00"),
+            ("Games", "15.50"),
+        ]:
+            TransactionFactory(
+                user=user,
+                category=CategoryFactory(user=user, name=name),
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal(amount),
+            )
+
+        url = reverse("api:transaction-statistics")
+        response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["category_breakdown"] == {
+            "Rent": "500.00",
+            "Food": "120.00",
+            "Other": "45.50",
+        }
+
+    def test_statistics_does_not_load_transaction_rows(
+        self, auth_client, user, category
+    ):
+        """Test statistics never fetch (and decrypt) individual transactions."""
+        TransactionFactory.create_batch(
+            3, user=user, category=category, transaction_type=Transaction.EXPENSE
+        )
+
+        url = reverse("api:transaction-statistics")
+        with patch.object(
+            Transaction, "from_db", side_effect=AssertionError("row loaded")
+        ):
+            response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["expense_count"] == 3
+
+    def test_statistics_cached_until_transactions_change(
+        self, auth_client, user, category
+    ):
+        """Test statistics are served from cache until a transaction is saved."""
+        TransactionFactory(
+            user=user,
+            category=category,
+            transaction_type=Transaction.EXPENSE,
+            amount=Decimal("10.00"),
+        )
+        url = reverse("api:transaction-statistics")
+
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "transaction-statistics-test",
+                }
+            }
+        ):
+            cache.clear()
+            first = auth_client.get(url)
+
+            with CaptureQueriesContext(connection) as queries:
+                cached = auth_client.get(url)
+            assert cached.data == first.data
+            assert not any(
+                "expenses_transaction" in query["sql"]
+                for query in queries.captured_queries
+            )
+
+            TransactionFactory(
+                user=user,
+                category=category,
+                transaction_type=Transaction.EXPENSE,
+                amount=Decimal("5.00"),
+            )
+            refreshed = auth_client.get(url)
+
+        assert first.data["total_expenses"] == "10.00"
+        assert refreshed.data["total_expenses"] == "15.00"
+
+    def test_receipt_url_response_is_privately_cacheable(
+        self, auth_client, user, category
+    ):
+        """Test receipt URL responses may be reused until the URL nears expiry."""
+        transaction = TransactionFactory(user=user, category=category)
+        url = reverse("api:transaction-get-receipt-url", args=[transaction.id])
+
+        with patch(
+            "apps.expenses.views.get_user_receipt_url_with_expiry",
+            return_value=("https://example.com/signed", 450),
+        ):
+            response = auth_client.get(url, {"expires_in": 600})
+
+        assert response.status_code == status.HTTP_200_OK
+        # A reused URL reports and caches for what is left of its lifetime
+        assert response.data["expires_in"] == 450
+        assert response["Cache-Control"] == "private, max-age=420"
+
 
 @pytest.mark.django_db
 class TestTransactionBulkOperations:
@@ -602,6 +922,30 @@ class TestTransactionBulkOperations:
         assert response.data["imported_count"] == 3
         assert Transaction.objects.filter(user=user).count() == 3
 
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_csv_import_streams_temporary_upload(self, auth_client, user):
+        """Test CSV import reads uploads spooled to disk, including non-ASCII."""
+        csv_content = (
+            "date,amount,description,transaction_type\n"
+            f"{date.today().isoformat()},4.20,Café au lait,income\n"
+            f"{date.today().isoformat()},8.40,Crème brûlée,income\n"
+        )
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        csv_file = SimpleUploadedFile(
+            "transactions.csv", csv_content.encode("utf-8"), content_type="text/csv"
+        )
+
+        url = reverse("api:transaction-import-csv")
+        response = auth_client.post(url, {"file": csv_file}, format="multipart")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["imported_count"] == 2
+        assert Transaction.objects.filter(
+            user=user, description="Crème brûlée"
+        ).exists()
+
     def test_csv_import_with_validation_errors(self, auth_client, user, category):
         """Test CSV import with validation errors."""
         csv_content = (
@@ -629,6 +973,38 @@ class TestTransactionBulkOperations:
         assert len(response.data["errors"]) == 3
         assert Transaction.objects.filter(user=user).count() == 0
 
+    def test_csv_import_resolves_category_names_once(self, auth_client, user):
+        """Test CSV import looks category names up once and flags ambiguous ones."""
+        food = CategoryFactory(user=user, name="Food")
+        groceries = CategoryFactory(user=user, name="Groceries")
+        CategoryFactory(user=user, name="Groceries", parent=food)
+        csv_content = (
+            "date,amount,description,transaction_type,category_name\n"
+            f"{date.today().isoformat()},25.50,Lunch,expense,Food\n"
+            f"{date.today().isoformat()},12.75,Dinner,expense,Food\n"
+            f"{date.today().isoformat()},40.00,Market,expense,Groceries\n"
+        )
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        csv_file = SimpleUploadedFile(
+            "transactions.csv", csv_content.encode("utf-8"), content_type="text/csv"
+        )
+
+        url = reverse("api:transaction-import-csv")
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.post(url, {"file": csv_file}, format="multipart")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert response.data["imported_count"] == 2
+        assert response.data["errors"][0]["row"] == 4
+        assert "ambiguous" in response.data["errors"][0]["error"]
+        assert not Transaction.objects.filter(category=groceries).exists()
+        assert not any(
+            '"expenses_category"."name" =' in query["sql"]
+            for query in queries.captured_queries
+        )
+
     def test_csv_import_partial_success(self, auth_client, user, category):
         """Test CSV import with partial success (some valid, some invalid)."""
         csv_content = (
@@ -704,6 +1080,80 @@ class TestTransactionBulkOperations:
         assert transaction2.merchant == "Updated merchant"
         assert transaction3.notes == "Updated notes"
 
+    def test_bulk_update_loads_transactions_in_one_query(
+        self, auth_client, user, category
+    ):
+        """Test bulk update reads and writes all targets in one query each."""
+        transactions = TransactionFactory.create_batch(3, user=user, category=category)
+        missing_id = max(t.id for t in transactions) + 1000
+
+        url = reverse("api:transaction-bulk-update")
+        data = {
+            "updates": [
+                {"id": transaction.id, "notes": "Updated notes"}
+                for transaction in transactions
+            ]
+            + [{"id": missing_id, "notes": "Nope"}]
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated_count"] == 3
+        assert response.data["errors"] == [
+            {"transaction_id": missing_id, "error": "Transaction not found"}
+        ]
+        transaction_selects = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "expenses_transaction"')
+        ]
+        assert len(transaction_selects) == 1
+        transaction_updates = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "expenses_transaction"')
+        ]
+        assert len(transaction_updates) == 1
+        assert all(
+            transaction.notes == "Updated notes"
+            for transaction in Transaction.objects.filter(user=user)
+        )
+
+    def test_bulk_update_resolves_categories_in_one_query(
+        self, auth_client, user, category, another_category
+    ):
+        """Test bulk update looks up every referenced category together."""
+        transactions = TransactionFactory.create_batch(6, user=user, category=category)
+
+        url = reverse("api:transaction-bulk-update")
+        data = {
+            "updates": [
+                {
+                    "id": transaction.id,
+                    "category_id": (category, another_category)[index % 2].id,
+                }
+                for index, transaction in enumerate(transactions)
+            ]
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated_count"] == 6
+        category_selects = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "expenses_category"')
+        ]
+        assert len(category_selects) == 1
+        assert (
+            Transaction.objects.filter(user=user, category=another_category).count()
+            == 3
+        )
+
     def test_bulk_delete_transactions(self, auth_client, user, category):
         """Test bulk delete (soft delete) of transactions."""
         # Create transactions to delete
@@ -731,6 +1181,46 @@ class TestTransactionBulkOperations:
         assert not transaction3.is_active
         assert keep_transaction.is_active
 
+    @patch("apps.expenses.views.BULK_DELETE_BATCH_SIZE", 2)
+    def test_bulk_delete_batches_large_id_lists(self, auth_client, user, category):
+        """Test bulk delete splits long ID lists across several UPDATEs."""
+        transactions = TransactionFactory.create_batch(5, user=user, category=category)
+
+        url = reverse("api:transaction-bulk-delete")
+        data = {"transaction_ids": [t.id for t in transactions]}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.delete(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["deleted_count"] == 5
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 3
+        assert not Transaction.objects.filter(user=user, is_active=True).exists()
+
+    def test_bulk_delete_cleans_up_receipts_in_one_pass(
+        self, auth_client, user, category, django_capture_on_commit_callbacks
+    ):
+        """Test bulk delete removes the deleted transactions' receipts together."""
+        with_receipt = TransactionFactory(user=user, category=category)
+        Transaction.objects.filter(id=with_receipt.id).update(
+            receipt=f"receipts/{user.id}/receipt.jpg"
+        )
+        without_receipt = TransactionFactory(user=user, category=category)
+
+        url = reverse("api:transaction-bulk-delete")
+        data = {"transaction_ids": [with_receipt.id, without_receipt.id]}
+
+        with patch(
+            "apps.expenses.views.cleanup_transaction_receipts"
+        ) as mock_cleanup, django_capture_on_commit_callbacks(execute=True):
+            response = auth_client.delete(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_cleanup.assert_called_once()
+        (cleaned,) = mock_cleanup.call_args[0]
+        assert [t.id for t in cleaned] == [with_receipt.id]
+
     def test_bulk_operations_user_isolation(self, auth_client, user):
         """Test that bulk operations only affect user's own transactions."""
         other_user = UserFactory()
@@ -776,11 +1266,20 @@ class TestTransactionBulkOperations:
         )
 
         url = reverse("api:transaction-import-csv")
-        response = auth_client.post(url, {"file": csv_file}, format="multipart")
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.post(url, {"file": csv_file}, format="multipart")
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["imported_count"] == 100
         assert Transaction.objects.filter(user=user).count() == 100
+        # Rows are validated one by one but inserted in bulk; SQLite caps the
+        # parameters per statement, so 100 rows still take a few INSERTs
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "expenses_transaction"')
+        ]
+        assert len(inserts) <= 3
 
     def test_large_dataset_bulk_update(self, auth_client, user, category):
         """Test bulk update with large dataset."""
@@ -898,3 +1397,169 @@ class TestTransactionBulkOperations:
         ]
         assert response.data["imported_count"] >= 2  # At least 2 should succeed
         assert Transaction.objects.filter(user=user).count() >= 2
+
+    def test_excel_import_streams_workbook(self, auth_client, user, category):
+        """Test Excel import streams the workbook in read-only mode."""
+        from io import BytesIO
+
+        import openpyxl
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["date", "amount", "description", "transaction_type"])
+        ws.append([date.today().strftime("%Y-%m-%d"), 40.00, "Salary", "income"])
+        excel_bytes = BytesIO()
+        wb.save(excel_bytes)
+
+        excel_file = SimpleUploadedFile("transactions.xlsx", excel_bytes.getvalue())
+
+        url = reverse("api:transaction-import-excel")
+        with patch(
+            "openpyxl.load_workbook", wraps=openpyxl.load_workbook
+        ) as mock_load_workbook:
+            response = auth_client.post(url, {"file": excel_file}, format="multipart")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["imported_count"] == 1
+        assert mock_load_workbook.call_args[1]["read_only"] is True
+
+    @pytest.fixture
+    def import_owner_cache(self):
+        """Use a real cache so queued import owners are remembered."""
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "import-owner-test",
+                }
+            }
+        ):
+            cache.clear()
+            yield cache
+
+    @patch("apps.expenses.views.IMPORT_ASYNC_THRESHOLD", 0)
+    def test_large_csv_import_is_queued(
+        self, auth_client, user, category, import_owner_cache, tmp_path
+    ):
+        """Test files over the async threshold are stored for a Celery task."""
+        csv_content = (
+            "date,amount,description,transaction_type,category_name\n"
+            f"{date.today().isoformat()},25.50,Coffee,expense,Food\n"
+            f"{date.today().isoformat()},abc,Broken,expense,Food\n"
+        )
+
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        csv_file = SimpleUploadedFile(
+            "transactions.csv", csv_content.encode("utf-8"), content_type="text/csv"
+        )
+
+        url = reverse("api:transaction-import-csv")
+        with override_settings(MEDIA_ROOT=tmp_path), patch(
+            "apps.expenses.views.import_transactions.apply_async",
+            wraps=import_transactions.apply_async,
+        ) as mock_apply_async, patch(
+            "apps.expenses.views.read_import_rows"
+        ) as mock_read_rows:
+            response = auth_client.post(url, {"file": csv_file}, format="multipart")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        task_id = response.data["task_id"]
+        assert response.data["status_url"] == reverse(
+            "api:transaction-import-status", args=[task_id]
+        )
+        assert import_owner_cache.get(f"import_owner:{task_id}") == user.id
+
+        # Only the stored file's path is queued; the request parses nothing
+        mock_read_rows.assert_not_called()
+        user_id, file_path = mock_apply_async.call_args[1]["args"]
+        assert user_id == user.id
+        assert file_path.startswith(f"imports/{user.id}/")
+        assert file_path.endswith(".csv")
+
+        # Tasks run eagerly under test settings
+        assert Transaction.objects.filter(user=user).count() == 1
+        assert not (tmp_path / file_path).exists()
+
+    def test_import_task_reports_rows(self, user, category, tmp_path):
+        """Test the import task streams the stored file and deletes it."""
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+
+        csv_content = (
+            "date,amount,description,category_name\n"
+            f"{date.today().isoformat()},12.00,Lunch,Food\n"
+            "not-a-date,1.00,Bad,\n"
+        )
+
+        with override_settings(MEDIA_ROOT=tmp_path):
+            file_path = default_storage.save(
+                f"imports/{user.id}/upload.csv", ContentFile(csv_content.encode())
+            )
+            result = import_transactions.apply(args=[user.id, file_path]).get()
+
+            assert not default_storage.exists(file_path)
+
+        assert result["user_id"] == user.id
+        assert result["imported_count"] == 1
+        assert result["error_count"] == 1
+        # Row data is not copied into the result backend
+        assert result["errors"] == [{"row": 3, "error": result["errors"][0]["error"]}]
+
+    def test_import_status_reports_progress(
+        self, auth_client, user, import_owner_cache
+    ):
+        """Test polling a queued import returns its progress."""
+        import_owner_cache.set("import_owner:task-1", user.id)
+        url = reverse("api:transaction-import-status", args=["task-1"])
+        with patch("apps.expenses.views.AsyncResult") as mock_result:
+            mock_result.return_value.state = "PROGRESS"
+            mock_result.return_value.info = {"user_id": user.id, "processed": 1000}
+            response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "task_id": "task-1",
+            "state": "PROGRESS",
+            "processed": 1000,
+        }
+
+    def test_import_status_reports_failure(self, auth_client, user, import_owner_cache):
+        """Test a failed import is reported to its owner, not hidden."""
+        import_owner_cache.set("import_owner:task-1", user.id)
+        url = reverse("api:transaction-import-status", args=["task-1"])
+        with patch("apps.expenses.views.AsyncResult") as mock_result:
+            mock_result.return_value.state = "FAILURE"
+            mock_result.return_value.info = MemoryError()
+            response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "task_id": "task-1",
+            "state": "FAILURE",
+            "error": "Import failed",
+        }
+
+    def test_import_status_hides_other_users_imports(
+        self, auth_client, user, import_owner_cache
+    ):
+        """Test an import's outcome is only reported to the importing user."""
+        other_user = UserFactory()
+        import_owner_cache.set("import_owner:task-1", other_user.id)
+        url = reverse("api:transaction-import-status", args=["task-1"])
+        with patch("apps.expenses.views.AsyncResult") as mock_result:
+            mock_result.return_value.state = "SUCCESS"
+            mock_result.return_value.info = {
+                "user_id": other_user.id,
+                "imported_count": 3,
+                "errors": [],
+            }
+            response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        # Unknown task IDs are not reported either
+        url = reverse("api:transaction-import-status", args=["task-2"])
+        assert auth_client.get(url).status_code == status.HTTP_404_NOT_FOUND
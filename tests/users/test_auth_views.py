@@ -3,6 +3,8 @@ Tests for user authentication views.
 """
 
 import base64
+import json
+from unittest.mock import patch
 
 import pytest
 
@@ -76,6 +78,26 @@ class TestUserRegistrationView:
         assert "verify" in email.subject.lower()
         assert "verify" in email.body.lower()
 
+    @pytest.mark.django_db
+    def test_registration_queues_verification_email(self, client):
+        """Test that registration hands the email to a Celery task."""
+        registration_data = {
+            "email": "test@example.com",
+            "password1": "SecurePass123!",
+            "password2": "SecurePass123!",
+            "first_name": "John",
+            "last_name": "Doe",
+        }
+
+        with patch("apps.users.views.deliver_verification_email") as mock_task:
+            client.post(reverse("users:register"), registration_data)
+
+        user = User.objects.get(email="test@example.com")
+        user_id, verification_url = mock_task.delay.call_args[0]
+        assert user_id == user.pk
+        assert verification_url.startswith("http://testserver/auth/verify-email/")
+        assert len(mail.outbox) == 0
+
     @pytest.mark.django_db
     def test_registration_with_duplicate_email_fails(self, client):
         """Test that registration with duplicate email fails."""
@@ -1264,3 +1286,27 @@ class TestTwoFactorBackupCodesView:
         for code in backup_codes:
             assert len(code) == 8
             assert code.isalnum()
+
+    @pytest.mark.django_db
+    def test_2fa_backup_codes_are_unique_and_stored(self, client):
+        """Test that each backup code is distinct and saved for the user."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="password123",
+            is_active=True,
+        )
+        user.totp_secret = "JBSWY3DPEHPK3PXP"
+        user.is_2fa_enabled = True
+        user.save()
+        client.force_login(user)
+
+        response = client.get(reverse("users:2fa_backup_codes"))
+
+        backup_codes = response.context["backup_codes"]
+        assert len(set(backup_codes)) == 10
+        assert all(code == code.upper() for code in backup_codes)
+
+        user.refresh_from_db()
+        assert len(json.loads(user.backup_codes)) == 10
+        assert all(user.use_backup_code(code) for code in backup_codes)
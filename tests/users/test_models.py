@@ -260,6 +260,36 @@ class TestUserModel:
         assert user2.phone == "5552222222"
         assert user1.phone != user2.phone
 
+    @pytest.mark.django_db
+    def test_backup_codes_stored_as_digests(self):
+        """Test that backup codes are stored hashed, not in plain text."""
+        from apps.users.models import User
+
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        user.set_backup_codes(["ABCD1234", "EFGH5678"])
+
+        user.refresh_from_db()
+        assert "ABCD1234" not in user.backup_codes
+        assert "EFGH5678" not in user.backup_codes
+
+    @pytest.mark.django_db
+    def test_use_backup_code_is_single_use(self):
+        """Test that a redeemed backup code cannot be used again."""
+        from apps.users.models import User
+
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        user.set_backup_codes(["ABCD1234", "EFGH5678"])
+
+        assert user.use_backup_code(" abcd1234 ") is True
+        user.refresh_from_db()
+        assert user.use_backup_code("ABCD1234") is False
+        assert user.use_backup_code("EFGH5678") is True
+        assert user.use_backup_code("00000000") is False
+
 
 # Keep existing test case for compatibility
 User = get_user_model()